@@ -0,0 +1,41 @@
+#!/bin/bash
+# Compare the wall-clock time of a test case between two revisions.
+#
+# Usage: ./run_bench.sh [BASE_REV [TESTCASE]]
+#   BASE_REV  revision to compare the working tree against (default: HEAD~1)
+#   TESTCASE  test case to time (default: test_full_ref_enc)
+
+BASE_REV=${1:-HEAD~1}
+TESTCASE=${2:-test_full_ref_enc}
+
+SIM_DIR=$(cd "$(dirname "$0")" && pwd)
+ROOT_DIR=$(cd "$SIM_DIR/.." && pwd)
+BASE_DIR=$(mktemp -d)
+
+trap 'git -C "$ROOT_DIR" worktree remove --force "$BASE_DIR"' EXIT
+
+git -C "$ROOT_DIR" worktree add --detach "$BASE_DIR" "$BASE_REV" > /dev/null || exit 1
+
+run() {
+    local sim_dir=$1
+    local start end
+    make -C "$sim_dir" clean > /dev/null
+    start=$(date +%s.%N)
+    TESTCASE=$TESTCASE make -C "$sim_dir" > "$sim_dir/bench.log" 2>&1
+    local status=$?
+    end=$(date +%s.%N)
+    if [ $status -ne 0 ]; then
+        echo "Error: $TESTCASE failed in $sim_dir, see $sim_dir/bench.log"
+        exit 1
+    fi
+    echo "$end - $start" | bc
+}
+
+echo "Running $TESTCASE at $BASE_REV..."
+base_time=$(run "$BASE_DIR/sim") || { echo "$base_time"; exit 1; }
+echo "Running $TESTCASE on the working tree..."
+new_time=$(run "$SIM_DIR") || { echo "$new_time"; exit 1; }
+
+echo "$BASE_REV: ${base_time}s"
+echo "working tree: ${new_time}s"
+echo "speedup: $(echo "scale=2; $base_time / $new_time" | bc)x"
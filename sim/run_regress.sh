@@ -0,0 +1,3 @@
+#!/bin/bash
+# Sharded regression, e.g. ./run_regress.sh --shards 8 --testcase test_full_ref_enc
+cd "$(dirname "$0")" && python ../verification/tools/regress.py "$@"
@@ -0,0 +1,81 @@
+// Testbench-only round signature.
+//
+// Folds the add, sub and diff states of the permutation into a running 64-bit
+// signature, restarted at the first round of each operation. The signature is
+// valid for one cycle after the last round of each permutation (round 15), so
+// the testbench only reads one word per permutation instead of three 320-bit
+// states per round. The same signature is computed by AsconModel.
+
+module ascon_round_signature
+  import ascon_pack::*;
+(
+  input logic                   clk,
+  input logic                   rst_n,
+  input logic                   en_i,
+  input ascon_op_e              op_i,
+  input logic [ROUND_WIDTH-1:0] round_i,
+  input logic [STATE_WIDTH-1:0] state_add_i,
+  input logic [STATE_WIDTH-1:0] state_sub_i,
+  input logic [STATE_WIDTH-1:0] state_diff_i,
+
+  output logic [63:0] sig_o,
+  output logic        sig_valid_o
+);
+
+  localparam logic [ROUND_WIDTH-1:0] LastRound = ROUND_WIDTH'(MAX_ROUND_NO - 1);
+
+  function automatic logic [63:0] rotl(input logic [63:0] x, input int unsigned n);
+    return (x << n) | (x >> (64 - n));
+  endfunction
+
+  function automatic logic [63:0] fold(input logic [STATE_WIDTH-1:0] state);
+    logic [63:0] f;
+    f = '0;
+    for (int i = 0; i < STATE_WIDTH / 64; i++) begin
+      f ^= rotl(state[64*i+:64], 13 * i);
+    end
+    return f;
+  endfunction
+
+  logic        round_s;
+  logic [63:0] sig_s, sig_q;
+  logic        sig_valid_q;
+
+  // every enabled cycle computes a round, and so does the tag output cycle
+  assign round_s = en_i || (op_i == AsconOp8);
+
+  assign sig_s = ((op_i == AsconOp1) ? 64'(0) : rotl(sig_q, 1))
+               ^ fold(state_add_i)
+               ^ rotl(fold(state_sub_i), 21)
+               ^ rotl(fold(state_diff_i), 42)
+               ^ 64'(round_i);
+
+  always_ff @(posedge clk or negedge rst_n) begin
+    if (!rst_n) begin
+      sig_q <= '0;
+      sig_valid_q <= 1'b0;
+    end else begin
+      sig_valid_q <= round_s && (round_i == LastRound);
+      if (round_s) begin
+        sig_q <= sig_s;
+      end
+    end
+  end
+
+  assign sig_o = sig_q;
+  assign sig_valid_o = sig_valid_q;
+
+endmodule
+
+bind ascon_round_unit ascon_round_signature u_ascon_round_signature (
+  .clk         (clk),
+  .rst_n       (rst_n),
+  .en_i        (en_i),
+  .op_i        (op_i),
+  .round_i     (round_i),
+  .state_add_i (u_ascon_round_function.u_ascon_permutation.state_add_s),
+  .state_sub_i (u_ascon_round_function.u_ascon_permutation.state_sub_s),
+  .state_diff_i(u_ascon_round_function.u_ascon_permutation.state_diff_s),
+  .sig_o       (),
+  .sig_valid_o ()
+);
@@ -0,0 +1,56 @@
+// Testbench-only harness generating the clock of ascon_apb_wrapper.
+//
+// Selected with HDL_CLOCK=1 in place of the cocotb Clock, which schedules two
+// value changes per cycle from Python. The harness has the ports and
+// parameters of the wrapper, apart from the clock which becomes an output, so
+// the testbench drives the APB and the reset and only observes the clock
+// edges. The clock starts low and toggles every CLK_PERIOD_PS / 2 from time 0.
+// Verilator needs --timing for the delay.
+
+`timescale 1ns / 1ps
+
+module ascon_tb_harness #(
+  parameter int unsigned APB_AW = 10,
+  parameter int unsigned APB_DW = 32,
+  parameter int unsigned CLK_PERIOD_PS = 10000
+) (
+  input  logic [APB_AW-1:0] PADDR,
+  input  logic              PENABLE,
+  input  logic              PSEL,
+  input  logic [APB_DW-1:0] PWDATA,
+  input  logic              PWRITE,
+  output logic [APB_DW-1:0] PRDATA,
+  output logic              PREADY,
+  output logic              PSLVERR,
+
+  output logic clk,
+  input  logic rst_n,
+
+  output logic sync_o
+);
+
+  localparam realtime HalfPeriod = CLK_PERIOD_PS * 1ps / 2;
+
+  initial begin
+    clk = 1'b0;
+    forever #(HalfPeriod) clk = ~clk;
+  end
+
+  ascon_apb_wrapper #(
+    .APB_AW(APB_AW),
+    .APB_DW(APB_DW)
+  ) u_ascon_apb_wrapper (
+    .PADDR  (PADDR),
+    .PENABLE(PENABLE),
+    .PSEL   (PSEL),
+    .PWDATA (PWDATA),
+    .PWRITE (PWRITE),
+    .PRDATA (PRDATA),
+    .PREADY (PREADY),
+    .PSLVERR(PSLVERR),
+    .clk    (clk),
+    .rst_n  (rst_n),
+    .sync_o (sync_o)
+  );
+
+endmodule
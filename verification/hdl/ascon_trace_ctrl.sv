@@ -0,0 +1,34 @@
+// Testbench-only waveform dump control.
+//
+// Built with TRACE=1. The dump of the whole design is opened at time 0 and
+// turned off at once; AsconTraceController then writes trace_on to dump the
+// windows of the selected ops, and the replay of the first failing op. The
+// dump file is given by the +trace_file plusarg, an FST file with Verilator
+// built with --trace-fst, a VCD file with the other simulators.
+
+module ascon_trace_ctrl;
+
+  // Written by AsconTraceController
+  logic  trace_on = 1'b0;
+  string trace_file;
+
+  initial begin
+    if (!$value$plusargs("trace_file=%s", trace_file)) begin
+      trace_file = "trace.fst";
+    end
+    $dumpfile(trace_file);
+    $dumpvars;
+    $dumpoff;
+  end
+
+  always @(trace_on) begin
+    if (trace_on) begin
+      $dumpon;
+    end else begin
+      $dumpoff;
+    end
+  end
+
+endmodule
+
+bind ascon_apb_wrapper ascon_trace_ctrl u_ascon_trace_ctrl ();
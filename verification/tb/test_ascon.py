@@ -2,10 +2,12 @@ import cocotb
 from pyuvm import uvm_root
 
 from .tests import (
+    AsconCoverageClosureTest,
     AsconFullRefEncTest,
     AsconRandomSampleEncTest,
     AsconSingleEncTest,
     AsconSingleRefEncTest,
+    AsconStimulusTest,
 )
 
 
@@ -14,7 +16,7 @@ async def test_random_enc(dut):
     await uvm_root().run_test(AsconRandomSampleEncTest)
 
 
-@cocotb.test(timeout_time=1000, timeout_unit="ns")
+@cocotb.test(timeout_time=100_000, timeout_unit="ns")
 async def test_single_enc(dut):
     await uvm_root().run_test(AsconSingleEncTest)
 
@@ -27,3 +29,13 @@ async def test_full_ref_enc(dut):
 @cocotb.test(timeout_time=1000, timeout_unit="ns")
 async def test_single_ref_enc(dut):
     await uvm_root().run_test(AsconSingleRefEncTest)
+
+
+@cocotb.test(timeout_time=10_000_000, timeout_unit="ns")
+async def test_coverage_closure(dut):
+    await uvm_root().run_test(AsconCoverageClosureTest)
+
+
+@cocotb.test(timeout_time=100_000_000, timeout_unit="ns")
+async def test_stimulus(dut):
+    await uvm_root().run_test(AsconStimulusTest)
@@ -1,3 +1,4 @@
-from .ascon_random_test import AsconRandomSampleEncTest
+from .ascon_random_test import AsconCoverageClosureTest, AsconRandomSampleEncTest
 from .ascon_ref_test import AsconFullRefEncTest, AsconSingleRefEncTest
 from .ascon_single_test import AsconSingleEncTest
+from .ascon_stimulus_test import AsconStimulusTest
@@ -1,30 +1,88 @@
 import logging
 import os
 import re
+import time
 from datetime import datetime
+from functools import partial
+from typing import List, Optional
 
 import cocotb
-import vsc
 from cocotb.clock import Clock
 from cocotb.triggers import ClockCycles
-from pyuvm import ConfigDB, uvm_active_passive_enum, uvm_sequencer, uvm_test
+from cocotb.utils import get_sim_time
+from pyuvm import (
+    ConfigDB,
+    uvm_active_passive_enum,
+    uvm_sequence_item,
+    uvm_sequencer,
+    uvm_test,
+)
+from tb.utils import AsyncLogHandler, Profiler
+from tools.covdb import CoverageDB
+from tools.perfdb import DEFAULT_PATH, PerfDB, PerfRun, git_revision
 from uvc.apb.agents.apb_common import DriverType
+from uvc.apb.agents.apb_parameterization import apb_change_width
 from uvc.apb.agents.cl_apb_interface import cl_apb_interface, signal_placeholder
 from uvc.apb.env import APBEnv, APBEnvConfig
+from uvc.apb_bridge.agents.status_if import AsconStatusInterface, AsconStatusWait
 from uvc.apb_bridge.env import APBBridgeEnv, APBBridgeEnvConfig
+from uvc.apb_bridge.regs import AsconRegBlock, AsconRegPath
 from uvc.ascon.agents.core import AsconCoreInterface
-from uvc.ascon.env import AsconEnv, AsconEnvConfig
+from uvc.ascon.agents.core.core_seq_item import AsconCoreOpItem
+from uvc.ascon.agents.round import (
+    ASCON_ROUND_PHASES,
+    AsconCtrlInterface,
+    AsconCtrlPhase,
+    AsconPermutationInterface,
+    AsconRoundSignatureInterface,
+    AsconRoundUnitInterface,
+)
+from uvc.ascon.env import AsconEnv, AsconEnvConfig, AsconRoundCheck
+from uvc.ascon.sequences import AsconRandEncSeq, AsconReplaySeq
+from uvc.ascon.utils.ascon_txdb import AsconTxDB
+from uvc.utils import PreRandomizer
+
+# Fields of cl_apb_seq_item not constrained by AsconAPBOpSeq
+APB_ITEM_RAND_FIELDS = (
+    "no_wait_len",
+    "wait_len",
+    "strb",
+    "slverr",
+    "norm_acc",
+    "sec_acc",
+    "data_acc",
+)
 
 
 class AsconBaseTest(uvm_test):
     def __init__(self, name, parent):
         super().__init__(name, parent)
         self.dut = None
+        # ascon_apb_wrapper, the toplevel or its instance in the HDL harness
+        self.wrapper = None
         self.ascon_env: AsconEnv = None
         self.apb_env: APBEnv = None
         self.apb_bridge_env: APBBridgeEnv = None
         self.clk_gen_100MHz: Clock = None
         self.sequencer: uvm_sequencer = None
+        self.reg_model: AsconRegBlock = None
+        self.log_handler: logging.Handler = None
+        # Share of the op space run by this process, see tools/regress.py
+        self.shard_index = int(os.getenv("SHARD_INDEX", "0"))
+        self.shard_count = int(os.getenv("SHARD_COUNT", "1"))
+        # Worker processes solving the random fields ahead, 0 to solve inline
+        self.prerand_workers = int(os.getenv("PRERANDOMIZE", "0"))
+        # Clock generated by verification/hdl/ascon_tb_harness.sv
+        self.hdl_clock = os.getenv("HDL_CLOCK", "0") == "1"
+        self.prerandomizers: List[PreRandomizer] = []
+        self.prerand_seq: Optional[PreRandomizer] = None
+        self.prerand_op: Optional[PreRandomizer] = None
+        # Collapsed-stack file of the profile, None to not profile
+        self.profile_path: Optional[str] = None
+        self.profiler: Optional[Profiler] = None
+        # Performance history database, None to not record the run
+        self.perfdb_path: Optional[str] = None
+        self.wall_start = 0.0
 
     def end_of_elaboration_phase(self):
         # set log level
@@ -37,12 +95,36 @@ class AsconBaseTest(uvm_test):
         current_date = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         filename = f"{current_date}_{filename_stem}.log"
         filename = os.getenv("LOGFILE", filename)
-        file_handler = logging.FileHandler(filename, mode="w")
-        self.add_logging_handler_hier(file_handler)
+        if os.getenv("LOG_ASYNC", "0") == "1":
+            # Records formatted and written by a thread, the console only
+            # shows the warnings and errors
+            if os.getenv("LOG_COMPRESS", "0") == "1":
+                filename += ".gz"
+            max_queue_size = int(os.getenv("LOG_QUEUE_SIZE", "100000"))
+            self.log_handler = AsyncLogHandler(
+                filename, max_queue_size, eager_types=(uvm_sequence_item,)
+            )
+            self.set_console_level_hier(self, logging.WARNING)
+        else:
+            self.log_handler = logging.FileHandler(filename, mode="w")
+        self.add_logging_handler_hier(self.log_handler)
+
+    @classmethod
+    def set_console_level_hier(cls, component, level):
+        if component._streaming_handler is not None:
+            component._streaming_handler.setLevel(level)
+        for child in component.children:
+            cls.set_console_level_hier(child, level)
 
     def build_phase(self):
         self.dut = cocotb.top
-        self.clk_gen_100MHz = Clock(self.dut.clk, 10, "ns")
+        self.wrapper = getattr(self.dut, "u_ascon_apb_wrapper", self.dut)
+        if self.hdl_clock:
+            assert self.wrapper is not self.dut, (
+                "FAILED: HDL_CLOCK=1 requires the ascon_tb_harness toplevel."
+            )
+        else:
+            self.clk_gen_100MHz = Clock(self.dut.clk, 10, "ns")
 
         # Configure bridge
         env_cfg_cls = APBBridgeEnvConfig
@@ -62,8 +144,28 @@ class AsconBaseTest(uvm_test):
         cfg.core_cfg.is_active = uvm_active_passive_enum.UVM_PASSIVE
         cfg.core_cfg.byteorder = "little"
         cfg.core_cfg.rate = 16
-        cfg.check_rounds = False
-        cfg.core_cfg.vif = AsconCoreInterface.from_dut(self.dut.u_ascon_core)
+        cfg.check_rounds = AsconRoundCheck[os.getenv("CHECK_ROUNDS", "none").upper()]
+        cfg.replay_failures = os.getenv("REPLAY_FAILURES", "0") == "1"
+        cfg.core_cfg.vif = AsconCoreInterface.from_dut(self.wrapper.u_ascon_core)
+        cfg.enable_coverage = os.getenv("ASCON_COVERAGE", "1") == "1"
+        txdb_path = os.getenv("TXDB", f"sim_build/{self.get_type_name()}.txdb")
+        cfg.txdb_path = None if txdb_path == "0" else txdb_path
+        perf_path = os.getenv("PERF", "0")
+        if perf_path == "1":
+            perf_path = f"sim_build/{self.get_type_name()}.perf"
+        cfg.perf_path = None if perf_path == "0" else perf_path
+        cfg.check_latency = os.getenv("CHECK_LATENCY", "0") == "1"
+        perfdb_path = os.getenv("PERFDB", str(DEFAULT_PATH))
+        self.perfdb_path = None if perfdb_path == "0" else perfdb_path
+        cfg.record_perf = self.perfdb_path is not None
+        if os.getenv("TRACE", "0") == "1":
+            self.configure_trace(cfg)
+        if cfg.check_rounds != AsconRoundCheck.NONE or cfg.replay_failures:
+            self.configure_rounds(cfg)
+        elif cfg.enable_coverage:
+            self.configure_phases(cfg)
+        # Let the scoreboard record the failures instead of the bridge sequence
+        bridge_cfg.apb_bridge_cfg.check_result = not cfg.replay_failures
 
         name = "ascon_env"
         ConfigDB().set(self, name, "cfg", cfg)
@@ -101,37 +203,213 @@ class AsconBaseTest(uvm_test):
         )
         cfg.apb_cfg.vif = apb_if
         bridge_cfg.apb_bridge_cfg.apb_cfg = cfg.apb_cfg
+        bridge_cfg.apb_bridge_cfg.reg_model = AsconRegBlock(
+            data_width=cfg.apb_cfg.DATA_WIDTH,
+            byteorder=bridge_cfg.apb_bridge_cfg.core_cfg.byteorder,
+        )
+        self.reg_model = bridge_cfg.apb_bridge_cfg.reg_model
+        self.reg_model.set_backdoor(self.wrapper)
+        reg_access = os.getenv("REG_ACCESS", "frontdoor").upper()
+        self.reg_model.set_path(AsconRegPath[reg_access])
+        status_wait = os.getenv("STATUS_WAIT", "poll").upper()
+        bridge_cfg.apb_bridge_cfg.status_wait = AsconStatusWait[status_wait]
+        bridge_cfg.apb_bridge_cfg.status_vif = AsconStatusInterface.from_dut(
+            self.wrapper
+        )
 
         name = "apb_env"
         ConfigDB().set(self, name, "cfg", cfg)
         self.apb_env = APBEnv.create(name, self)
 
+        self.prerand_seq = self.make_prerandomizer(
+            "rand_enc_seq", AsconRandEncSeq, ("di",)
+        )
+        self.prerand_op = self.make_prerandomizer(
+            "op_item", AsconCoreOpItem, ("delay", "key", "nonce")
+        )
+        bridge_cfg.apb_bridge_cfg.prerand = self.make_prerandomizer(
+            "apb_item",
+            partial(apb_change_width, cfg.apb_cfg.ADDR_WIDTH, cfg.apb_cfg.DATA_WIDTH),
+            APB_ITEM_RAND_FIELDS,
+        )
+
+    def make_prerandomizer(self, name, item_spec, fields) -> Optional[PreRandomizer]:
+        """Pre-randomizer seeded by the cocotb seed, None if PRERANDOMIZE=0."""
+        if self.prerand_workers == 0:
+            return None
+        prerand = PreRandomizer(
+            name, item_spec, fields, cocotb.RANDOM_SEED, self.prerand_workers
+        )
+        self.prerandomizers.append(prerand)
+        return prerand
+
+    def in_shard(self, index: int) -> bool:
+        return index % self.shard_count == self.shard_index
+
+    def configure_phases(self, cfg: AsconEnvConfig):
+        core = self.wrapper.u_ascon_core
+        round_cfg = cfg.round_cfg
+        round_cfg.vif_ctrl = AsconCtrlInterface.from_dut(core.u_ascon_ctrl)
+        round_cfg.set_phase_names(*AsconCtrlPhase.__members__)
+        round_cfg.set_active_phases(*ASCON_ROUND_PHASES)
+
+    def configure_rounds(self, cfg: AsconEnvConfig):
+        self.configure_phases(cfg)
+        core = self.wrapper.u_ascon_core
+        round_unit = core.u_ascon_round_unit
+        round_cfg = cfg.round_cfg
+        round_cfg.vif_round_unit = AsconRoundUnitInterface.from_dut(round_unit)
+        if cfg.check_rounds == AsconRoundCheck.SIGNATURE:
+            round_cfg.vif_signature = AsconRoundSignatureInterface.from_dut(
+                round_unit.u_ascon_round_signature
+            )
+        if cfg.check_rounds != AsconRoundCheck.SIGNATURE or cfg.replay_failures:
+            round_cfg.vif_permutation = AsconPermutationInterface.from_dut(
+                round_unit.u_ascon_round_function.u_ascon_permutation
+            )
+
+    def configure_trace(self, cfg: AsconEnvConfig):
+        """Dump the selected ops, and the replay of the first failing op."""
+        cfg.trace_ctrl = self.wrapper.u_ascon_trace_ctrl
+        cfg.trace_window = int(os.getenv("TRACE_WINDOW", "100"))
+        cfg.trace_ops = {int(s) for s in os.getenv("TRACE_OPS", "").split(",") if s}
+        trace_ids = [s for s in os.getenv("TRACE_IDS", "").split(",") if s]
+        if trace_ids:
+            # Database of a previous run: `make clean` deletes sim_build
+            trace_txdb = os.getenv("TRACE_TXDB")
+            assert trace_txdb, "FAILED: TRACE_IDS requires TRACE_TXDB."
+            assert os.path.isfile(trace_txdb), f"FAILED: {trace_txdb} not found."
+            with AsconTxDB(trace_txdb, readonly=True) as db:
+                for tx_id in trace_ids:
+                    try:
+                        op_index = db.find_op_index(int(tx_id, 0))
+                    except ValueError as e:
+                        raise AssertionError(f"FAILED: {e} in {trace_txdb}.")
+                    assert op_index is not None, (
+                        f"FAILED: no item with id={tx_id} in {trace_txdb}."
+                    )
+                    cfg.trace_ops.add(op_index)
+        if cfg.check_rounds != AsconRoundCheck.FULL:
+            cfg.replay_failures = True
+
     def connect_phase(self):
         self.apb_bridge_env.apb_bridge_agent.driver.apb_seqr = (
             self.apb_env.apb_agent.sequencer
         )
         self.sequencer = self.apb_bridge_env.apb_bridge_agent.sequencer
+        if self.ascon_env.perf_monitor is not None:
+            self.apb_env.apb_agent.ap.connect(
+                self.ascon_env.perf_monitor.analysis_export
+            )
 
     def start_clock(self):
+        if self.hdl_clock:
+            self.logger.info("[..] Clock generated by the HDL harness.")
+            return
         cocotb.start_soon(self.clk_gen_100MHz.start())
 
+    async def replay_failures(self):
+        """Replay the first failing op with round checking enabled.
+
+        The round scoreboard fails on the first divergent round, or the result
+        scoreboard fails in check_phase if the replay does not diverge.
+        """
+        scoreboard = self.ascon_env.get_failure_scoreboard()
+        if scoreboard is None or not scoreboard.failures:
+            return
+        op = scoreboard.failures[0]
+        self.logger.warning(f"[..] Replay {op!s} with round checking.")
+        self.ascon_env.enable_replay()
+        trace_ctrl = self.ascon_env.trace_ctrl
+        if trace_ctrl is not None:
+            trace_ctrl.open(f"replay of {op!s}")
+        seq = AsconReplaySeq.create("replay_seq")
+        assert isinstance(seq, AsconReplaySeq)
+        seq.op = op
+        await seq.start(self.sequencer)
+        if trace_ctrl is not None:
+            await trace_ctrl.close()
+        self.logger.warning(f"[..] Replay {op!s} did not diverge.")
+
     async def reset_system(self):
         self.logger.info("[..] Reset system.")
         self.dut.rst_n.value = 0
         await ClockCycles(self.dut.clk, 10)
         self.dut.rst_n.value = 1
+        self.reg_model.reset()
         await ClockCycles(self.dut.clk, 10)
         self.logger.info("[OK] Reset system.")
 
     def report_phase(self):
         super().report_phase()
+        if self.profiler is not None:
+            self.report_profile()
+        if self.perfdb_path is not None:
+            self.record_perf()
+
+        # Dumping the coverage hit counts, the reports are generated offline
+        # by tools/covdb.py
+        cov_db = CoverageDB.from_registry(self.get_type_name())
+        cov_db.save(f"sim_build/{self.get_type_name()}.cdb")
+        for line in cov_db.summary():
+            self.logger.info(f"[**] Coverage {line}")
+
+    def report_profile(self):
+        self.profiler.stop()
+        self.profiler.write_folded(self.profile_path)
+        for by in ("component", "call site"):
+            for line in self.profiler.table(by):
+                self.logger.info(f"[**] Profile {line}")
+        self.logger.info(
+            f"[OK] Profile of {self.profiler.wall_time:.3f} s written to "
+            f"{self.profile_path}"
+        )
+
+    def record_perf(self):
+        """Add the run to the performance history."""
+        monitor = self.ascon_env.perf_monitor
+        summary = monitor.summary()
+        ops = summary["ops"]
+        run = PerfRun(
+            test=self.get_type_name(),
+            revision=git_revision(),
+            seed=cocotb.RANDOM_SEED,
+            simulator=f"{cocotb.SIM_NAME} {cocotb.SIM_VERSION}",
+            wall_s=time.perf_counter() - self.wall_start,
+            sim_time_ns=get_sim_time("ns"),
+            ops=ops,
+            cycles_per_op=summary["cycles"] / ops if ops else None,
+            shard_index=self.shard_index,
+            shard_count=self.shard_count,
+        )
+        with PerfDB(self.perfdb_path) as db:
+            db.add_run(run)
+        self.logger.info(f"[OK] {run}, recorded in {self.perfdb_path}")
+
+    def start_of_simulation_phase(self):
+        self.wall_start = time.perf_counter()
+        # Wrap the components before their run_phase is started
+        profile_path = os.getenv("PROFILE", "0")
+        if profile_path == "1":
+            profile_path = f"sim_build/{self.get_type_name()}.folded"
+        if profile_path != "0":
+            self.profile_path = profile_path
+            self.profiler = Profiler()
+            self.profiler.install(self)
 
-        # Writing coverage report in txt-format
-        f = open(f"sim_build/{self.get_type_name()}_cov.txt", "w")
-        f.write(f"Coverage report for {self.get_type_name()} \n")
-        f.write("------------------------------------------------\n \n")
-        vsc.report_coverage(fp=f, details=True)
-        f.close()
+        # Solve the first batches during the reset
+        for prerand in self.prerandomizers:
+            prerand.start()
 
-        # Writing coverage report in xml-format
-        vsc.write_coverage_db(f"sim_build/{self.get_type_name()}_cov.xml")
+    def final_phase(self):
+        for prerand in self.prerandomizers:
+            prerand.close()
+            self.logger.info(f"[**] {prerand}")
+        if isinstance(self.log_handler, AsyncLogHandler):
+            self.remove_logging_handler_hier(self.log_handler)
+            self.log_handler.close()
+            if self.log_handler.dropped:
+                self.logger.warning(
+                    f"{self.log_handler.dropped} log records dropped, "
+                    f"{self.log_handler.written} written"
+                )
@@ -1,6 +1,7 @@
 import os
 
-from uvc.ascon.sequences import AsconRandEncSeq
+from uvc.ascon.sequences import AsconCoverageClosureSeq, AsconRandEncSeq
+from uvc.utils import fast_randomize
 
 from .ascon_base_test import AsconBaseTest
 
@@ -15,9 +16,46 @@ class AsconRandomSampleEncTest(AsconBaseTest):
         await self.reset_system()
 
         for i in range(sample_size):
+            if not self.in_shard(i):
+                continue
             seq = AsconRandEncSeq.create(f"rand_enc_seq({i})")
             assert isinstance(seq, AsconRandEncSeq)
-            seq.randomize()
+            if self.prerand_seq is not None:
+                self.prerand_seq.apply(seq)
+            else:
+                fast_randomize(seq)
+            seq.prerand = self.prerand_op
             await seq.start(self.sequencer)
+        await self.replay_failures()
+
+        self.drop_objection()
+
+
+class AsconCoverageClosureTest(AsconBaseTest):
+    """Run random ops steered by the Ascon coverage until it closes or stalls."""
+
+    async def run_phase(self):
+        self.raise_objection()
+
+        coverage = self.ascon_env.coverage
+        assert coverage is not None, "FAILED: coverage closure needs ASCON_COVERAGE=1."
+
+        self.start_clock()
+        await self.reset_system()
+
+        seq = AsconCoverageClosureSeq.create("closure_seq")
+        assert isinstance(seq, AsconCoverageClosureSeq)
+        seq.coverage = coverage
+        seq.goal = float(os.getenv("COVERAGE_GOAL", "100"))
+        seq.stall_limit = int(os.getenv("STALL_LIMIT", "50"))
+        seq.prerand = self.prerand_op
+        await seq.start(self.sequencer)
+
+        closure = ", ".join(f"{k}={v:.1f}%" for k, v in coverage.closure().items())
+        status = "goal met" if seq.goal_met else "stalled"
+        self.logger.info(
+            f"[OK] Coverage closure {status} after {seq.n_ops} ops: {closure}"
+        )
+        await self.replay_failures()
 
         self.drop_objection()
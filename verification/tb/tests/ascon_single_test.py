@@ -1,6 +1,7 @@
 import os
 
 from uvc.ascon.sequences import AsconSingleEncSeq
+from uvc.utils import fast_randomize
 
 from .ascon_base_test import AsconBaseTest
 
@@ -13,16 +14,21 @@ class AsconSingleEncTest(AsconBaseTest):
         hex_nonce = os.getenv("NONCE", "101112131415161718191A1B1C1D1E1F")
         hex_ad = os.getenv("AD", "")
         hex_di = os.getenv("DI", "")
+        delay = os.getenv("DELAY")
+        decrypt = int(os.getenv("DECRYPT", "0"))
 
         self.start_clock()
         await self.reset_system()
         seq = AsconSingleEncSeq.create("single_enc_seq")
         assert isinstance(seq, AsconSingleEncSeq)
-        seq.randomize()
+        fast_randomize(seq)
         seq.key = bytes.fromhex(hex_key)
         seq.nonce = bytes.fromhex(hex_nonce)
         seq.ad = bytes.fromhex(hex_ad)
         seq.di = bytes.fromhex(hex_di)
+        seq.delay = None if delay is None else int(delay)
+        seq.decrypt = decrypt
         await seq.start(self.sequencer)
+        await self.replay_failures()
 
         self.drop_objection()
@@ -0,0 +1,30 @@
+import os
+
+from uvc.ascon.sequences import AsconStimulusSeq
+from uvc.ascon.utils.ascon_stimulus import AsconStimulusFile
+
+from .ascon_base_test import AsconBaseTest
+
+
+class AsconStimulusTest(AsconBaseTest):
+    """Run the ops of the stimulus file STIMULUS, see tools/stimulus.py."""
+
+    async def run_phase(self):
+        self.raise_objection()
+
+        path = os.getenv("STIMULUS")
+        assert path, "FAILED: the stimulus test needs STIMULUS=<file>."
+
+        self.start_clock()
+        await self.reset_system()
+        with AsconStimulusFile(path) as stimulus:
+            self.logger.info(f"[..] Run {len(stimulus)} ops of {path}.")
+            seq = AsconStimulusSeq.create("stimulus_seq")
+            assert isinstance(seq, AsconStimulusSeq)
+            seq.stimulus = stimulus
+            seq.select = self.in_shard
+            await seq.start(self.sequencer)
+            self.logger.info(f"[OK] Run {seq.n_ops} ops of {path}.")
+        await self.replay_failures()
+
+        self.drop_objection()
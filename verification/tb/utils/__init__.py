@@ -0,0 +1,2 @@
+from .async_log import AsyncLogHandler
+from .profiler import Profiler
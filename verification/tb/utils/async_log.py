@@ -0,0 +1,101 @@
+import gzip
+import logging
+import queue
+import threading
+from typing import List, Optional, Tuple
+
+
+class AsyncLogHandler(logging.Handler):
+    """Log file handler formatting and writing the records in a thread.
+
+    The simulator thread only enqueues the records: the sim time is captured by
+    the handler filters, while the message arguments (transaction items whose
+    `__str__` formats wide integers) are only formatted by the writer thread,
+    in batches. When the queue is full the records are dropped and counted
+    rather than stalling the simulation. The file is gzip-compressed when its
+    name ends with `.gz`.
+
+    Arguments of the `eager_types` are formatted by the simulator thread: the
+    request items are updated in place by the drivers and reused from pools,
+    so their deferred format would show their later values.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        max_queue_size: int = 100_000,
+        batch_size: int = 1024,
+        eager_types: Tuple[type, ...] = (),
+        level=logging.NOTSET,
+    ):
+        super().__init__(level)
+        self.filename = filename
+        self.batch_size = batch_size
+        self.eager_types = eager_types
+        self.queue: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue(
+            max_queue_size
+        )
+        self.dropped = 0
+        self.written = 0
+        self.stream = self._open(filename)
+        self.thread = threading.Thread(
+            target=self._writer, name="async_log_writer", daemon=True
+        )
+        self.thread.start()
+
+    @staticmethod
+    def _open(filename: str):
+        if filename.endswith(".gz"):
+            return gzip.open(filename, "wt", compresslevel=6)
+        return open(filename, "w")
+
+    def emit(self, record: logging.LogRecord):
+        args = record.args
+        if self.eager_types and isinstance(args, tuple):
+            if any(isinstance(arg, self.eager_types) for arg in args):
+                record.msg = record.getMessage()
+                record.args = None
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _get_batch(self) -> List[Optional[logging.LogRecord]]:
+        batch = [self.queue.get()]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _writer(self):
+        running = True
+        while running:
+            lines = []
+            for record in self._get_batch():
+                if record is None:
+                    running = False
+                    continue
+                try:
+                    lines.append(self.format(record))
+                except Exception:
+                    self.handleError(record)
+            if lines:
+                self.stream.write("\n".join(lines) + "\n")
+                self.written += len(lines)
+            if self.queue.empty():
+                self.stream.flush()
+
+    def close(self):
+        if self.thread.is_alive():
+            # Blocking put, the writer thread is draining the queue
+            self.queue.put(None)
+            self.thread.join()
+            if self.dropped:
+                self.stream.write(
+                    f"{self.dropped} log records dropped, queue size "
+                    f"{self.queue.maxsize}\n"
+                )
+            self.stream.close()
+        super().close()
@@ -0,0 +1,256 @@
+import inspect
+import logging
+import sys
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from functools import wraps
+from time import perf_counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import cocotb
+from pyuvm import uvm_component, uvm_sequence, uvm_subscriber
+from uvc.utils import PreRandomizer, fast_rand
+
+# Frame of the wall time not spent in the profiled Python code
+SIMULATOR = "(simulator and scheduler)"
+
+_active: Optional["Profiler"] = None
+
+
+@dataclass
+class ProfileStat:
+    calls: int = 0
+    total: float = 0.0
+    own: float = 0.0
+
+
+@dataclass
+class _Frame:
+    component: str
+    path: Tuple[str, ...]
+    children: float = 0.0
+
+
+class _Suspend:
+    """Hand a trigger yielded by a profiled coroutine to the scheduler."""
+
+    __slots__ = ("trigger",)
+
+    def __init__(self, trigger):
+        self.trigger = trigger
+
+    def __await__(self):
+        return (yield self.trigger)
+
+
+class Profiler:
+    """Wall-clock profiler attributing the time of the run to UVM components.
+
+    install() wraps, for the components under a root, the run_phase coroutines
+    and the write() of the subscribers, and patches the sequence bodies, the
+    tasks spawned by a profiled coroutine, fast_randomize, the vsc solver, the
+    pre-randomizers and the log records. A coroutine is timed between its
+    resumption and its suspension, so the time spent waiting on triggers is
+    left to the simulator. Nothing is patched until install(), and stop()
+    restores everything: without a profiler, the run has no overhead.
+
+    The own time of each frame, its total minus its nested frames, is
+    aggregated per component and per call site, and per stack of frames in
+    the collapsed-stack format of flamegraph.pl (one line per stack, in µs).
+    """
+
+    def __init__(self):
+        self.stack: List[_Frame] = []
+        self.stats: Dict[Tuple[str, str], ProfileStat] = defaultdict(ProfileStat)
+        self.folded: Counter = Counter()
+        self.patches: List[Tuple[object, str, object]] = []
+        self.start_time = 0.0
+        self.wall_time = 0.0
+
+    def enter(self, label: str, component: Optional[str] = None, base=None):
+        parent = self.stack[-1] if self.stack else None
+        if component is None:
+            component = parent.component if parent else "-"
+        if base is None:
+            base = parent.path if parent else ()
+        self.stack.append(_Frame(component, base + (label,)))
+
+    def leave(self, elapsed: float):
+        frame = self.stack.pop()
+        if self.stack:
+            self.stack[-1].children += elapsed
+        own = elapsed - frame.children
+        stat = self.stats[frame.component, frame.path[-1]]
+        stat.calls += 1
+        stat.total += elapsed
+        stat.own += own
+        self.folded[frame.path] += own
+
+    def call(self, label: str, component: Optional[str], fn, *args, **kwargs):
+        self.enter(label, component)
+        t0 = perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.leave(perf_counter() - t0)
+
+    def timed(self, label: str, fn, component: Optional[str] = None):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            return self.call(label, component, fn, *args, **kwargs)
+
+        return wrapper
+
+    async def profile_coroutine(self, coro, label: str, component=None, base=None):
+        """Run coro, timing each of its steps as a frame."""
+        send, throw = coro.send, coro.throw
+        value = error = None
+        while True:
+            self.enter(label, component, base)
+            t0 = perf_counter()
+            try:
+                trigger = send(value) if error is None else throw(error)
+            except StopIteration as e:
+                return e.value
+            finally:
+                self.leave(perf_counter() - t0)
+            try:
+                value, error = await _Suspend(trigger), None
+            except BaseException as e:
+                value, error = None, e
+
+    def patch(self, owner, name: str, replacement):
+        self.patches.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, replacement)
+
+    def install(self, root: uvm_component):
+        global _active
+        if _active is not None:
+            # Left by a test which did not reach its report phase
+            _active.stop()
+        _active = self
+        for comp in self.walk(root):
+            name = comp.get_full_name()
+            self.wrap_component(comp, name)
+        self.patch_sequences()
+        self.patch_spawns()
+        self.patch_randomize()
+        handle = self.timed("logging", logging.Logger.handle)
+        self.patch(logging.Logger, "handle", handle)
+        self.start_time = perf_counter()
+
+    @classmethod
+    def walk(cls, comp: uvm_component) -> Iterator[uvm_component]:
+        yield comp
+        for child in comp.children:
+            yield from cls.walk(child)
+
+    def wrap_component(self, comp: uvm_component, name: str):
+        run_phase = comp.run_phase
+        label = f"{type(comp).__name__}.run_phase"
+
+        def profiled_run_phase():
+            return self.profile_coroutine(run_phase(), label, name)
+
+        # Instance attributes, called by the phases and the analysis ports
+        comp.run_phase = profiled_run_phase
+        if isinstance(comp, uvm_subscriber):
+            export = comp.analysis_export
+            export.write_fn = self.timed(
+                f"{type(comp).__name__}.write", export.write_fn, name
+            )
+
+    def patch_sequences(self):
+        start = uvm_sequence.start
+
+        @wraps(start)
+        def profiled_start(seq, *args, **kwargs):
+            label = f"{type(seq).__name__}.body"
+            return self.profile_coroutine(start(seq, *args, **kwargs), label)
+
+        self.patch(uvm_sequence, "start", profiled_start)
+
+    def patch_spawns(self):
+        start_soon = cocotb.start_soon
+
+        @wraps(start_soon)
+        def profiled_start_soon(coro):
+            if self.stack and inspect.iscoroutine(coro):
+                parent = self.stack[-1]
+                coro = self.profile_coroutine(
+                    coro, coro.__qualname__, parent.component, parent.path
+                )
+            return start_soon(coro)
+
+        self.patch(cocotb, "start_soon", profiled_start_soon)
+
+    def patch_randomize(self):
+        """Time the randomize calls at the site calling them."""
+        fast_randomize = fast_rand.fast_randomize
+
+        @wraps(fast_randomize)
+        def profiled_fast_randomize(obj, **pins):
+            label = f"randomize {type(obj).__name__} @ {self.call_site()}"
+            return self.call(label, None, fast_randomize, obj, **pins)
+
+        apply = PreRandomizer.apply
+
+        @wraps(apply)
+        def profiled_apply(prerand, obj):
+            label = f"prerandomize {prerand.name} @ {self.call_site()}"
+            return self.call(label, None, apply, prerand, obj)
+
+        # Also replace the imported names of fast_randomize
+        for module in list(sys.modules.values()):
+            if vars(module).get("fast_randomize") is fast_randomize:
+                self.patch(module, "fast_randomize", profiled_fast_randomize)
+        solver = fast_rand.solver_randomize
+        self.patch(fast_rand, "solver_randomize", self.timed("vsc solver", solver))
+        self.patch(PreRandomizer, "apply", profiled_apply)
+
+    @staticmethod
+    def call_site() -> str:
+        frame = sys._getframe(2)
+        code = frame.f_code
+        filename = code.co_filename.rsplit("/", 1)[-1]
+        return f"{code.co_name} ({filename}:{frame.f_lineno})"
+
+    def stop(self):
+        global _active
+        if _active is self:
+            _active = None
+        if self.patches:
+            self.wall_time = perf_counter() - self.start_time
+        for owner, name, original in reversed(self.patches):
+            setattr(owner, name, original)
+        self.patches.clear()
+
+    @property
+    def simulator_time(self) -> float:
+        return max(0.0, self.wall_time - sum(s.own for s in self.stats.values()))
+
+    def write_folded(self, filename: str):
+        with open(filename, "w") as f:
+            for path, own in sorted(self.folded.items()):
+                f.write(f"{';'.join(path)} {round(own * 1e6)}\n")
+            f.write(f"{SIMULATOR} {round(self.simulator_time * 1e6)}\n")
+
+    def table(self, by: str, top: int = 10) -> List[str]:
+        """Lines of the table of the own times per component or call site."""
+        index = 0 if by == "component" else 1
+        rows: Dict[str, ProfileStat] = defaultdict(ProfileStat)
+        for key, stat in self.stats.items():
+            row = rows[key[index]]
+            row.calls += stat.calls
+            row.total += stat.total
+            row.own += stat.own
+        rows[SIMULATOR].own = rows[SIMULATOR].total = self.simulator_time
+        wall = max(self.wall_time, 1e-9)
+        lines = [f"{'own s':>9} {'%':>5} {'total s':>9} {'calls':>9}  {by}"]
+        ranked = sorted(rows.items(), key=lambda kv: kv[1].own, reverse=True)
+        for name, row in ranked[:top]:
+            lines.append(
+                f"{row.own:9.3f} {100 * row.own / wall:5.1f} {row.total:9.3f} "
+                f"{row.calls:9d}  {name}"
+            )
+        return lines
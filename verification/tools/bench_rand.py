@@ -0,0 +1,103 @@
+"""Measure the randomization throughput of the stimulus items.
+
+Each item class is randomized `--count` times with the vsc solver, then with
+fast_randomize(), with the same field pins as in the sequences. The plan found
+by the constraint analysis is printed with --plan. With --check, the values
+drawn by fast_randomize() are checked against the class constraints by the
+solver.
+
+Example:
+    python verification/tools/bench_rand.py --count 500 --plan
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+VERIFICATION_DIR = Path(__file__).resolve().parents[1]
+
+if str(VERIFICATION_DIR) not in sys.path:
+    sys.path.insert(0, str(VERIFICATION_DIR))
+
+from uvc.apb.agents.apb_common import OpType  # noqa: E402
+from uvc.apb.agents.apb_parameterization import apb_change_width  # noqa: E402
+from uvc.apb.sequences.cl_apb_seq_lib import cl_apb_base_seq  # noqa: E402
+from uvc.ascon.agents.core.core_seq_item import AsconCoreOpItem  # noqa: E402
+from uvc.ascon.sequences.ascon_base_seq import (  # noqa: E402
+    AsconRandEncSeq,
+    AsconRandOpSeq,
+)
+from uvc.utils.fast_rand import (  # noqa: E402
+    analyze,
+    draw,
+    fast_randomize,
+    solver_randomize,
+)
+
+
+def cases():
+    """(name, object, pins of each randomization)"""
+    apb_item = apb_change_width(32, 32)("apb_item")
+    return [
+        ("AsconCoreOpItem", AsconCoreOpItem("op_item"), lambda i: {"delay": i % 16}),
+        (
+            "cl_apb_seq_item(32, 32)",
+            apb_item,
+            lambda i: {"op": OpType(i % 2), "addr": 4 * (i % 8), "data": i},
+        ),
+        ("cl_apb_base_seq", cl_apb_base_seq("apb_seq"), lambda i: {}),
+        ("AsconRandEncSeq", AsconRandEncSeq("rand_enc_seq"), lambda i: {}),
+        ("AsconRandOpSeq", AsconRandOpSeq("rand_op_seq"), lambda i: {}),
+    ]
+
+
+def rate(randomize, obj, pins, count: int) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        randomize(obj, **pins(i))
+    return count / (time.perf_counter() - start)
+
+
+def check(obj, count: int) -> int:
+    """Number of drawn values rejected by the solver."""
+    plan = analyze(obj)
+    errors = 0
+    for _ in range(count):
+        draw(obj, plan, {})
+        values = {name: int(getattr(obj, name)) for name in plan.domains}
+        try:
+            solver_randomize(obj, values)
+        except Exception:
+            errors += 1
+    return errors
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200, help="items per case")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--plan", action="store_true", help="print the plans")
+    parser.add_argument("--check", action="store_true", help="check fast values")
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    print(f"{'item':<24} {'solver/s':>10} {'fast/s':>10} {'speedup':>8}")
+    errors = 0
+    for name, obj, pins in cases():
+        solver = rate(lambda o, **p: solver_randomize(o, p), obj, pins, args.count)
+        fast = rate(fast_randomize, obj, pins, args.count)
+        mode = "" if analyze(obj).is_fast else " (solver)"
+        print(f"{name:<24} {solver:>10.0f} {fast:>10.0f} {fast / solver:>7.1f}x{mode}")
+        if args.plan:
+            print("\n".join(analyze(obj).report("  ")))
+        if args.check and analyze(obj).is_fast:
+            errors += check(obj, args.count)
+    if args.check:
+        print(f"{errors} drawn values rejected by the solver")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
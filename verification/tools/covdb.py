@@ -0,0 +1,342 @@
+"""Binary coverage database of the Ascon testbench.
+
+Each simulation dumps the hit counts of its pyvsc covergroups in a compact
+binary file (`sim_build/<test>.cdb`), with no report generated inside the
+simulator. This tool merges any number of run databases and generates the
+text, XML and HTML reports offline.
+
+Examples:
+    python verification/tools/covdb.py merge -o merged.cdb regress/shard_*/sim_build/*.cdb
+    python verification/tools/covdb.py merge --append -o merged.cdb new_run.cdb
+    python verification/tools/covdb.py report merged.cdb --details --html cov.html
+"""
+
+import argparse
+import struct
+import sys
+import zlib
+from dataclasses import dataclass, field
+from enum import IntEnum
+from html import escape
+from pathlib import Path
+from typing import Dict, Iterable, List, TextIO
+from xml.etree import ElementTree as ET
+
+MAGIC = b"ACDB"
+VERSION = 1
+
+# magic, version, number of runs
+_HEADER = struct.Struct("<4sHI")
+_COUNT = struct.Struct("<I")
+_STR_LEN = struct.Struct("<H")
+
+
+class CoverItemKind(IntEnum):
+    COVERPOINT = 0
+    CROSS = 1
+
+
+@dataclass
+class CoverItem:
+    name: str
+    kind: CoverItemKind
+    # Hit count of each bin, in declaration order
+    bins: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def n_hit(self) -> int:
+        return sum(1 for hits in self.bins.values() if hits)
+
+    @property
+    def coverage(self) -> float:
+        if not self.bins:
+            return 100.0
+        return 100.0 * self.n_hit / len(self.bins)
+
+    def merge(self, other: "CoverItem"):
+        for name, hits in other.bins.items():
+            self.bins[name] = self.bins.get(name, 0) + hits
+
+
+@dataclass
+class CoverGroup:
+    name: str
+    items: Dict[str, CoverItem] = field(default_factory=dict)
+
+    @property
+    def coverage(self) -> float:
+        """Average of the coverpoint and cross coverages, as computed by pyvsc."""
+        if not self.items:
+            return 100.0
+        return sum(i.coverage for i in self.items.values()) / len(self.items)
+
+    def merge(self, other: "CoverGroup"):
+        for name, item in other.items.items():
+            if name in self.items:
+                self.items[name].merge(item)
+            else:
+                self.items[name] = CoverItem(item.name, item.kind, dict(item.bins))
+
+
+class _Writer:
+    def __init__(self):
+        self.buf = bytearray()
+
+    def count(self, n: int):
+        self.buf += _COUNT.pack(n)
+
+    def str(self, s: str):
+        data = s.encode()
+        self.buf += _STR_LEN.pack(len(data))
+        self.buf += data
+
+    def counts(self, values: List[int]):
+        self.buf += struct.pack(f"<{len(values)}Q", *values)
+
+
+class _Reader:
+    def __init__(self, buf: bytes):
+        self.buf = memoryview(buf)
+        self.pos = 0
+
+    def _unpack(self, fmt: struct.Struct):
+        values = fmt.unpack_from(self.buf, self.pos)
+        self.pos += fmt.size
+        return values[0]
+
+    def count(self) -> int:
+        return self._unpack(_COUNT)
+
+    def str(self) -> str:
+        n = self._unpack(_STR_LEN)
+        s = bytes(self.buf[self.pos : self.pos + n]).decode()
+        self.pos += n
+        return s
+
+    def counts(self, n: int) -> List[int]:
+        fmt = f"<{n}Q"
+        values = struct.unpack_from(fmt, self.buf, self.pos)
+        self.pos += struct.calcsize(fmt)
+        return list(values)
+
+
+class CoverageDB:
+    """Bin hit counts of the covergroup types of one or several runs."""
+
+    def __init__(self):
+        self.runs = 0
+        self.tests: List[str] = []
+        self.groups: Dict[str, CoverGroup] = {}
+
+    @classmethod
+    def from_registry(cls, test_name: str) -> "CoverageDB":
+        """Collect the hit counts of the pyvsc covergroup types of this run."""
+        from vsc.impl.coverage_registry import CoverageRegistry
+
+        db = cls()
+        db.runs = 1
+        db.tests.append(test_name)
+        for cg in CoverageRegistry.inst().covergroup_types():
+            group = CoverGroup(cg.name)
+            for kind, models in (
+                (CoverItemKind.COVERPOINT, cg.coverpoint_l),
+                (CoverItemKind.CROSS, cg.cross_l),
+            ):
+                for m in models:
+                    group.items[m.name] = CoverItem(
+                        m.name,
+                        kind,
+                        {m.get_bin_name(i): m.get_bin_hits(i) for i in range(m.get_n_bins())},
+                    )
+            db.groups[group.name] = group
+        return db
+
+    def merge(self, other: "CoverageDB"):
+        self.runs += other.runs
+        self.tests.extend(other.tests)
+        for name, group in other.groups.items():
+            self.groups.setdefault(name, CoverGroup(name)).merge(group)
+
+    @property
+    def coverage(self) -> float:
+        if not self.groups:
+            return 0.0
+        return sum(g.coverage for g in self.groups.values()) / len(self.groups)
+
+    def save(self, filename):
+        w = _Writer()
+        w.count(len(self.tests))
+        for test in self.tests:
+            w.str(test)
+        w.count(len(self.groups))
+        for group in self.groups.values():
+            w.str(group.name)
+            w.count(len(group.items))
+            for item in group.items.values():
+                w.str(item.name)
+                w.count(item.kind)
+                w.count(len(item.bins))
+                for name in item.bins:
+                    w.str(name)
+                w.counts(list(item.bins.values()))
+        with open(filename, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.runs))
+            f.write(zlib.compress(bytes(w.buf)))
+
+    @classmethod
+    def load(cls, filename) -> "CoverageDB":
+        with open(filename, "rb") as f:
+            data = f.read()
+        magic, version, runs = _HEADER.unpack_from(data)
+        assert magic == MAGIC, f"FAILED: {filename} is not a coverage database."
+        assert version == VERSION, (
+            f"FAILED: {filename} has version {version}, expected {VERSION}."
+        )
+        r = _Reader(zlib.decompress(data[_HEADER.size :]))
+        db = cls()
+        db.runs = runs
+        db.tests = [r.str() for _ in range(r.count())]
+        for _ in range(r.count()):
+            group = CoverGroup(r.str())
+            for _ in range(r.count()):
+                name = r.str()
+                kind = CoverItemKind(r.count())
+                bin_names = [r.str() for _ in range(r.count())]
+                item = CoverItem(name, kind, dict(zip(bin_names, r.counts(len(bin_names)))))
+                group.items[name] = item
+            db.groups[group.name] = group
+        return db
+
+    # ------------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------------
+
+    def summary(self) -> List[str]:
+        return [f"{g.name}: {g.coverage:.2f}%" for g in self.groups.values()]
+
+    def write_text(self, f: TextIO, details: bool = False):
+        f.write(f"Coverage report of {self.runs} run(s)\n")
+        f.write("------------------------------------------------\n\n")
+        for group in self.groups.values():
+            f.write(f"TYPE {group.name} : {group.coverage:.2f}%\n")
+            for item in group.items.values():
+                label = "CVP" if item.kind == CoverItemKind.COVERPOINT else "CROSS"
+                f.write(
+                    f"    {label} {item.name} : {item.coverage:.2f}% "
+                    f"({item.n_hit}/{len(item.bins)})\n"
+                )
+                if details:
+                    for name, hits in item.bins.items():
+                        f.write(f"        Bin {name} : {hits}\n")
+        f.write(f"\nTotal: {self.coverage:.2f}%\n")
+
+    def write_xml(self, filename):
+        root = ET.Element(
+            "coverage", runs=str(self.runs), coverage=f"{self.coverage:.2f}"
+        )
+        tests = ET.SubElement(root, "tests")
+        for test in self.tests:
+            ET.SubElement(tests, "test", name=test)
+        for group in self.groups.values():
+            g = ET.SubElement(
+                root, "covergroup", name=group.name, coverage=f"{group.coverage:.2f}"
+            )
+            for item in group.items.values():
+                i = ET.SubElement(
+                    g,
+                    item.kind.name.lower(),
+                    name=item.name,
+                    coverage=f"{item.coverage:.2f}",
+                )
+                for name, hits in item.bins.items():
+                    ET.SubElement(i, "bin", name=name, hits=str(hits))
+        tree = ET.ElementTree(root)
+        ET.indent(tree)
+        tree.write(filename, encoding="UTF-8", xml_declaration=True)
+
+    def write_html(self, filename, details: bool = False):
+        def color(coverage: float) -> str:
+            if coverage >= 100.0:
+                return "#b6e3b6"
+            return "#f7e3a1" if coverage > 0.0 else "#f2b8b8"
+
+        def row(name: str, hits: str, coverage: float, indent: int = 0) -> str:
+            return (
+                f'<tr style="background:{color(coverage)}">'
+                f'<td style="padding-left:{2 * indent}em">{escape(name)}</td>'
+                f"<td>{hits}</td><td>{coverage:.2f}%</td></tr>\n"
+            )
+
+        with open(filename, "w") as f:
+            f.write("<!DOCTYPE html>\n<html><head><meta charset='utf-8'>")
+            f.write("<title>Coverage report</title></head><body>\n")
+            f.write(
+                f"<h1>Coverage report</h1><p>{self.runs} run(s), "
+                f"total {self.coverage:.2f}%</p>\n"
+            )
+            f.write("<table><tr><th>name</th><th>hits</th><th>coverage</th></tr>\n")
+            for group in self.groups.values():
+                f.write(row(group.name, "", group.coverage))
+                for item in group.items.values():
+                    hits = f"{item.n_hit}/{len(item.bins)}"
+                    f.write(row(item.name, hits, item.coverage, 1))
+                    if details:
+                        for name, n in item.bins.items():
+                            f.write(row(name, str(n), 100.0 if n else 0.0, 2))
+            f.write("</table></body></html>\n")
+
+
+def merge(filenames: Iterable, db: CoverageDB = None) -> CoverageDB:
+    """Merge run databases one at a time, so only one is held in memory."""
+    db = db or CoverageDB()
+    for filename in filenames:
+        db.merge(CoverageDB.load(filename))
+    return db
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("merge", help="merge run databases")
+    p.add_argument("inputs", nargs="+", type=Path)
+    p.add_argument("-o", "--output", type=Path, required=True)
+    p.add_argument(
+        "--append", action="store_true", help="merge into the existing output"
+    )
+
+    p = sub.add_parser("report", help="generate reports from a database")
+    p.add_argument("inputs", nargs="+", type=Path, help="merged before reporting")
+    p.add_argument("--details", action="store_true", help="list the bins")
+    p.add_argument("--text", type=Path, help="default: stdout")
+    p.add_argument("--xml", type=Path)
+    p.add_argument("--html", type=Path)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.cmd == "merge":
+        db = None
+        if args.append and args.output.is_file():
+            db = CoverageDB.load(args.output)
+        db = merge(args.inputs, db)
+        db.save(args.output)
+        print(f"{args.output}: {db.runs} run(s), {db.coverage:.2f}%")
+        return 0
+
+    db = merge(args.inputs)
+    if args.text:
+        with open(args.text, "w") as f:
+            db.write_text(f, args.details)
+    elif not (args.xml or args.html):
+        db.write_text(sys.stdout, args.details)
+    if args.xml:
+        db.write_xml(args.xml)
+    if args.html:
+        db.write_html(args.html, args.details)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+"""Performance history of the simulations, compared across git revisions.
+
+Each test records its run in a SQLite database (see AsconBaseTest): git
+revision, seed, simulator, wall-clock and simulated time, ops executed,
+throughput, and DUT cycles per op measured by AsconCorePerfMonitor. The
+revisions with uncommitted changes are recorded as `<sha>-dirty`. compare runs
+one-sided Welch t-tests, per test case, between the runs of two revisions and
+flags the significant throughput and cycles/op regressions.
+
+Examples:
+    python verification/tools/perfdb.py list --test AsconFullRefEncTest
+    python verification/tools/perfdb.py compare 3f2a1c0 HEAD-dirty
+"""
+
+import argparse
+import math
+import sqlite3
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+VERIFICATION_DIR = Path(__file__).resolve().parents[1]
+ROOT_DIR = VERIFICATION_DIR.parent
+
+# Outside of sim_build, so the history survives `make clean`
+DEFAULT_PATH = ROOT_DIR / "sim" / "perf.db"
+
+DIRTY = "-dirty"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    date TEXT,
+    test TEXT NOT NULL,
+    revision TEXT NOT NULL,
+    seed INTEGER,
+    simulator TEXT,
+    shard_index INTEGER,
+    shard_count INTEGER,
+    wall_s REAL,
+    sim_time_ns REAL,
+    ops INTEGER,
+    ops_per_s REAL,
+    cycles_per_op REAL
+);
+CREATE INDEX IF NOT EXISTS runs_revision_test ON runs (revision, test);
+"""
+
+
+def short_revision(revision: str) -> str:
+    if revision.endswith(DIRTY):
+        return revision[: -len(DIRTY)][:12] + DIRTY
+    return revision[:12]
+
+
+@dataclass
+class PerfRun:
+    test: str
+    revision: str
+    seed: Optional[int]
+    simulator: str
+    wall_s: float
+    sim_time_ns: float
+    ops: int
+    cycles_per_op: Optional[float]
+    shard_index: int = 0
+    shard_count: int = 1
+    date: str = field(
+        default_factory=lambda: datetime.now().isoformat(sep=" ", timespec="seconds")
+    )
+    run_id: Optional[int] = None
+
+    @property
+    def ops_per_s(self) -> float:
+        return self.ops / self.wall_s if self.wall_s > 0 else 0.0
+
+    def __str__(self):
+        cycles = "-" if self.cycles_per_op is None else f"{self.cycles_per_op:.1f}"
+        return (
+            f"{self.test}@{short_revision(self.revision)}: {self.ops} ops in "
+            f"{self.wall_s:.2f} s, {self.ops_per_s:.2f} ops/s, {cycles} cycles/op"
+        )
+
+
+class PerfDB:
+    """SQLite store of the runs, shared by the concurrent shards."""
+
+    COLUMNS = (
+        "run_id",
+        "date",
+        "test",
+        "revision",
+        "seed",
+        "simulator",
+        "shard_index",
+        "shard_count",
+        "wall_s",
+        "sim_time_ns",
+        "ops",
+        "cycles_per_op",
+    )
+
+    def __init__(self, filename, readonly: bool = False):
+        self.filename = filename
+        if readonly:
+            self.conn = sqlite3.connect(f"file:{filename}?mode=ro", uri=True)
+        else:
+            self.conn = sqlite3.connect(filename, timeout=30)
+            self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "PerfDB":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def add_run(self, run: PerfRun) -> int:
+        cursor = self.conn.execute(
+            """
+            INSERT INTO runs (date, test, revision, seed, simulator, shard_index,
+                shard_count, wall_s, sim_time_ns, ops, ops_per_s, cycles_per_op)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                run.date,
+                run.test,
+                run.revision,
+                run.seed,
+                run.simulator,
+                run.shard_index,
+                run.shard_count,
+                run.wall_s,
+                run.sim_time_ns,
+                run.ops,
+                run.ops_per_s,
+                run.cycles_per_op,
+            ),
+        )
+        self.conn.commit()
+        run.run_id = cursor.lastrowid
+        return run.run_id
+
+    def get_runs(
+        self,
+        test: Optional[str] = None,
+        revision: Optional[str] = None,
+        simulator: Optional[str] = None,
+    ) -> List[PerfRun]:
+        query = f"SELECT {', '.join(self.COLUMNS)} FROM runs WHERE 1"
+        params = []
+        for column, value in (
+            ("test", test),
+            ("revision", revision),
+            ("simulator", simulator),
+        ):
+            if value is not None:
+                query += f" AND {column} = ?"
+                params.append(value)
+        rows = self.conn.execute(query + " ORDER BY run_id", params)
+        return [PerfRun(**dict(zip(self.COLUMNS, row))) for row in rows]
+
+    def revisions(self) -> List[str]:
+        """Recorded revisions, in the order of their first run."""
+        rows = self.conn.execute(
+            "SELECT revision FROM runs GROUP BY revision ORDER BY MIN(run_id)"
+        )
+        return [row[0] for row in rows]
+
+    def resolve(self, spec: str) -> str:
+        """Recorded revision of a git revision name or sha prefix."""
+        dirty = spec.endswith(DIRTY)
+        name = spec[: -len(DIRTY)] if dirty else spec
+        sha = git_rev_parse(name) or name
+        matches = [
+            rev
+            for rev in self.revisions()
+            if rev.startswith(sha) and rev.endswith(DIRTY) == dirty
+        ]
+        if len(matches) != 1:
+            what = "no run" if not matches else f"{len(matches)} revisions"
+            raise ValueError(f"{what} matching '{spec}' in {self.filename}")
+        return matches[0]
+
+
+def git_rev_parse(name: str) -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", f"{name}^{{commit}}"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    return out.stdout.strip() if out.returncode == 0 else None
+
+
+def git_revision() -> str:
+    """Revision of the working tree, `unknown` outside of a git checkout."""
+    sha = git_rev_parse("HEAD")
+    if sha is None:
+        return "unknown"
+    status = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=no"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+    )
+    return sha + DIRTY if status.stdout.strip() else sha
+
+
+def _betacf(a: float, b: float, x: float) -> float:
+    """Continued fraction of the incomplete beta function (modified Lentz)."""
+    tiny = 1e-300
+    c, d = 1.0, 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) > tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        for aa in (
+            m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+            -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1)),
+        ):
+            d = 1.0 + aa * d
+            d = 1.0 / (d if abs(d) > tiny else tiny)
+            c = 1.0 + aa / c
+            c = c if abs(c) > tiny else tiny
+            h *= d * c
+        if abs(d * c - 1.0) < 1e-12:
+            break
+    return h
+
+
+def betainc(a: float, b: float, x: float) -> float:
+    """Regularized incomplete beta function I_x(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(
+        math.lgamma(a + b)
+        - math.lgamma(a)
+        - math.lgamma(b)
+        + a * math.log(x)
+        + b * math.log1p(-x)
+    )
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _betacf(a, b, x) / a
+    return 1.0 - front * _betacf(b, a, 1.0 - x) / b
+
+
+def student_sf(t: float, df: float) -> float:
+    """P(T > t) for a Student t distribution of df degrees of freedom."""
+    tail = 0.5 * betainc(df / 2.0, 0.5, df / (df + t * t))
+    return tail if t > 0 else 1.0 - tail
+
+
+@dataclass
+class WelchResult:
+    mean_a: float
+    mean_b: float
+    t: float
+    df: float
+
+    @property
+    def change(self) -> float:
+        """Relative change from a to b, in percent."""
+        return 100.0 * (self.mean_b - self.mean_a) / self.mean_a
+
+    def _sf(self, t: float) -> float:
+        if self.df == 0.0:
+            # Deterministic samples
+            return 0.0 if t > 0 else 1.0
+        return student_sf(t, self.df)
+
+    @property
+    def p_decrease(self) -> float:
+        """One-sided p-value of mean_b < mean_a."""
+        return self._sf(self.t)
+
+    @property
+    def p_increase(self) -> float:
+        """One-sided p-value of mean_b > mean_a."""
+        return self._sf(-self.t)
+
+
+def welch_t_test(a: List[float], b: List[float]) -> Optional[WelchResult]:
+    """Welch's t-test of the means of a and b, None with less than 2 samples."""
+    if len(a) < 2 or len(b) < 2:
+        return None
+    mean_a, mean_b = statistics.fmean(a), statistics.fmean(b)
+    se_a = statistics.variance(a, mean_a) / len(a)
+    se_b = statistics.variance(b, mean_b) / len(b)
+    if se_a + se_b == 0.0:
+        t = 0.0 if mean_a == mean_b else math.copysign(math.inf, mean_a - mean_b)
+        return WelchResult(mean_a, mean_b, t, 0.0)
+    t = (mean_a - mean_b) / math.sqrt(se_a + se_b)
+    df = (se_a + se_b) ** 2 / (se_a**2 / (len(a) - 1) + se_b**2 / (len(b) - 1))
+    return WelchResult(mean_a, mean_b, t, df)
+
+
+def compare(
+    db: PerfDB,
+    rev_a: str,
+    rev_b: str,
+    tests: Optional[List[str]] = None,
+    simulator: Optional[str] = None,
+    alpha: float = 0.05,
+    min_change: float = 2.0,
+) -> List[Dict]:
+    """Throughput and cycles/op of the tests run at both revisions.
+
+    A regression is a decrease of ops/s, or an increase of cycles/op,
+    significant at `alpha` and of at least `min_change` percent.
+    """
+    runs_a = db.get_runs(revision=rev_a, simulator=simulator)
+    runs_b = db.get_runs(revision=rev_b, simulator=simulator)
+    names = sorted({r.test for r in runs_a} & {r.test for r in runs_b})
+    rows = []
+    for name in names:
+        if tests and name not in tests:
+            continue
+        a = [r for r in runs_a if r.test == name]
+        b = [r for r in runs_b if r.test == name]
+        tput = welch_t_test([r.ops_per_s for r in a], [r.ops_per_s for r in b])
+        cycles = welch_t_test(
+            [r.cycles_per_op for r in a if r.cycles_per_op is not None],
+            [r.cycles_per_op for r in b if r.cycles_per_op is not None],
+        )
+        regressions = []
+        if tput and tput.p_decrease < alpha and -tput.change >= min_change:
+            regressions.append("ops/s")
+        if cycles and cycles.p_increase < alpha and cycles.change >= min_change:
+            regressions.append("cycles/op")
+        rows.append(
+            {
+                "test": name,
+                "runs_a": len(a),
+                "runs_b": len(b),
+                "ops_per_s": tput,
+                "cycles_per_op": cycles,
+                "regressions": regressions,
+            }
+        )
+    return rows
+
+
+def cmd_list(db: PerfDB, args):
+    runs = db.get_runs(test=args.test, simulator=args.simulator)
+    if args.revision is not None:
+        revision = db.resolve(args.revision)
+        runs = [r for r in runs if r.revision == revision]
+    print(
+        f"{'date':<19} {'revision':<18} {'test':<28} {'seed':>10} "
+        f"{'wall [s]':>9} {'ops':>7} {'ops/s':>9} {'cyc/op':>8}"
+    )
+    for r in runs[-args.limit :]:
+        cycles = "-" if r.cycles_per_op is None else f"{r.cycles_per_op:.1f}"
+        print(
+            f"{r.date:<19} {short_revision(r.revision):<18} {r.test:<28} "
+            f"{r.seed or 0:>10} "
+            f"{r.wall_s:>9.2f} {r.ops:>7} {r.ops_per_s:>9.2f} {cycles:>8}"
+        )
+
+
+def cmd_compare(db: PerfDB, args) -> int:
+    rev_a, rev_b = db.resolve(args.rev_a), db.resolve(args.rev_b)
+    rows = compare(
+        db, rev_a, rev_b, args.test, args.simulator, args.alpha, args.min_change
+    )
+    print(f"a: {rev_a}\nb: {rev_b}")
+    print(
+        f"{'test':<28} {'runs':>7} {'ops/s a':>9} {'ops/s b':>9} {'change':>8} "
+        f"{'p':>7} {'cyc/op a':>9} {'cyc/op b':>9}"
+    )
+    n_regressions = 0
+    for row in rows:
+        tput, cycles = row["ops_per_s"], row["cycles_per_op"]
+        line = f"{row['test']:<28} {row['runs_a']:>3}/{row['runs_b']:<3}"
+        if tput is None:
+            line += f" {'(less than 2 runs each)':>43}"
+        else:
+            line += (
+                f" {tput.mean_a:>9.2f} {tput.mean_b:>9.2f} {tput.change:>+7.1f}%"
+                f" {tput.p_decrease:>7.4f}"
+            )
+        if cycles is not None:
+            line += f" {cycles.mean_a:>9.1f} {cycles.mean_b:>9.1f}"
+        print(line)
+        for metric in row["regressions"]:
+            n_regressions += 1
+            print(f"FAILED: {row['test']}: {metric} regression")
+    if not rows:
+        print("No test run at both revisions.")
+    return 1 if n_regressions else 0
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, default=DEFAULT_PATH)
+    parser.add_argument("--simulator", help="only the runs of this simulator")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("list", help="list the runs")
+    p.add_argument("--test")
+    p.add_argument("--revision", help="git revision, `<rev>-dirty` if modified")
+    p.add_argument("--limit", type=int, default=50, help="number of last runs")
+
+    p = sub.add_parser("compare", help="compare the runs of two revisions")
+    p.add_argument("rev_a", help="baseline revision")
+    p.add_argument("rev_b", help="revision to check, `<rev>-dirty` if modified")
+    p.add_argument("--test", action="append", help="test to compare, default: all")
+    p.add_argument("--alpha", type=float, default=0.05, help="significance level")
+    p.add_argument(
+        "--min-change", type=float, default=2.0, help="smallest regression, in %%"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if not args.db.is_file():
+        sys.exit(f"Error: no database {args.db}")
+    with PerfDB(args.db, readonly=True) as db:
+        try:
+            if args.cmd == "list":
+                cmd_list(db, args)
+                return 0
+            return cmd_compare(db, args)
+        except ValueError as e:
+            sys.exit(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""Sharded regression runner for the Ascon testbench.
+
+The HDL is built once, then the test case is run in SHARD_COUNT simulator
+processes, each one handling the ops selected by its SHARD_INDEX. The results,
+logs, coverage databases and statistics of the shards are merged in the output
+directory.
+
+Example:
+    python verification/tools/regress.py --sim verilator --shards 8
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+from cocotb.runner import get_runner
+
+VERIFICATION_DIR = Path(__file__).resolve().parents[1]
+ROOT_DIR = VERIFICATION_DIR.parent
+
+# The tools package, and the testbench in the simulator processes, are imported
+# through sys.path
+if str(VERIFICATION_DIR) not in sys.path:
+    sys.path.insert(0, str(VERIFICATION_DIR))
+
+from tools.covdb import CoverageDB  # noqa: E402
+from tools.covdb import merge as merge_coverage_dbs  # noqa: E402
+
+SRC_DIR = ROOT_DIR / "src"
+FILELIST = SRC_DIR / "hdl-files.list"
+
+# Testbench-only modules bound into the design
+TB_SOURCES = [VERIFICATION_DIR / "hdl" / "ascon_round_signature.sv"]
+
+# Toplevel generating the clock, see --hdl-clock
+HDL_CLOCK_HARNESS = VERIFICATION_DIR / "hdl" / "ascon_tb_harness.sv"
+
+
+@dataclass
+class ShardResult:
+    index: int
+    results_xml: Path
+    log_file: Path
+    wall_time: float
+    tests: int = 0
+    failures: int = 0
+    sim_time_ns: float = 0.0
+    failed_tests: List[str] = field(default_factory=list)
+
+    def read_results(self):
+        if not self.results_xml.is_file():
+            self.failures += 1
+            self.failed_tests.append("(simulation terminated abnormally)")
+            return
+        tree = ET.parse(self.results_xml)
+        for tc in tree.iter("testcase"):
+            self.tests += 1
+            self.sim_time_ns += float(tc.get("sim_time_ns", 0.0))
+            if tc.find("failure") is not None:
+                self.failures += 1
+                self.failed_tests.append(tc.get("name", "?"))
+
+
+def verilog_sources(hdl_clock: bool = False) -> List[Path]:
+    with open(FILELIST) as f:
+        sources = [SRC_DIR / line.strip() for line in f if line.strip()]
+    return sources + TB_SOURCES + ([HDL_CLOCK_HARNESS] if hdl_clock else [])
+
+
+def build(args):
+    runner = get_runner(args.sim)
+    build_args = list(args.build_arg)
+    parameters = {}
+    if args.hdl_clock:
+        parameters["CLK_PERIOD_PS"] = args.clk_period_ps
+        if args.sim == "verilator":
+            build_args.append("--timing")
+    runner.build(
+        verilog_sources=verilog_sources(args.hdl_clock),
+        hdl_toplevel=args.toplevel,
+        parameters=parameters,
+        build_args=build_args,
+        build_dir=args.build_dir,
+        waves=args.waves,
+        always=True,
+    )
+
+
+def run_shard(args, index: int, extra_env: Dict[str, str]) -> ShardResult:
+    test_dir = args.out_dir / f"shard_{index}"
+    shutil.rmtree(test_dir, ignore_errors=True)
+    (test_dir / "sim_build").mkdir(parents=True)
+    log_file = test_dir / "test.log"
+    results_xml = test_dir / "results.xml"
+
+    env = dict(extra_env)
+    env.update(
+        SHARD_INDEX=str(index),
+        SHARD_COUNT=str(args.shards),
+        LOGFILE=str(log_file),
+    )
+
+    start = time.perf_counter()
+    runner = get_runner(args.sim)
+    try:
+        runner.test(
+            test_module=args.module,
+            hdl_toplevel=args.toplevel,
+            hdl_toplevel_lang="verilog",
+            testcase=args.testcase,
+            seed=args.seed + index,
+            extra_env=env,
+            waves=args.waves,
+            build_dir=args.build_dir,
+            test_dir=test_dir,
+            results_xml=str(results_xml),
+            log_file=test_dir / "sim.log",
+        )
+    except SystemExit:
+        # Raised by the runner when the simulator exits with an error
+        pass
+    result = ShardResult(index, results_xml, log_file, time.perf_counter() - start)
+    result.read_results()
+    return result
+
+
+def merge_results(results: List[ShardResult], out_dir: Path):
+    merged = ET.Element("testsuites", name="results")
+    for r in results:
+        if not r.results_xml.is_file():
+            continue
+        for ts in ET.parse(r.results_xml).iter("testsuite"):
+            ts.set("name", f"{ts.get('name', 'all')}.shard_{r.index}")
+            merged.append(ts)
+    ET.ElementTree(merged).write(out_dir / "results.xml", encoding="UTF-8")
+
+
+def merge_logs(results: List[ShardResult], out_dir: Path):
+    with open(out_dir / "regress.log", "w") as out:
+        for r in results:
+            out.write(f"===== shard {r.index} =====\n")
+            if r.log_file.is_file():
+                with open(r.log_file) as f:
+                    shutil.copyfileobj(f, out)
+
+
+def merge_coverage(results: List[ShardResult], out_dir: Path) -> CoverageDB:
+    cdb_files = []
+    for r in results:
+        cdb_files.extend(sorted((r.results_xml.parent / "sim_build").glob("*.cdb")))
+    db = merge_coverage_dbs(cdb_files)
+    db.save(out_dir / "coverage.cdb")
+    return db
+
+
+def report(results: List[ShardResult], wall_time: float) -> List[str]:
+    lines = [f"{'shard':>5} {'tests':>6} {'failed':>6} {'sim [ms]':>10} {'wall [s]':>9}"]
+    for r in results:
+        lines.append(
+            f"{r.index:>5} {r.tests:>6} {r.failures:>6} "
+            f"{r.sim_time_ns / 1e6:>10.3f} {r.wall_time:>9.1f}"
+        )
+    tests = sum(r.tests for r in results)
+    failures = sum(r.failures for r in results)
+    serial_time = sum(r.wall_time for r in results)
+    lines.append(f"{'total':>5} {tests:>6} {failures:>6}")
+    lines.append(
+        f"wall-clock {wall_time:.1f}s for {serial_time:.1f}s of shard time "
+        f"({serial_time / wall_time:.2f}x)"
+    )
+    for r in results:
+        for name in r.failed_tests:
+            lines.append(f"FAILED: shard {r.index}: {name}")
+    return lines
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sim", default=os.getenv("SIM", "verilator"))
+    parser.add_argument("--toplevel", help="default: the wrapper or the harness")
+    parser.add_argument("--module", default="tb.test_ascon")
+    parser.add_argument("--testcase", default="test_full_ref_enc")
+    parser.add_argument("--shards", type=int, default=os.cpu_count())
+    parser.add_argument("--jobs", type=int, default=None, help="default: --shards")
+    parser.add_argument("--seed", type=int, default=int(time.time()))
+    parser.add_argument("--build-dir", type=Path, default=Path("sim_build"))
+    parser.add_argument("--out-dir", type=Path, default=Path("regress"))
+    parser.add_argument("--build-arg", action="append", default=[])
+    parser.add_argument("--no-build", action="store_true", help="reuse --build-dir")
+    parser.add_argument("--waves", action="store_true")
+    parser.add_argument(
+        "--hdl-clock",
+        action="store_true",
+        help="generate the clock in ascon_tb_harness instead of a cocotb Clock",
+    )
+    parser.add_argument("--clk-period-ps", type=int, default=10000)
+    parser.add_argument(
+        "-e",
+        "--env",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="environment variable passed to every shard",
+    )
+    args = parser.parse_args(argv)
+    if args.toplevel is None:
+        args.toplevel = "ascon_tb_harness" if args.hdl_clock else "ascon_apb_wrapper"
+    args.build_dir = args.build_dir.resolve()
+    args.out_dir = args.out_dir.resolve()
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    extra_env = dict(kv.split("=", 1) for kv in args.env)
+    if args.hdl_clock:
+        extra_env["HDL_CLOCK"] = "1"
+
+    start = time.perf_counter()
+    if not args.no_build:
+        build(args)
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=args.jobs or args.shards) as pool:
+        futures = [
+            pool.submit(run_shard, args, index, extra_env)
+            for index in range(args.shards)
+        ]
+        results = [f.result() for f in futures]
+    wall_time = time.perf_counter() - start
+
+    merge_results(results, args.out_dir)
+    merge_logs(results, args.out_dir)
+    lines = report(results, wall_time)
+    cov_db = merge_coverage(results, args.out_dir)
+    lines.extend(f"coverage {line}" for line in cov_db.summary())
+    with open(args.out_dir / "regress.txt", "w") as f:
+        f.write("\n".join(lines) + "\n")
+    print("\n".join(lines))
+    return 1 if any(r.failures for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
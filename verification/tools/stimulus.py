@@ -0,0 +1,151 @@
+"""Generate and inspect the stimulus files run by test_stimulus.
+
+A stimulus file holds a batch of ops (see AsconStimulusFile), optionally with
+their expected results, checked by the bridge sequence in place of the
+reference model. The ops come from a random generator, a LWC KAT file or a
+transaction database of a previous run.
+
+Examples:
+    python verification/tools/stimulus.py random ops.stim --count 10000 --expected
+    python verification/tools/stimulus.py kat kat.stim LWC_AEAD_KAT_128_128.txt
+    python verification/tools/stimulus.py txdb rerun.stim sim_build/AsconRandomSampleEncTest.txdb
+    python verification/tools/stimulus.py info ops.stim --ops 3
+"""
+
+import argparse
+import itertools
+import random
+import sys
+from pathlib import Path
+from typing import Dict, Iterator
+
+VERIFICATION_DIR = Path(__file__).resolve().parents[1]
+
+if str(VERIFICATION_DIR) not in sys.path:
+    sys.path.insert(0, str(VERIFICATION_DIR))
+
+from uvc.ascon.utils.ascon_model import AsconModel  # noqa: E402
+from uvc.ascon.utils.ascon_stimulus import (  # noqa: E402
+    TAG_LEN,
+    AsconStimulusFile,
+    AsconStimulusOp,
+    AsconStimulusWriter,
+)
+from uvc.ascon.utils.ascon_txdb import AsconTxDB  # noqa: E402
+
+
+def add_expected(op: AsconStimulusOp) -> AsconStimulusOp:
+    with AsconModel() as model:
+        if op.decrypt == 0:
+            op.exp_do, op.exp_tag = model.ascon_encrypt(op.key, op.nonce, op.ad, op.di)
+        else:
+            op.exp_do, op.exp_tag = model.ascon_decrypt(op.key, op.nonce, op.ad, op.di)
+    return op
+
+
+def random_ops(args) -> Iterator[AsconStimulusOp]:
+    rng = random.Random(args.seed)
+    for _ in range(args.count):
+        yield AsconStimulusOp(
+            delay=rng.randrange(16),
+            decrypt=rng.randrange(2) if args.decrypt else 0,
+            key=rng.randbytes(16),
+            nonce=rng.randbytes(16),
+            ad=rng.randbytes(rng.randint(0, args.max_size)),
+            di=rng.randbytes(rng.randint(0, args.max_size)),
+        )
+
+
+def kat_ops(args) -> Iterator[AsconStimulusOp]:
+    """Encryptions of a LWC KAT file, the ciphertexts being the expected results."""
+    vector: Dict[str, str] = {}
+    with open(args.kat) as f:
+        for line in itertools.chain(f, [""]):
+            if "=" in line:
+                name, value = (s.strip() for s in line.split("=", 1))
+                vector[name] = value
+            elif vector:
+                ct = bytes.fromhex(vector["CT"])
+                yield AsconStimulusOp(
+                    delay=args.delay,
+                    decrypt=0,
+                    key=bytes.fromhex(vector["Key"]),
+                    nonce=bytes.fromhex(vector["Nonce"]),
+                    ad=bytes.fromhex(vector["AD"]),
+                    di=bytes.fromhex(vector["PT"]),
+                    exp_do=ct[:-TAG_LEN],
+                    exp_tag=ct[-TAG_LEN:],
+                )
+                vector = {}
+
+
+def txdb_ops(args) -> Iterator[AsconStimulusOp]:
+    with AsconTxDB(args.db, readonly=True) as db:
+        for op in db.iter_ops():
+            yield AsconStimulusOp(op.delay, op.decrypt, op.key, op.nonce, op.ad, op.di)
+
+
+def cmd_info(args):
+    with AsconStimulusFile(args.file) as stimulus:
+        expected = "with" if stimulus.has_expected else "without"
+        print(f"{args.file}: {len(stimulus)} ops, {expected} expected results")
+        for index in range(min(args.ops, len(stimulus))):
+            op = stimulus[index]
+            print(f"op #{index}: delay={op.delay} decrypt={op.decrypt}")
+            print(f"  key=0x{op.key.hex()} nonce=0x{op.nonce.hex()}")
+            print(f"  ad=0x{op.ad.hex()}")
+            print(f"  di=0x{op.di.hex()}")
+            if stimulus.has_expected:
+                print(f"  exp_do=0x{op.exp_do.hex()}")
+                print(f"  exp_tag=0x{op.exp_tag.hex()}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("random", help="random ops")
+    p.add_argument("out", type=Path)
+    p.add_argument("--count", type=int, default=1000)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--max-size", type=int, default=48, help="max AD/DI size")
+    p.add_argument("--decrypt", action="store_true", help="random directions")
+
+    p = sub.add_parser("kat", help="encryptions of a LWC KAT file")
+    p.add_argument("out", type=Path)
+    p.add_argument("kat", type=Path)
+    p.add_argument("--delay", type=int, default=0)
+
+    p = sub.add_parser("txdb", help="ops of a transaction database")
+    p.add_argument("out", type=Path)
+    p.add_argument("db", type=Path)
+
+    for name in ("random", "txdb"):
+        sub.choices[name].add_argument(
+            "--expected", action="store_true", help="add the expected results"
+        )
+
+    p = sub.add_parser("info", help="print a stimulus file")
+    p.add_argument("file", type=Path)
+    p.add_argument("--ops", type=int, default=0, help="number of ops to print")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.cmd == "info":
+        cmd_info(args)
+        return 0
+
+    ops = {"random": random_ops, "kat": kat_ops, "txdb": txdb_ops}[args.cmd](args)
+    expected = args.cmd == "kat" or args.expected
+    with AsconStimulusWriter(args.out, expected=expected) as writer:
+        for op in ops:
+            writer.add(add_expected(op) if expected and op.exp_tag is None else op)
+    print(f"{writer.n_ops} ops written to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
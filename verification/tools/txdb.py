@@ -0,0 +1,135 @@
+"""Query and replay the ops recorded in a transaction database.
+
+The simulations record their op, result and round items in
+`sim_build/<test>.txdb` (see AsconTxRecorder). An op is found by the
+transaction id printed in the log lines (`id=0x...`) of any of its items, or
+by its index in the run, and replayed with AsconSingleEncTest.
+
+Examples:
+    python verification/tools/txdb.py list sim_build/AsconFullRefEncTest.txdb
+    python verification/tools/txdb.py show sim_build/AsconFullRefEncTest.txdb 0x000004d2
+    python verification/tools/txdb.py replay sim_build/AsconFullRefEncTest.txdb --index 42
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+VERIFICATION_DIR = Path(__file__).resolve().parents[1]
+SIM_DIR = VERIFICATION_DIR.parent / "sim"
+
+if str(VERIFICATION_DIR) not in sys.path:
+    sys.path.insert(0, str(VERIFICATION_DIR))
+
+from uvc.ascon.utils.ascon_txdb import AsconTxDB, AsconTxOp  # noqa: E402
+
+
+def find_op(db: AsconTxDB, args) -> AsconTxOp:
+    if args.index is not None:
+        op_index = args.index
+    else:
+        try:
+            op_index = db.find_op_index(int(args.id, 0))
+        except ValueError as e:
+            sys.exit(f"Error: {e} in {args.db}")
+        if op_index is None:
+            sys.exit(f"Error: no item with id={args.id} in {args.db}")
+    op = db.get_op(op_index)
+    if op is None:
+        sys.exit(f"Error: no op #{op_index} in {args.db}")
+    return op
+
+
+def replay_env(op: AsconTxOp) -> Dict[str, str]:
+    return {
+        "TESTCASE": "test_single_enc",
+        "KEY": op.key.hex(),
+        "NONCE": op.nonce.hex(),
+        "AD": op.ad.hex(),
+        "DI": op.di.hex(),
+        "DELAY": str(op.delay),
+        "DECRYPT": str(op.decrypt),
+    }
+
+
+def cmd_list(db: AsconTxDB, args):
+    print(f"{'index':>6} {'id':>14} {'time [ns]':>12} {'dec':>3} {'ad':>4} {'di':>4}")
+    for op in db.iter_ops():
+        print(
+            f"{op.op_index:>6} {op.tx_id:>#14x} {op.time_ns:>12.0f} "
+            f"{op.decrypt:>3} {len(op.ad):>4} {len(op.di):>4}"
+        )
+
+
+def cmd_show(db: AsconTxDB, args):
+    op = find_op(db, args)
+    print(f"op #{op.op_index}: id={op.tx_id:#x} name='{op.name}' time={op.time_ns:.0f}ns")
+    print(f"  delay={op.delay} decrypt={op.decrypt}")
+    print(f"  key=0x{op.key.hex()} nonce=0x{op.nonce.hex()}")
+    print(f"  ad=0x{op.ad.hex()}")
+    print(f"  di=0x{op.di.hex()}")
+    result = db.get_result(op.op_index)
+    if result is not None:
+        print(f"result: id={result.tx_id:#x} time={result.time_ns:.0f}ns")
+        print(f"  do=0x{result.do.hex()}")
+        print(f"  tag=0x{result.tag.hex()}")
+    if args.rounds:
+        for r in db.get_rounds(op.op_index):
+            print(f"round: {r.phase} {r.round} time={r.time_ns:.0f}ns")
+            for name in ("add_state", "sub_state", "diff_state"):
+                print(f"  {name}=0x{getattr(r, name).hex()}")
+
+
+def cmd_replay(db: AsconTxDB, args) -> int:
+    op = find_op(db, args)
+    env = replay_env(op)
+    cmd = ["make", "-C", str(args.sim_dir)]
+    print(" ".join([f"{k}={v}" for k, v in env.items()] + cmd))
+    if args.dry_run:
+        return 0
+    return subprocess.call(cmd, env=dict(os.environ, **env))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("list", help="list the recorded ops")
+    p.add_argument("db", type=Path)
+
+    for name, help in (("show", "print an op"), ("replay", "rerun an op")):
+        p = sub.add_parser(name, help=help)
+        p.add_argument("db", type=Path)
+        p.add_argument("id", nargs="?", help="transaction id, e.g. 0x000004d2")
+        p.add_argument("--index", type=int, help="index of the op in the run")
+        if name == "show":
+            p.add_argument("--rounds", action="store_true")
+        else:
+            p.add_argument("--sim-dir", type=Path, default=SIM_DIR)
+            p.add_argument("--dry-run", action="store_true")
+
+    args = parser.parse_args(argv)
+    if args.cmd != "list" and (args.id is None) == (args.index is None):
+        parser.error("either an id or --index is required")
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if not args.db.is_file():
+        sys.exit(f"Error: file '{args.db}' not found.")
+    with AsconTxDB(args.db, readonly=True) as db:
+        if args.cmd == "list":
+            cmd_list(db, args)
+        elif args.cmd == "show":
+            cmd_show(db, args)
+        else:
+            return cmd_replay(db, args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
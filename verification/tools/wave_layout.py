@@ -0,0 +1,139 @@
+"""Convert the ModelSim wave layout to view the trace dumps.
+
+sim/wave.do lists the signals of ascon_core, rooted at `/ascon_core`. The
+trace dumps (TRACE=1) hold the whole design, so the signals are rebased on the
+scope of the core instance in the dump, the dotted path given by --scope:
+- gtkwave: a GTKWave Tcl script adding the signals, dividers and radixes, for
+  `gtkwave -S <script> trace.fst`. The Verilator dumps are rooted at `TOP`.
+- modelsim: a wave layout of the dataset of the dump, for
+  `vsim -view <dataset>=trace.vcd -do <layout>`.
+
+Examples:
+    python verification/tools/wave_layout.py gtkwave sim/wave.do -o trace.tcl
+    python verification/tools/wave_layout.py gtkwave sim/wave.do -o trace.tcl \\
+        --scope TOP.ascon_tb_harness.u_ascon_apb_wrapper.u_ascon_core
+    python verification/tools/wave_layout.py modelsim sim/wave.do -o trace.do
+"""
+
+import argparse
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+# Root of the signal paths of the layout
+LAYOUT_ROOT = "/ascon_core"
+
+DEFAULT_SCOPES = {
+    "gtkwave": "TOP.ascon_apb_wrapper.u_ascon_core",
+    "modelsim": "ascon_apb_wrapper.u_ascon_core",
+}
+
+GTKWAVE_FORMATS = {
+    "binary": "Binary",
+    "hexadecimal": "Hex",
+    "unsigned": "Decimal",
+    "decimal": "Signed_Decimal",
+    "octal": "Octal",
+    "ascii": "ASCII",
+}
+
+# Words of a Tcl command, the braces grouping words
+_TCL_WORD = re.compile(r"\{([^}]*)\}|(\S+)")
+
+
+@dataclass
+class WaveEntry:
+    # Path of the signal under the core, None for a divider
+    path: Optional[str]
+    divider: Optional[str] = None
+    radix: Optional[str] = None
+
+
+def parse_layout(filename) -> List[WaveEntry]:
+    entries = []
+    with open(filename) as f:
+        for line in f:
+            words = [m.group(1) or m.group(2) for m in _TCL_WORD.finditer(line)]
+            if words[:2] != ["add", "wave"]:
+                continue
+            entry = WaveEntry(path=None)
+            it = iter(words[2:])
+            for word in it:
+                if word == "-divider":
+                    entry.divider = next(it)
+                elif word == "-radix":
+                    entry.radix = next(it)
+                elif not word.startswith("-"):
+                    if not word.startswith(LAYOUT_ROOT + "/"):
+                        raise ValueError(f"{word}: not under {LAYOUT_ROOT}")
+                    entry.path = word[len(LAYOUT_ROOT) + 1 :]
+            entries.append(entry)
+    return entries
+
+
+def gtkwave_script(entries: List[WaveEntry], scope: str) -> List[str]:
+    lines = []
+    for entry in entries:
+        if entry.divider is not None:
+            lines.append("gtkwave::/Edit/Insert_Blank")
+            lines.append(f'gtkwave::/Edit/Insert_Comment "{entry.divider}"')
+            continue
+        name = f"{scope}.{entry.path.replace('/', '.')}"
+        lines.append(f"gtkwave::addSignalsFromList [list {name}]")
+        if entry.radix is not None:
+            lines.append("gtkwave::/Edit/UnHighlight_All")
+            lines.append(f"gtkwave::highlightSignalsFromList [list {name}]")
+            lines.append(f"gtkwave::/Edit/Data_Format/{GTKWAVE_FORMATS[entry.radix]}")
+    lines.append("gtkwave::/Edit/UnHighlight_All")
+    lines.append("gtkwave::/Time/Zoom/Zoom_Full")
+    return lines
+
+
+def modelsim_layout(entries: List[WaveEntry], scope: str, dataset: str) -> List[str]:
+    root = f"{dataset}:/{scope.replace('.', '/')}"
+    lines = ["onerror {resume}", "quietly WaveActivateNextPane {} 0"]
+    for entry in entries:
+        if entry.divider is not None:
+            lines.append(f"add wave -noupdate -divider {{{entry.divider}}}")
+            continue
+        radix = f"-radix {entry.radix} " if entry.radix else ""
+        lines.append(f"add wave -noupdate {radix}{root}/{entry.path}")
+    lines += ["TreeUpdate [SetDefaultTree]", "configure wave -timelineunits ns"]
+    lines.append("wave zoom full")
+    return lines
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("format", choices=sorted(DEFAULT_SCOPES))
+    parser.add_argument("layout", type=Path, help="ModelSim wave layout")
+    parser.add_argument("-o", "--output", type=Path, help="default: stdout")
+    parser.add_argument("--scope", help="path of the core instance in the dump")
+    parser.add_argument("--dataset", default="trace", help="modelsim dataset name")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    scope = args.scope or DEFAULT_SCOPES[args.format]
+    try:
+        entries = parse_layout(args.layout)
+    except ValueError as e:
+        sys.exit(f"Error: {args.layout}: {e}")
+    if args.format == "gtkwave":
+        lines = gtkwave_script(entries, scope)
+    else:
+        lines = modelsim_layout(entries, scope, args.dataset)
+    text = "\n".join(lines) + "\n"
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        args.output.write_text(text)
+        print(f"{len(entries)} entries written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
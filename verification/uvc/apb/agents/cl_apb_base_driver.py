@@ -2,8 +2,9 @@
 - The UVM Driver is an active entity that converts abstract transaction to design pin toggles.
 - Transaction level objects are obtained from the Sequencer and the UVM Driver drives them to the design via an interface handler."""
 
-from cocotb.triggers import Event, RisingEdge, Timer
+from cocotb.triggers import FallingEdge, RisingEdge
 from pyuvm import *
+from uvc.utils import ResponseMode
 
 from .apb_common import *
 
@@ -22,61 +23,50 @@ class cl_apb_base_driver(uvm_driver):
         # Process
         self.get_and_drive_process = None
 
-        # Record time of last clocking event
-        self.ev_last_clock = None
-
     def build_phase(self):
         super().build_phase()
 
         # Get the configuration object
         self.cfg = ConfigDB().get(self, "", "cfg")
 
-        # Creating the cocotb-triggers event object
-        self.ev_last_clock = Event("ev_last_clock")
-
     async def run_phase(self):
         """Run phase:
         * Receives the sequence item.
-        * For each sequence item it calls the clock_event, drive_transaction and
+        * For each sequence item it calls the drive_transaction and
         handle_reset tasks in parallel in a fork join_none."""
 
         await super().run_phase()
 
         # Starts coroutines in parallel
-        cocotb.start_soon(self.clock_event())
         cocotb.start_soon(self.drive_transaction())
         cocotb.start_soon(self.handle_reset())
 
-    async def clock_event(self):
-        while True:
+    async def wait_clock_edge(self):
+        """Waits for the next rising clock edge unless already aligned to one"""
+        if not self.cfg.vif.is_clock_edge():
             await RisingEdge(self.cfg.vif.clk)
-            self.ev_last_clock.set()
-
-            # Waits until next time step , default unit is step
-            await Timer(1)
-            self.ev_last_clock.clear()
 
     async def handle_reset(self):
         """Kills driver process when reset is active"""
         while True:
-            if self.cfg.vif.rst.value.binstr == "0":
-                if self.get_and_drive_process is not None:
-                    self.logger.debug("Process should be killed")
-                    self.get_and_drive_process.kill()
-                    self.get_and_drive_process = None
-                    # Ends any active items
-                    try:
-                        self.seq_item_port.item_done()
-                    except UVMSequenceError:
-                        self.logger.info("No current active item")
-            await RisingEdge(self.cfg.vif.clk)
+            await FallingEdge(self.cfg.vif.rst)
+            if self.get_and_drive_process is not None:
+                self.logger.debug("Process should be killed")
+                self.get_and_drive_process.kill()
+                self.get_and_drive_process = None
+                # Ends any active items
+                try:
+                    self.seq_item_port.item_done()
+                except UVMSequenceError:
+                    self.logger.info("No current active item")
 
     async def drive_transaction(self):
         while True:
             await self.drive_reset()
 
-            while self.cfg.vif.rst.value.binstr != "1":
-                await RisingEdge(self.cfg.vif.clk)
+            while self.cfg.vif.rst.value != 1:
+                await RisingEdge(self.cfg.vif.rst)
+            await self.cfg.vif.measure_clock()
 
             # Passes coroutine to process handle -> possible to kill() process
             self.get_and_drive_process = cocotb.start_soon(
@@ -106,19 +96,26 @@ class cl_apb_base_driver(uvm_driver):
 
             # Waits for seq item
             self.req = await self.seq_item_port.get_next_item()
-            self.logger.info(f"[RQ] {self.req!s}")
-            self.logger.debug(f"[<=] {self.req!r}")
-
-            # Creates clone of seq item
-            self.rsp = self.req.clone()
-            # Set the transaction ID
-            self.rsp.set_id_info(self.req)
-            # Set the response ID
-            self.rsp.set_context(self.req)
+            self.logger.info("[RQ] %s", self.req)
+            self.logger.debug("[<=] %r", self.req)
+
+            if self.cfg.rsp_mode == ResponseMode.CLONE:
+                # Creates clone of seq item
+                self.rsp = self.req.clone()
+                # Set the transaction ID
+                self.rsp.set_id_info(self.req)
+                # Set the response ID
+                self.rsp.set_context(self.req)
+            else:
+                # The request is updated in place
+                self.rsp = self.req
 
             self.logger.debug("Driving pins")
             await self.drive_pins()
 
-            self.logger.info(f"[RP] {self.rsp!s}")
-            self.logger.debug(f"[=>] {self.rsp!r}")
-            self.seq_item_port.item_done(self.rsp)
+            self.logger.info("[RP] %s", self.rsp)
+            self.logger.debug("[=>] %r", self.rsp)
+            if self.cfg.rsp_mode == ResponseMode.NONE:
+                self.seq_item_port.item_done()
+            else:
+                self.seq_item_port.item_done(self.rsp)
@@ -1,6 +1,8 @@
 """APB-UVC Configuration object"""
 
 from pyuvm import uvm_object, uvm_active_passive_enum
+from uvc.utils import ResponseMode
+
 from .apb_common import SequenceItemOverride
 
 class cl_apb_config(uvm_object):
@@ -49,6 +51,10 @@ class cl_apb_config(uvm_object):
 
         self.enable_masked_data = True
 
+        # Control knob for the driver response, the request updated in place
+        # by default instead of a clone
+        self.rsp_mode = ResponseMode.REQUEST
+
     def set_width_parameters(self, addr_width, data_width):
         self.ADDR_WIDTH = addr_width
         self.DATA_WIDTH = data_width
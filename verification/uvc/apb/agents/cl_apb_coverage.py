@@ -1,7 +1,9 @@
 """APB-UVC Coverage collector"""
 
+import numpy as np
 import vsc
 from pyuvm import ConfigDB, uvm_subscriber
+from uvc.utils import sample_count
 
 from .apb_common import OpType
 
@@ -29,20 +31,32 @@ class cl_apb_coverage(uvm_subscriber):
             f"{self.get_full_name()}.cg_trans_delay"
         )
 
+        # Hits of the data bits, indexed by (op, bit, value). They are only
+        # flushed into cg_trans_data, with their counts, by extract_phase().
+        self.data_hits = np.zeros((2, self.cfg.DATA_WIDTH, 2), dtype=np.uint64)
+        self.data_bits = np.arange(self.cfg.DATA_WIDTH)
+        self.data_len = -(-self.cfg.DATA_WIDTH // 8)
+
     def write(self, item):
         if self.cfg.enable_transaction_coverage:
             # sample transaction kind
             self.cg_trans_kind.sample(item.op, item.addr, item.slverr)
 
-            # sample transaction data by bits
-            for i in range(self.cfg.ADDR_WIDTH):
-                data = (item.data >> i) % 2
-                self.cg_trans_data.sample(item.op, data, i)
+            # count transaction data by bits
+            data = np.frombuffer(item.data.to_bytes(self.data_len, "little"), np.uint8)
+            values = np.unpackbits(data, bitorder="little")[: self.cfg.DATA_WIDTH]
+            self.data_hits[int(item.op), self.data_bits, values] += 1
 
         if self.cfg.enable_delay_coverage:
             self.logger.debug(f"Sample delay: wait_len = {item.wait_len}")
             self.cg_trans_delay.sample(item.wait_len)
 
+    def extract_phase(self):
+        # One sample per hit (op, bit, value), counted data_hits times
+        for op, bit, value in np.argwhere(self.data_hits):
+            count = int(self.data_hits[op, bit, value])
+            sample_count(self.cg_trans_data, count, int(op), int(value), int(bit))
+
 
 @vsc.covergroup
 class covergroup_trans_kind(object):
@@ -1,5 +1,7 @@
 from pyuvm import *
+from cocotb.triggers import Event, RisingEdge
 from cocotb.types import Logic, LogicArray
+from cocotb.utils import get_sim_time
 
 class cl_apb_interface():
     """Python interface for APB configuration"""
@@ -25,6 +27,12 @@ class cl_apb_interface():
         self.DATA_WIDTH = None
         self.STRB_WIDTH = None
 
+        # Clock timing, measured once so that cycles are derived from the
+        # simulation time instead of being counted by a coroutine
+        self.clk_first_edge = None
+        self.clk_period = None
+        self._ev_clk_measured = None
+
 
     def connect(self, wr_signal, sel_signal, enable_signal, addr_signal,
                 wdata_signal, strb_signal, rdata_signal, ready_signal, slverr_signal):
@@ -56,6 +64,30 @@ class cl_apb_interface():
         self.ready.value     = Logic('x')
         self.slverr.value    = Logic('x')
 
+    async def measure_clock(self):
+        """Measure the clock period on two rising edges (only the first call waits)"""
+        if self._ev_clk_measured is None:
+            self._ev_clk_measured = Event("ev_clk_measured")
+            await RisingEdge(self.clk)
+            first_edge = get_sim_time("step")
+            await RisingEdge(self.clk)
+            self.clk_period = get_sim_time("step") - first_edge
+            self.clk_first_edge = first_edge
+            self._ev_clk_measured.set()
+        await self._ev_clk_measured.wait()
+
+    def is_clock_edge(self):
+        """True during the time step of a rising clock edge"""
+        if self.clk_period is None:
+            return False
+        return (get_sim_time("step") - self.clk_first_edge) % self.clk_period == 0
+
+    def clock_cycles(self):
+        """Number of rising clock edges since the clock was measured"""
+        if self.clk_period is None:
+            return 0
+        return (get_sim_time("step") - self.clk_first_edge) // self.clk_period
+
     def _set_width_parameters(self, ADDR_WIDTH = 8, DATA_WIDTH = 8):
         self.ADDR_WIDTH = ADDR_WIDTH
         self.DATA_WIDTH = DATA_WIDTH
@@ -2,7 +2,7 @@
 - UVM monitor is responsible for capturing signal activity from the design interface and translates it into transaction level data objects that can be sent to other components."""
 
 from pyuvm import *
-from cocotb.triggers import RisingEdge
+from cocotb.triggers import FallingEdge, RisingEdge
 from .cl_apb_seq_item import *
 from .apb_common import *
 
@@ -24,9 +24,6 @@ class cl_apb_monitor(uvm_monitor):
         # Monitor process
         self.monitor_loop_process = None
 
-        # Clock cycle counter
-        self.clk_cyc_cnt = 0
-
         # Waitstates counter
         self.waitstates = None
 
@@ -43,29 +40,26 @@ class cl_apb_monitor(uvm_monitor):
     async def run_phase(self):
         await super().run_phase()
 
-        cocotb.start_soon(self.cycle_counter())
-
         cocotb.start_soon(self.handle_reset())
         cocotb.start_soon(self.monitor_transaction())
 
-
-    async def cycle_counter(self):
-        while True:
-            await RisingEdge(self.cfg.vif.clk)
-            self.clk_cyc_cnt += 1
+    @property
+    def clk_cyc_cnt(self):
+        """Clock cycle counter, derived from the simulation time"""
+        return self.cfg.vif.clock_cycles()
 
     async def handle_reset(self):
         while True:
             # is reset goes low, stop active monitor loop
-            if self.cfg.vif.rst.value.binstr == '0':
-                if self.monitor_loop_process is not None:
-                    self.monitor_loop_process.kill()
-            await RisingEdge(self.cfg.vif.clk)
+            await FallingEdge(self.cfg.vif.rst)
+            if self.monitor_loop_process is not None:
+                self.monitor_loop_process.kill()
 
     async def monitor_transaction(self):
         while True:
-            while self.cfg.vif.rst.value.binstr != '1':
-                await RisingEdge(self.cfg.vif.clk)
+            while self.cfg.vif.rst.value != 1:
+                await RisingEdge(self.cfg.vif.rst)
+            await self.cfg.vif.measure_clock()
 
             # assigning monitor loop process to handle and awaiting it to finish
             self.monitor_loop_process = cocotb.start_soon(self.monitor_loop())
@@ -75,7 +69,7 @@ class cl_apb_monitor(uvm_monitor):
         """ Monitor loop & pin wiggling """
 
         while True:
-            item = cl_apb_seq_item.create("item")
+            item = cl_apb_record()
 
             await self.monitor_observe_pins(item)
 
@@ -86,22 +80,27 @@ class cl_apb_monitor(uvm_monitor):
     async def monitor_observe_pins(self, item):
         self.waitstates = -1
 
-        while self.cfg.vif.enable.value.binstr != '1' or self.cfg.vif.ready.value.binstr != '1':
-            if self.cfg.vif.sel.value.binstr == '1' and self.cfg.vif.ready.value.binstr != '1':
+        while self.cfg.vif.enable.value != 1 or self.cfg.vif.ready.value != 1:
+            # Idle bus: sleep until the next setup phase
+            if self.cfg.vif.sel.value != 1:
+                await RisingEdge(self.cfg.vif.sel)
+                await RisingEdge(self.cfg.vif.clk)
+                continue
+            if self.cfg.vif.ready.value != 1:
                 self.waitstates += 1
             await RisingEdge(self.cfg.vif.clk)
 
         item.wait_len = self.waitstates
 
-        item.addr = self.cfg.vif.addr
-        item.slverr = self.cfg.vif.slverr
+        item.addr = self.cfg.vif.addr.value.integer
+        item.slverr = self.cfg.vif.slverr.value.integer
 
         if self.cfg.vif.wr.value == OpType.WR:
             item.op = OpType.WR
-            item.data = self.cfg.vif.wdata
+            item.data = self.cfg.vif.wdata.value.integer
         elif self.cfg.vif.wr.value == OpType.RD:
             item.op = OpType.RD
-            item.data = self.cfg.vif.rdata
+            item.data = self.cfg.vif.rdata.value.integer
         else:
             self.logger.warning("Operation Type not RD or WR")
 
@@ -27,7 +27,7 @@ class cl_apb_producer_driver(cl_apb_base_driver):
 
     async def drive_pins(self):
         # If unaligned to clock wait for clocking event
-        await self.ev_last_clock.wait()
+        await self.wait_clock_edge()
 
         # Drive transactions through interface
         if self.req.op == OpType.WR:
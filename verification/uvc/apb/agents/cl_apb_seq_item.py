@@ -3,6 +3,8 @@
 import vsc
 from pyuvm import uvm_sequence_item
 
+from uvc.utils import MonitorRecord
+
 from .apb_common import *
 
 
@@ -63,6 +65,12 @@ class cl_apb_seq_item(uvm_sequence_item, object):
         self.no_wait_len = rhs.no_wait_len
         self.max_wait_len = rhs.max_wait_len
 
+    def do_reset(self):
+        """Clears the response members before the item is reused from a pool"""
+        self.data = 0
+        self.slverr = 0
+        self.wait_len = 0
+
     def __eq__(self, other) -> bool:
         # Defines how apb seq items are compared
         if isinstance(other, cl_apb_seq_item):
@@ -86,3 +94,24 @@ class cl_apb_seq_item(uvm_sequence_item, object):
     def __repr__(self):
         cls_name = self.__class__.__name__
         return f"<{cls_name}(name='{self.get_name()}'), id=0x{self.get_transaction_id():08x}>"
+
+
+class cl_apb_record(MonitorRecord):
+    """APB transfer observed by the monitor"""
+
+    __slots__ = ("op", "addr", "data", "strb", "slverr", "wait_len")
+
+    name = "item"
+    item_cls = cl_apb_seq_item
+
+    def __init__(self, op=OpType.RD, addr=0, data=0, strb=0, slverr=0, wait_len=0):
+        super().__init__()
+        self.op = op
+        self.addr = addr
+        self.data = data
+        self.strb = strb
+        self.slverr = slverr
+        self.wait_len = wait_len
+
+    def __str__(self) -> str:
+        return f"{self.name} : op = {self.op.name}, addr = 0x{self.addr:08x}, data = 0x{self.data:08x}, strb = 0b{self.strb:04b}, slverr = {self.slverr}, wait_len = {self.wait_len}"
@@ -5,6 +5,7 @@
 import vsc
 from cocotb.triggers import Timer
 from pyuvm import uvm_sequence
+from uvc.utils import fast_randomize
 
 from ..agents.apb_common import *
 from ..agents.cl_apb_seq_item import cl_apb_seq_item
@@ -83,7 +84,7 @@ class cl_apb_consumer_rsp_seq(cl_apb_base_seq):
                 await self.start_item(self.s_item)
 
                 # Randomize transaction
-                self.s_item.randomize()
+                fast_randomize(self.s_item)
 
                 self.sequencer.logger.debug(f"Sending item: {self.s_item}")
 
@@ -102,7 +103,7 @@ class cl_apb_consumer_rsp_seq(cl_apb_base_seq):
                 await self.start_item(self.s_item)
 
                 # Randomize transaction
-                self.s_item.randomize()
+                fast_randomize(self.s_item)
 
                 self.sequencer.logger.debug(f"Sending item: {self.s_item}")
 
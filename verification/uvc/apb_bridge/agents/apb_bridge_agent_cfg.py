@@ -1,6 +1,12 @@
+from typing import Optional
+
 from pyuvm import uvm_active_passive_enum, uvm_object
 from uvc.apb.agents.cl_apb_config import cl_apb_config
 from uvc.ascon.agents.core.core_agent_cfg import AsconCoreAgentConfig
+from uvc.utils import PreRandomizer
+
+from ..regs import AsconRegBlock
+from .status_if import AsconStatusInterface, AsconStatusWait
 
 
 class APBBridgeAgentConfig(uvm_object):
@@ -9,3 +15,12 @@ class APBBridgeAgentConfig(uvm_object):
         self.core_cfg: AsconCoreAgentConfig = AsconCoreAgentConfig.create("ascon_cfg")
         self.apb_cfg: cl_apb_config = cl_apb_config.create("apb_cfg")
         self.is_active: uvm_active_passive_enum = uvm_active_passive_enum.UVM_ACTIVE
+        # Shared across operations so that unchanged registers are not rewritten
+        self.reg_model: AsconRegBlock = None
+        self.status_wait: AsconStatusWait = AsconStatusWait.POLL
+        self.status_vif: AsconStatusInterface = None
+        self.check_result: bool = True
+        # Reuse the op sequences and APB items instead of creating them per op
+        self.pool_size: int = 64
+        # Pre-solved values of the APB item fields
+        self.prerand: Optional[PreRandomizer] = None
@@ -1,8 +1,12 @@
 from pyuvm import ConfigDB, uvm_driver, uvm_sequencer
+from uvc.apb.agents.cl_apb_seq_item import cl_apb_seq_item
 from uvc.ascon.agents.core.core_seq_item import AsconCoreOpItem
+from uvc.utils import ObjectPool
 
+from ..regs import AsconRegBlock
 from ..sequences.ascon_apb_seq import AsconAPBOpSeq
 from .apb_bridge_agent_cfg import APBBridgeAgentConfig
+from .status_if import AsconStatusWait
 
 
 class APBBridgeDriver(uvm_driver):
@@ -10,23 +14,57 @@ class APBBridgeDriver(uvm_driver):
         super().__init__(name, parent)
         self.cfg: APBBridgeAgentConfig = None
         self.apb_seqr: uvm_sequencer = None
+        self.status_reads = 0
+        self.polls_avoided = 0
+        self.seq_pool: ObjectPool[AsconAPBOpSeq] = None
+        self.item_pool: ObjectPool[cl_apb_seq_item] = None
 
     def build_phase(self):
         self.cfg = ConfigDB().get(self, "", "cfg")
+        self.seq_pool = ObjectPool(AsconAPBOpSeq, max_size=self.cfg.pool_size)
+        self.item_pool = ObjectPool(cl_apb_seq_item, max_size=self.cfg.pool_size)
+        if self.cfg.reg_model is None:
+            self.cfg.reg_model = AsconRegBlock(
+                data_width=self.cfg.apb_cfg.DATA_WIDTH,
+                byteorder=self.cfg.core_cfg.byteorder,
+            )
 
     async def run_phase(self):
         assert self.apb_seqr is not None, "Missing APB sequencer."
         while True:
             op = await self.seq_item_port.get_next_item()
             assert isinstance(op, AsconCoreOpItem)
-            self.logger.info(f"[RQ] {op!s}")
-            self.logger.debug(f"[<=] {op!r}")
+            self.logger.info("[RQ] %s", op)
+            self.logger.debug("[<=] %r", op)
             seq_name, *_ = op.get_name().rsplit(".")
-            seq = AsconAPBOpSeq.create(seq_name)
+            seq = self.seq_pool.acquire(seq_name)
             assert isinstance(seq, AsconAPBOpSeq)
             seq.op.do_copy(op)
             seq.rate = self.cfg.core_cfg.rate
             seq.byteorder = self.cfg.core_cfg.byteorder
             seq.set_apb_width(self.cfg.apb_cfg.DATA_WIDTH)
+            seq.regs = self.cfg.reg_model
+            seq.check_result = self.cfg.check_result
+            seq.item_pool = self.item_pool
+            seq.rsp_mode = self.cfg.apb_cfg.rsp_mode
+            seq.prerand = self.cfg.prerand
+            if self.cfg.status_wait == AsconStatusWait.EVENT:
+                assert self.cfg.status_vif is not None, "Missing status interface."
+                seq.status_if = self.cfg.status_vif
             await seq.start(self.apb_seqr)
+            self.logger.debug(
+                f"[ST] {seq.status_reads} status reads, "
+                f"{seq.polls_avoided} polls avoided"
+            )
+            self.status_reads += seq.status_reads
+            self.polls_avoided += seq.polls_avoided
+            self.seq_pool.release(seq)
             self.seq_item_port.item_done()
+
+    def report_phase(self):
+        for line in self.cfg.reg_model.report():
+            self.logger.info(line)
+        self.logger.info(
+            f"{self.status_reads} status reads, {self.polls_avoided} polls avoided"
+        )
+        self.logger.info(f"{self.seq_pool}, {self.item_pool}")
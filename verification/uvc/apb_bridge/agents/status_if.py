@@ -0,0 +1,40 @@
+from enum import Enum
+from typing import Callable
+
+from cocotb.triggers import Edge
+
+from ..regs import AsconStatus
+
+
+class AsconStatusWait(Enum):
+    POLL = 0
+    EVENT = 1
+
+
+class AsconStatusInterface:
+    """Status vector of ascon_apb_wrapper, as returned by the STATUS register."""
+
+    @classmethod
+    def from_dut(cls, dut) -> "AsconStatusInterface":
+        return AsconStatusInterface(
+            clk=dut.clk,
+            rst_n=dut.rst_n,
+            status_s=dut.status_s,
+        )
+
+    def __init__(self, clk, rst_n, status_s):
+        self.clk = clk
+        self.rst_n = rst_n
+        self.status_s = status_s
+        self.mask = 0
+        for flag in AsconStatus:
+            self.mask |= flag
+
+    def status(self) -> AsconStatus:
+        if not self.status_s.value.is_resolvable:
+            return AsconStatus(0)
+        return AsconStatus(self.status_s.value.integer & self.mask)
+
+    async def wait(self, cond: Callable[[AsconStatus], bool]):
+        while not cond(self.status()):
+            await Edge(self.status_s)
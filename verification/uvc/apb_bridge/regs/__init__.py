@@ -0,0 +1,17 @@
+from .ascon_reg_model import (
+    AsconReg,
+    AsconRegAccess,
+    AsconRegBackdoor,
+    AsconRegBlock,
+    AsconRegField,
+    AsconRegPath,
+    AsconRegStats,
+)
+from .ascon_regs import (
+    AsconAck,
+    AsconCtrl,
+    AsconCtrlOp,
+    AsconStatus,
+    RegAddr,
+    build_config_words,
+)
@@ -0,0 +1,355 @@
+from dataclasses import astuple, dataclass
+from enum import Enum
+from typing import Dict, Iterator, List, Optional
+
+from .ascon_regs import (
+    CONFIG_FIELDS,
+    REG_SPACE_END,
+    AsconAck,
+    AsconCtrl,
+    AsconStatus,
+    RegAddr,
+)
+
+
+class AsconRegAccess(Enum):
+    RO = 0
+    RW = 1
+    WO = 2
+
+
+class AsconRegPath(Enum):
+    FRONTDOOR = 0
+    BACKDOOR = 1
+
+
+@dataclass
+class AsconRegField:
+    name: str
+    lsb: int
+    width: int
+
+    @property
+    def mask(self) -> int:
+        return ((1 << self.width) - 1) << self.lsb
+
+    def get(self, value: int) -> int:
+        return (value & self.mask) >> self.lsb
+
+    def set(self, value: int, field_value: int) -> int:
+        assert 0 <= field_value < (1 << self.width), (
+            f"FAILED: {self.name}={field_value} does not fit in {self.width} bits."
+        )
+        return (value & ~self.mask) | (field_value << self.lsb)
+
+
+@dataclass
+class AsconRegStats:
+    reads: int = 0
+    writes: int = 0
+    skipped_writes: int = 0
+    backdoor_reads: int = 0
+    backdoor_writes: int = 0
+
+
+class AsconRegBackdoor:
+    """Direct access to the flip-flops holding a multi-word register.
+
+    The whole vector is deposited at once, composed from the mirrors of the
+    other words of the bank. Reading the handle back is not an option since
+    cocotb defers writes, so two deposits in the same time step would see the
+    same old value.
+    """
+
+    def __init__(self, handle, bank: List["AsconReg"], data_width: int):
+        self.handle = handle
+        self.bank = bank
+        self.data_width = data_width
+        self.word_mask = (1 << data_width) - 1
+
+    def write(self, reg: "AsconReg", value: int):
+        vector = 0
+        for i, word in enumerate(self.bank):
+            word_value = value if word is reg else word.get_mirrored_value()
+            vector |= (word_value & self.word_mask) << (i * self.data_width)
+        self.handle.value = vector
+
+    def read(self, reg: "AsconReg") -> int:
+        i = self.bank.index(reg)
+        return (self.handle.value.integer >> (i * self.data_width)) & self.word_mask
+
+
+class AsconReg:
+    """Register word with a desired and a mirrored value.
+
+    Volatile registers are modified by the hardware, so their mirror cannot be
+    trusted and `update()` never skips them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        addr: int,
+        fields: List[AsconRegField],
+        access: AsconRegAccess,
+        volatile: bool = False,
+        reset: int = 0,
+    ):
+        self.name = name
+        self.addr = addr
+        self.fields: Dict[str, AsconRegField] = {f.name: f for f in fields}
+        self.access = access
+        self.volatile = volatile
+        self.reset_value = reset
+        self.stats = AsconRegStats()
+        self.path = AsconRegPath.FRONTDOOR
+        self.backdoor: Optional[AsconRegBackdoor] = None
+        self._desired = reset
+        self._mirrored = reset
+
+    @property
+    def item_name(self) -> str:
+        return self.name.lower().replace("[", "(").replace("]", ")")
+
+    def reset(self):
+        self._desired = self.reset_value
+        self._mirrored = self.reset_value
+
+    def get(self) -> int:
+        return self._desired
+
+    def get_field(self, name: str) -> int:
+        return self.fields[name].get(self._desired)
+
+    def get_mirrored_value(self) -> int:
+        return self._mirrored
+
+    def set(self, value: Optional[int] = None, **fields: int):
+        if value is not None:
+            self._desired = value
+        for name, field_value in fields.items():
+            self._desired = self.fields[name].set(self._desired, field_value)
+
+    def predict(self, value: int):
+        self._desired = value
+        self._mirrored = value
+
+    def needs_update(self) -> bool:
+        if self.access == AsconRegAccess.RO:
+            return False
+        return self.volatile or self._desired != self._mirrored
+
+    async def write(self, bus, value: int, path: Optional[AsconRegPath] = None):
+        assert self.access != AsconRegAccess.RO, f"FAILED: write to {self.name}."
+        if (path or self.path) == AsconRegPath.BACKDOOR:
+            assert self.backdoor is not None, f"FAILED: no backdoor for {self.name}."
+            self.backdoor.write(self, value)
+            self.stats.backdoor_writes += 1
+        else:
+            await bus.write(f"{self.item_name}.wr_item", self.addr, value)
+            self.stats.writes += 1
+        self.predict(value)
+
+    async def read(self, bus, path: Optional[AsconRegPath] = None) -> int:
+        assert self.access != AsconRegAccess.WO, f"FAILED: read from {self.name}."
+        if (path or self.path) == AsconRegPath.BACKDOOR:
+            assert self.backdoor is not None, f"FAILED: no backdoor for {self.name}."
+            value = self.backdoor.read(self)
+            self.stats.backdoor_reads += 1
+        else:
+            value = await bus.read(f"{self.item_name}.rd_item", self.addr)
+            self.stats.reads += 1
+        self.predict(value)
+        return value
+
+    async def update(self, bus):
+        if self.needs_update():
+            await self.write(bus, self._desired)
+        elif self.access != AsconRegAccess.RO:
+            self.stats.skipped_writes += 1
+
+
+class AsconRegBlock:
+    """Register model of the Ascon APB peripheral.
+
+    The word registers are generated from `RegAddr`: each address spans up to
+    the next one and is split into APB words. The bus is any object providing
+    the `write(item_name, addr, data)` and `read(item_name, addr)` coroutines,
+    such as `AsconAPBOpSeq`.
+
+    The setup registers can also be written through a backdoor that deposits
+    the wrapper flip-flops directly, see `set_backdoor()` and `set_path()`.
+    """
+
+    # Flip-flops of ascon_apb_wrapper reachable through the backdoor
+    backdoor_signals = {
+        RegAddr.CONFIG: "config_q",
+        RegAddr.KEY: "key_q",
+        RegAddr.NONCE: "nonce_q",
+    }
+
+    # Access and volatility of each register
+    layout = {
+        RegAddr.STATUS: (AsconRegAccess.RO, True),
+        RegAddr.CTRL: (AsconRegAccess.RW, False),
+        RegAddr.ACK: (AsconRegAccess.WO, True),
+        RegAddr.CONFIG: (AsconRegAccess.RW, False),
+        RegAddr.KEY: (AsconRegAccess.RW, False),
+        RegAddr.NONCE: (AsconRegAccess.RW, False),
+        RegAddr.TAG: (AsconRegAccess.RO, True),
+        RegAddr.DI: (AsconRegAccess.RW, True),
+        RegAddr.DO: (AsconRegAccess.RO, True),
+    }
+
+    def __init__(self, name: str = "reg_model", data_width: int = 32, byteorder="little"):
+        self.name = name
+        self.data_width = data_width
+        self.word_len = data_width // 8
+        self.byteorder = byteorder
+        self.banks: Dict[RegAddr, List[AsconReg]] = {}
+        self._build()
+
+    @staticmethod
+    def _flag_fields(flags) -> List[AsconRegField]:
+        return [AsconRegField(f.name, f.value.bit_length() - 1, 1) for f in flags]
+
+    def _fields(self, addr: RegAddr, size: int) -> List[AsconRegField]:
+        if addr == RegAddr.STATUS:
+            return self._flag_fields(AsconStatus)
+        if addr == RegAddr.CTRL:
+            return self._flag_fields(AsconCtrl)
+        if addr == RegAddr.ACK:
+            return self._flag_fields(AsconAck)
+        if addr == RegAddr.CONFIG:
+            return [AsconRegField(n, lsb, w) for n, (lsb, w) in CONFIG_FIELDS.items()]
+        return [AsconRegField("VALUE", 0, 8 * size)]
+
+    def _build(self):
+        bounds = sorted(RegAddr) + [REG_SPACE_END]
+        for addr, end in zip(bounds, bounds[1:]):
+            access, volatile = self.layout[addr]
+            n_words = max(1, (end - addr) // self.word_len)
+            size = min(self.word_len, end - addr)
+            bank = []
+            for i in range(n_words):
+                name = addr.name if n_words == 1 else f"{addr.name}[{i}]"
+                bank.append(
+                    AsconReg(
+                        name,
+                        addr + i * self.word_len,
+                        self._fields(addr, size),
+                        access,
+                        volatile,
+                    )
+                )
+            self.banks[addr] = bank
+
+    @property
+    def status(self) -> AsconReg:
+        return self.banks[RegAddr.STATUS][0]
+
+    @property
+    def ctrl(self) -> AsconReg:
+        return self.banks[RegAddr.CTRL][0]
+
+    @property
+    def ack(self) -> AsconReg:
+        return self.banks[RegAddr.ACK][0]
+
+    @property
+    def config(self) -> AsconReg:
+        return self.banks[RegAddr.CONFIG][0]
+
+    def set_backdoor(self, wrapper):
+        """Bind the backdoor of the setup registers to an ascon_apb_wrapper handle."""
+        for addr, signal in self.backdoor_signals.items():
+            bank = self.banks[addr]
+            backdoor = AsconRegBackdoor(getattr(wrapper, signal), bank, self.data_width)
+            for reg in bank:
+                reg.backdoor = backdoor
+
+    def set_path(self, path: AsconRegPath, *addrs: RegAddr):
+        """Select the default access path of the given registers.
+
+        Without addresses, all the registers having a backdoor are switched.
+        """
+        if not addrs:
+            addrs = list(self.backdoor_signals)
+        for addr in addrs:
+            assert path == AsconRegPath.FRONTDOOR or addr in self.backdoor_signals, (
+                f"FAILED: no backdoor for {addr.name}."
+            )
+            for reg in self.banks[addr]:
+                reg.path = path
+
+    def iter_regs(self) -> Iterator[AsconReg]:
+        for bank in self.banks.values():
+            yield from bank
+
+    def reset(self):
+        for reg in self.iter_regs():
+            reg.reset()
+
+    def set_bank(self, addr: RegAddr, data: bytes):
+        """Set the desired value of a multi-word register from a byte string."""
+        bank = self.banks[addr]
+        assert len(data) <= len(bank) * self.word_len
+        for i, reg in enumerate(bank):
+            word = data[i * self.word_len : (i + 1) * self.word_len]
+            reg.set(int.from_bytes(word, byteorder=self.byteorder))
+
+    async def write_bank(self, bus, addr: RegAddr, data: bytes):
+        """Write a byte string to a multi-word register, one APB word at a time."""
+        self.set_bank(addr, data)
+        for reg in self.banks[addr][: -(-len(data) // self.word_len)]:
+            await reg.write(bus, reg.get())
+
+    async def read_bank(self, bus, addr: RegAddr, size: int) -> bytes:
+        data = b""
+        for reg in self.banks[addr][: -(-size // self.word_len)]:
+            word = await reg.read(bus)
+            data += int.to_bytes(word, length=self.word_len, byteorder=self.byteorder)
+        return data[:size]
+
+    async def update(self, bus, *addrs: RegAddr):
+        """Write the desired values that differ from the mirror.
+
+        Only the given registers are updated, or all the non-volatile ones when
+        none is given.
+        """
+        if not addrs:
+            addrs = [a for a, (_, volatile) in self.layout.items() if not volatile]
+        for addr in addrs:
+            for reg in self.banks[addr]:
+                await reg.update(bus)
+
+    def report(self) -> List[str]:
+        def row(name: str, s: AsconRegStats) -> str:
+            return (
+                f"{name:<12} {s.reads:>8} {s.writes:>8} "
+                f"{s.skipped_writes:>8} {s.backdoor_reads:>9} {s.backdoor_writes:>9}"
+            )
+
+        lines = [
+            f"{'register':<12} {'reads':>8} {'writes':>8} {'skipped':>8} "
+            f"{'bd reads':>9} {'bd writes':>9}"
+        ]
+        total = AsconRegStats()
+        for reg in self.iter_regs():
+            s = reg.stats
+            if any(astuple(s)):
+                lines.append(row(reg.name, s))
+            total.reads += s.reads
+            total.writes += s.writes
+            total.skipped_writes += s.skipped_writes
+            total.backdoor_reads += s.backdoor_reads
+            total.backdoor_writes += s.backdoor_writes
+        lines.append(row("total", total))
+        requested = total.writes + total.skipped_writes + total.backdoor_writes
+        if requested:
+            saved = 100.0 * (requested - total.writes) / requested
+            lines.append(
+                f"{requested - total.writes} of {requested} register writes "
+                f"kept off the bus ({saved:.1f}%)"
+            )
+        return lines
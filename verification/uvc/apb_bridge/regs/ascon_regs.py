@@ -0,0 +1,53 @@
+from enum import IntEnum, IntFlag
+
+
+class RegAddr(IntEnum):
+    STATUS = 0
+    CTRL = 4
+    ACK = 8
+    CONFIG = 12
+    KEY = 16
+    NONCE = 32
+    TAG = 48
+    DI = 64
+    DO = 80
+
+
+# First address past the register space (MAX_REG_ADDR in ascon_apb_wrapper)
+REG_SPACE_END = 96
+
+
+class AsconCtrlOp(IntEnum):
+    STOP = 0
+    START_ENC = 1
+    START_DEC = 3
+
+
+class AsconCtrl(IntFlag):
+    START = 1 << 0
+    DECRYPT = 1 << 1
+
+
+class AsconStatus(IntFlag):
+    BUSY = 1 << 0
+    DONE = 1 << 1
+    DI_READY = 1 << 2
+    DO_VALID = 1 << 3
+    TAG_VALID = 1 << 4
+
+
+class AsconAck(IntFlag):
+    DI_VALID = 1 << 0
+    DO_READY = 1 << 1
+
+
+# Config register layout: field name -> (lsb, width)
+CONFIG_FIELDS = {
+    "AD_SIZE": (0, 8),
+    "DI_SIZE": (8, 8),
+    "DELAY": (16, 16),
+}
+
+
+def build_config_words(ad_size: int, di_size: int, delay: int) -> int:
+    return (delay << 16) | (di_size << 8) | ad_size
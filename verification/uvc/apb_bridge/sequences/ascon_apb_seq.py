@@ -1,46 +1,23 @@
-from enum import IntEnum, IntFlag
+from typing import Callable, Optional, Tuple
 
 import vsc
+from cocotb.utils import get_sim_time
 from pyuvm import uvm_sequence
 from uvc.apb.agents.apb_common import OpType
 from uvc.apb.agents.cl_apb_seq_item import cl_apb_seq_item
 from uvc.ascon.agents.core.core_seq_item import AsconCoreOpItem, AsconCoreResultItem
 from uvc.ascon.utils.ascon_model import AsconModel
+from uvc.utils import ObjectPool, PreRandomizer, ResponseMode, fast_randomize
 
-
-class RegAddr(IntEnum):
-    STATUS = 0
-    CTRL = 4
-    ACK = 8
-    CONFIG = 12
-    KEY = 16
-    NONCE = 32
-    TAG = 48
-    DI = 64
-    DO = 80
-
-
-class AsconCtrlOp(IntEnum):
-    STOP = 0
-    START_ENC = 1
-    START_DEC = 3
-
-
-class AsconStatus(IntFlag):
-    BUSY = 1 << 0
-    DONE = 1 << 1
-    DI_READY = 1 << 2
-    DO_VALID = 1 << 3
-    TAG_VALID = 1 << 4
-
-
-class AsconAck(IntFlag):
-    DI_VALID = 1 << 0
-    DO_READY = 1 << 1
-
-
-def build_config_words(ad_size: int, di_size: int, delay: int) -> int:
-    return (delay << 16) | (di_size << 8) | ad_size
+from ..agents.status_if import AsconStatusInterface
+from ..regs import (
+    AsconAck,
+    AsconCtrlOp,
+    AsconRegBlock,
+    AsconStatus,
+    RegAddr,
+    build_config_words,
+)
 
 
 @vsc.randobj
@@ -51,139 +28,178 @@ class AsconAPBOpSeq(uvm_sequence):
         self.apb_word_len = 4
         self.ascon_rate = 16
         self.byteorder = "little"
+        self.regs: AsconRegBlock = None
+        # Event-driven status waits when set, STATUS polling otherwise
+        self.status_if: AsconStatusInterface = None
+        self.status_reads = 0
+        self.polls_avoided = 0
+        # Disabled when the results are only checked by the scoreboards
+        self.check_result = True
+        # APB items, shared with the other op sequences by the bridge driver
+        self.item_pool: ObjectPool[cl_apb_seq_item] = ObjectPool(cl_apb_seq_item)
+        # Response mode of the APB driver
+        self.rsp_mode = ResponseMode.REQUEST
+        # Pre-solved values of the APB item fields, fast_randomize() otherwise
+        self.prerand: Optional[PreRandomizer] = None
+
+    def do_reset(self):
+        """Restore the defaults before the sequence is reused from a pool."""
+        self.op.set_name(f"{self.get_name()}.op_item")
+        self.regs = None
+        self.status_if = None
+        self.status_reads = 0
+        self.polls_avoided = 0
+        self.check_result = True
 
     def set_apb_width(self, data_width):
         self.apb_word_len = data_width // 8
 
-    def iter_apb_words(self, data: bytes):
-        for offset in range(0, len(data), self.apb_word_len):
-            word = data[offset : offset + self.apb_word_len]
-            yield offset, word
+    async def get_item_response(self, item: cl_apb_seq_item) -> cl_apb_seq_item:
+        if self.rsp_mode == ResponseMode.NONE:
+            # The driver updated the request in place
+            return item
+        # response ID is not unique and may conflict with another request
+        # the response must be read to avoid this issue
+        return await self.get_response()
+
+    def randomize_item(
+        self, item: cl_apb_seq_item, op: OpType, addr: int, data: Optional[int] = None
+    ):
+        if self.prerand is not None:
+            self.prerand.apply(item)
+            item.op = op
+            item.addr = addr
+            if data is not None:
+                item.data = data
+            return
+        if data is None:
+            fast_randomize(item, op=op, addr=addr)
+        else:
+            fast_randomize(item, op=op, addr=addr, data=data)
 
     async def write(self, item_name: str, addr: int, data: int):
-        item = cl_apb_seq_item.create(item_name)
+        item = self.item_pool.acquire(item_name)
         await self.start_item(item)
-        with item.randomize_with() as it:
-            assert isinstance(it, cl_apb_seq_item)
-            it.op == OpType.WR
-            it.addr == addr
-            it.data == data
+        self.randomize_item(item, OpType.WR, addr, data)
         await self.finish_item(item)
-        # response ID is not unique and may conflict with another request
-        # the response must be read to avoid this issue
-        rsp = await self.get_response()
+        rsp = await self.get_item_response(item)
         assert rsp.slverr == 0, f"FAILED: write error: {rsp!s}"
-
-    async def write_seq(self, item_prefix: str, base_addr: int, data: bytes):
-        for i, (offset, word) in enumerate(self.iter_apb_words(data)):
-            await self.write(
-                f"{item_prefix}.wr_item({i})",
-                base_addr + offset,
-                int.from_bytes(word, byteorder=self.byteorder),
-            )
+        self.item_pool.release(item)
 
     async def read(self, item_name: str, addr: int) -> int:
-        item = cl_apb_seq_item.create(item_name)
+        item = self.item_pool.acquire(item_name)
         await self.start_item(item)
-        with item.randomize_with() as it:
-            assert isinstance(it, cl_apb_seq_item)
-            it.op == OpType.RD
-            it.addr == addr
+        self.randomize_item(item, OpType.RD, addr)
         await self.finish_item(item)
-        rsp = await self.get_response()
+        rsp = await self.get_item_response(item)
         assert rsp.slverr == 0, f"FAILED: read error: {rsp!s}"
-        return rsp.data
-
-    async def read_seq(self, item_prefix: str, base_addr: int, size: int) -> bytes:
-        data = b""
-        for i, offset in enumerate(range(0, size, self.apb_word_len)):
-            word = await self.read(f"{item_prefix}.rd_item({i})", base_addr + offset)
-            data += int.to_bytes(
-                word,
-                length=self.apb_word_len,
-                byteorder=self.byteorder,
-            )
-        return data[:size]
+        data = rsp.data
+        self.item_pool.release(item)
+        return data
+
+    async def wait_status(self, cond: Callable[[AsconStatus], bool]):
+        """Read STATUS until `cond` holds.
+
+        With a status interface, each read is preceded by a wait on the status
+        signals of the DUT, and the read only confirms the condition. The polls
+        avoided are estimated from the wait time and the duration of a read.
+        """
+        while True:
+            wait_time = 0
+            if self.status_if is not None:
+                start_time = get_sim_time()
+                await self.status_if.wait(cond)
+                wait_time = get_sim_time() - start_time
+            start_time = get_sim_time()
+            status = AsconStatus(await self.regs.status.read(self))
+            read_time = get_sim_time() - start_time
+            self.status_reads += 1
+            if read_time > 0:
+                self.polls_avoided += wait_time // read_time
+            if cond(status):
+                return
 
     async def wait_flag_set(self, flag: AsconStatus):
-        is_set = False
-        while not is_set:
-            status = await self.read("status.rd_item", RegAddr.STATUS)
-            is_set = flag in AsconStatus(status)
+        await self.wait_status(lambda status: flag in status)
 
     async def wait_flag_clr(self, flag: AsconStatus):
-        is_clr = False
-        while not is_clr:
-            status = await self.read("status.rd_item", RegAddr.STATUS)
-            is_clr = flag not in AsconStatus(status)
+        await self.wait_status(lambda status: flag not in status)
+
+    def compute_result(self) -> Tuple[bytes, bytes]:
+        key = int.to_bytes(self.op.key, length=16, byteorder=self.byteorder)
+        nonce = int.to_bytes(self.op.nonce, length=16, byteorder=self.byteorder)
+        ad = int.to_bytes(self.op.ad, length=self.op.ad_size, byteorder=self.byteorder)
+        di = int.to_bytes(self.op.di, length=self.op.di_size, byteorder=self.byteorder)
+
+        with AsconModel() as model:
+            if self.op.decrypt == 0:
+                return model.ascon_encrypt(key, nonce, ad, di)
+            return model.ascon_decrypt(key, nonce, ad, di)
 
     async def body(self):
+        if self.regs is None:
+            self.regs = AsconRegBlock(byteorder=self.byteorder)
+        regs = self.regs
+
         # Stop previous computation
-        await self.write("stop.wr_item", RegAddr.CTRL, AsconCtrlOp.STOP)
+        await regs.ctrl.write(self, AsconCtrlOp.STOP)
         await self.wait_flag_clr(AsconStatus.BUSY)
 
-        # Write key
+        # Write key, nonce and config, skipping the words already set
         key = int.to_bytes(self.op.key, length=16, byteorder=self.byteorder)
-        await self.write_seq("key", RegAddr.KEY, key)
-
-        # Write nonce
+        regs.set_bank(RegAddr.KEY, key)
         nonce = int.to_bytes(self.op.nonce, length=16, byteorder=self.byteorder)
-        await self.write_seq("nonce", RegAddr.NONCE, nonce)
-
-        # Write config
+        regs.set_bank(RegAddr.NONCE, nonce)
         config = build_config_words(self.op.ad_size, self.op.di_size, self.op.delay)
-        await self.write("config.wr_item", RegAddr.CONFIG, config)
+        regs.config.set(config)
+        await regs.update(self, RegAddr.KEY, RegAddr.NONCE, RegAddr.CONFIG)
 
         # Start operation
         if self.op.decrypt == 0:
-            await self.write("start_enc.wr_item", RegAddr.CTRL, AsconCtrlOp.START_ENC)
+            await regs.ctrl.write(self, AsconCtrlOp.START_ENC)
         else:
-            await self.write("start_dec.wr_item", RegAddr.CTRL, AsconCtrlOp.START_DEC)
+            await regs.ctrl.write(self, AsconCtrlOp.START_DEC)
         await self.wait_flag_set(AsconStatus.BUSY)
 
         # Write AD
-        for i, block in enumerate(
-            self.op.iter_ad_blocks(rate=self.ascon_rate, byteorder=self.byteorder)
+        for block in self.op.iter_ad_blocks(
+            rate=self.ascon_rate, byteorder=self.byteorder
         ):
             await self.wait_flag_set(AsconStatus.DI_READY)
             data = int.to_bytes(block, length=self.ascon_rate, byteorder=self.byteorder)
-            await self.write_seq(f"ad({i})", RegAddr.DI, data)
-            await self.write("ack.wr_item", RegAddr.ACK, AsconAck.DI_VALID)
+            await regs.write_bank(self, RegAddr.DI, data)
+            await regs.ack.write(self, AsconAck.DI_VALID)
 
         # Write DI and read DO
         do = b""
-        for i, block in enumerate(
-            self.op.iter_di_blocks(rate=self.ascon_rate, byteorder=self.byteorder)
+        for block in self.op.iter_di_blocks(
+            rate=self.ascon_rate, byteorder=self.byteorder
         ):
             await self.wait_flag_set(AsconStatus.DI_READY)
             data = int.to_bytes(block, length=self.ascon_rate, byteorder=self.byteorder)
-            await self.write_seq(f"di({i})", RegAddr.DI, data)
-            await self.write("ack.wr_item", RegAddr.ACK, AsconAck.DI_VALID)
+            await regs.write_bank(self, RegAddr.DI, data)
+            await regs.ack.write(self, AsconAck.DI_VALID)
             await self.wait_flag_set(AsconStatus.DO_VALID)
-            do += await self.read_seq(f"do({i})", RegAddr.DO, self.ascon_rate)
-            await self.write("ack.wr_item", RegAddr.ACK, AsconAck.DO_READY)
+            do += await regs.read_bank(self, RegAddr.DO, self.ascon_rate)
+            await regs.ack.write(self, AsconAck.DO_READY)
 
         # Wait for completion
         await self.wait_flag_set(AsconStatus.TAG_VALID | AsconStatus.DONE)
 
         # Read tag
-        tag = await self.read_seq("tag", RegAddr.TAG, 16)
+        tag = await regs.read_bank(self, RegAddr.TAG, 16)
 
         # Stop computation
-        await self.write("stop.wr_item", RegAddr.CTRL, AsconCtrlOp.STOP)
+        await regs.ctrl.write(self, AsconCtrlOp.STOP)
         await self.wait_flag_clr(AsconStatus.BUSY)
 
-        # Compute expected result
-        key = int.to_bytes(self.op.key, length=16, byteorder=self.byteorder)
-        nonce = int.to_bytes(self.op.nonce, length=16, byteorder=self.byteorder)
-        ad = int.to_bytes(self.op.ad, length=self.op.ad_size, byteorder=self.byteorder)
-        di = int.to_bytes(self.op.di, length=self.op.di_size, byteorder=self.byteorder)
+        if not self.check_result:
+            return
 
-        with AsconModel() as model:
-            if self.op.decrypt == 0:
-                exp_do, exp_tag = model.ascon_encrypt(key, nonce, ad, di)
-            else:
-                exp_do, exp_tag = model.ascon_decrypt(key, nonce, ad, di)
+        if self.op.exp_tag is not None:
+            exp_do, exp_tag = self.op.exp_do, self.op.exp_tag
+        else:
+            exp_do, exp_tag = self.compute_result()
 
         assert do == exp_do, (
             "FAILED: do != exp_do\n",
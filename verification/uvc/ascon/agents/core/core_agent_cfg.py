@@ -1,4 +1,5 @@
 from pyuvm import uvm_active_passive_enum, uvm_object
+from uvc.utils import ResponseMode
 
 from .core_if import AsconCoreInterface
 
@@ -10,3 +11,5 @@ class AsconCoreAgentConfig(uvm_object):
         self.is_active: uvm_active_passive_enum = uvm_active_passive_enum.UVM_PASSIVE
         self.rate: int = 16
         self.byteorder: str = "little"
+        # The op sequences never read a response
+        self.rsp_mode: ResponseMode = ResponseMode.NONE
@@ -1,5 +1,6 @@
 from cocotb.triggers import RisingEdge
 from pyuvm import ConfigDB, uvm_driver
+from uvc.utils import ResponseMode
 
 from .core_agent_cfg import AsconCoreAgentConfig
 from .core_seq_item import AsconCoreOpItem
@@ -17,24 +18,26 @@ class AsconCoreDriver(uvm_driver):
         vif = self.cfg.vif
         vif.data_i.value = block
         vif.valid_i.value = 1
+        await vif.wait_di_accept()
         await RisingEdge(vif.clk)
-        while not vif.is_di_ready():
-            await RisingEdge(vif.clk)
         vif.valid_i.value = 0
 
     async def run_phase(self):
         while True:
             req = await self.seq_item_port.get_next_item()
             assert isinstance(req, AsconCoreOpItem)
-            self.logger.info(f"[RQ] {req!s}")
-            self.logger.debug(f"[<=] {req!r}")
-
-            # Creates clone of seq item
-            rsp = req.clone()
-            # Set the transaction ID
-            rsp.set_id_info(req)
-            # Set the response ID
-            rsp.set_context(req)
+            self.logger.info("[RQ] %s", req)
+            self.logger.debug("[<=] %r", req)
+
+            if self.cfg.rsp_mode == ResponseMode.CLONE:
+                # Creates clone of seq item
+                rsp = req.clone()
+                # Set the transaction ID
+                rsp.set_id_info(req)
+                # Set the response ID
+                rsp.set_context(req)
+            else:
+                rsp = req
 
             vif = self.cfg.vif
 
@@ -72,14 +75,17 @@ class AsconCoreDriver(uvm_driver):
                 await self.write_block(block)
 
             # Wait for completion
-            while not vif.is_done():
-                await RisingEdge(vif.clk)
+            await vif.wait_done()
+            await RisingEdge(vif.clk)
 
             # Stop computation
             vif.start_i.value = 0
             while vif.is_busy():
                 await RisingEdge(vif.clk)
 
-            self.logger.info(f"[RP] {rsp!s}")
-            self.logger.debug(f"[=>] {rsp!r}")
-            self.seq_item_port.item_done(rsp)
+            self.logger.info("[RP] %s", rsp)
+            self.logger.debug("[=>] %r", rsp)
+            if self.cfg.rsp_mode == ResponseMode.NONE:
+                self.seq_item_port.item_done()
+            else:
+                self.seq_item_port.item_done(rsp)
@@ -1,3 +1,6 @@
+from cocotb.triggers import ReadOnly, RisingEdge
+
+
 class AsconCoreInterface:
     @classmethod
     def from_dut(cls, dut) -> "AsconCoreInterface":
@@ -74,19 +77,48 @@ class AsconCoreInterface:
         self.data_i.value = 0
 
     def is_busy(self) -> bool:
-        return self.idle_o.value.binstr == "0"
+        return self.idle_o.value == 0
 
     def is_done(self) -> bool:
-        return self.done_o.value.binstr == "1"
+        return self.done_o.value == 1
 
     def is_di_ready(self) -> bool:
-        return self.ready_o.value.binstr == "1"
+        return self.ready_o.value == 1
 
     def is_di_accepted(self) -> bool:
-        return self.ready_o.value.binstr == "1" and self.valid_i.value.binstr == "1"
+        return self.ready_o.value == 1 and self.valid_i.value == 1
 
     def is_do_written(self) -> bool:
-        return self.valid_o.value.binstr == "1"
+        return self.valid_o.value == 1
 
     def is_tag_valid(self) -> bool:
-        return self.tag_valid_o.value.binstr == "1"
+        return self.tag_valid_o.value == 1
+
+    # The wait_* primitives return in the ReadOnly phase of the first cycle in
+    # which the condition holds, so the data of that cycle can be sampled. The
+    # caller awaits the next clock edge to move past it.
+
+    async def _wait_high(self, signal):
+        await ReadOnly()
+        while signal.value != 1:
+            await RisingEdge(signal)
+            await ReadOnly()
+
+    async def wait_di_accept(self):
+        """Wait for a cycle with both data_valid_i and data_ready_o set."""
+        await ReadOnly()
+        while not self.is_di_accepted():
+            if not self.is_di_ready():
+                await RisingEdge(self.ready_o)
+            else:
+                await RisingEdge(self.valid_i)
+            await ReadOnly()
+
+    async def wait_do_valid(self):
+        await self._wait_high(self.valid_o)
+
+    async def wait_tag_valid(self):
+        await self._wait_high(self.tag_valid_o)
+
+    async def wait_done(self):
+        await self._wait_high(self.done_o)
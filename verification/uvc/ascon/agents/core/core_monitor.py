@@ -2,7 +2,7 @@ from cocotb.triggers import RisingEdge
 from pyuvm import ConfigDB, uvm_analysis_port, uvm_component
 
 from .core_agent_cfg import AsconCoreAgentConfig
-from .core_seq_item import AsconCoreOpItem, AsconCoreResultItem
+from .core_seq_item import AsconCoreOpRecord, AsconCoreResultRecord
 
 
 class AsconCoreBaseMonitor(uvm_component):
@@ -25,8 +25,7 @@ class AsconCoreBaseMonitor(uvm_component):
 class AsconCoreOpMonitor(AsconCoreBaseMonitor):
     async def read_input_block(self) -> bytes:
         vif = self.cfg.vif
-        while not vif.is_di_accepted():
-            await RisingEdge(vif.clk)
+        await vif.wait_di_accept()
         block = vif.data_i.value.integer
         await RisingEdge(vif.clk)
         return int.to_bytes(block, length=self.cfg.rate, byteorder=self.cfg.byteorder)
@@ -37,16 +36,16 @@ class AsconCoreOpMonitor(AsconCoreBaseMonitor):
         while True:
             # Detect the start of a computation
             await RisingEdge(vif.start_i)
-            item = AsconCoreOpItem.create("op_item")
-            assert isinstance(item, AsconCoreOpItem)
 
             # Read settings
-            item.delay = vif.delay_i.value.integer
-            item.decrypt = vif.decrypt_i.value.integer
-            item.ad_size = vif.ad_size_i.value.integer
-            item.di_size = vif.di_size_i.value.integer
-            item.key = vif.key_i.value.integer
-            item.nonce = vif.nonce_i.value.integer
+            item = AsconCoreOpRecord(
+                delay=vif.delay_i.value.integer,
+                decrypt=vif.decrypt_i.value.integer,
+                ad_size=vif.ad_size_i.value.integer,
+                di_size=vif.di_size_i.value.integer,
+                key=vif.key_i.value.integer,
+                nonce=vif.nonce_i.value.integer,
+            )
 
             # Read AD
             item.ad = await self.read_stream(item.ad_size, self.read_input_block)
@@ -54,16 +53,15 @@ class AsconCoreOpMonitor(AsconCoreBaseMonitor):
             # Read DI
             item.di = await self.read_stream(item.di_size, self.read_input_block)
 
-            self.logger.info(f"[**] {item!s}")
-            self.logger.debug(f"[=>] {item!r}")
+            self.logger.info("[**] %s", item)
+            self.logger.debug("[=>] %r", item)
             self.ap.write(item)
 
 
 class AsconCoreResultMonitor(AsconCoreBaseMonitor):
     async def read_output_block(self) -> bytes:
         vif = self.cfg.vif
-        while not vif.is_do_written():
-            await RisingEdge(vif.clk)
+        await vif.wait_do_valid()
         block = vif.data_o.value.integer
         await RisingEdge(vif.clk)
         return int.to_bytes(block, length=self.cfg.rate, byteorder=self.cfg.byteorder)
@@ -75,20 +73,16 @@ class AsconCoreResultMonitor(AsconCoreBaseMonitor):
             # Detect the start of a computation
             await RisingEdge(vif.start_i)
 
-            item = AsconCoreResultItem.create("result_item")
-            assert isinstance(item, AsconCoreResultItem)
-
             # Read settings
-            item.do_size = vif.di_size_i.value.integer
+            item = AsconCoreResultRecord(do_size=vif.di_size_i.value.integer)
 
             # Read DO
             item.do = await self.read_stream(item.do_size, self.read_output_block)
 
             # Read tag
-            while not vif.is_tag_valid():
-                await RisingEdge(vif.clk)
+            await vif.wait_tag_valid()
             item.tag = vif.tag_o.value.integer
 
-            self.logger.info(f"[**] {item!s}")
-            self.logger.debug(f"[=>] {item!r}")
+            self.logger.info("[**] %s", item)
+            self.logger.debug("[=>] %r", item)
             self.ap.write(item)
@@ -1,6 +1,10 @@
+from typing import Optional
+
 import vsc
 from pyuvm import uvm_sequence_item
 
+from uvc.utils import MonitorRecord
+
 
 @vsc.randobj
 class AsconCoreOpItem(uvm_sequence_item):
@@ -23,6 +27,9 @@ class AsconCoreOpItem(uvm_sequence_item):
         self.nonce = vsc.rand_bit_t(128)
         self.ad = vsc.bit_t(self.max_stream_size)
         self.di = vsc.bit_t(self.max_stream_size)
+        # Precomputed result, checked in place of a reference model run
+        self.exp_do: Optional[bytes] = None
+        self.exp_tag: Optional[bytes] = None
 
     def iter_ad_blocks(self, rate: int, byteorder: str):
         yield from self.iter_blocks(self.ad, self.ad_size, rate, byteorder)
@@ -44,6 +51,8 @@ class AsconCoreOpItem(uvm_sequence_item):
         self.nonce = rhs.nonce
         self.ad = rhs.ad
         self.di = rhs.di
+        self.exp_do = rhs.exp_do
+        self.exp_tag = rhs.exp_tag
 
     def __eq__(self, value: "AsconCoreOpItem"):
         return (
@@ -116,3 +125,67 @@ class AsconCoreResultItem(uvm_sequence_item):
     def __repr__(self):
         cls_name = self.__class__.__name__
         return f"<{cls_name}(name='{self.get_name()}'), id=0x{self.get_transaction_id():08x}>"
+
+
+class AsconCoreOpRecord(MonitorRecord):
+    """Op observed by AsconCoreOpMonitor."""
+
+    __slots__ = ("delay", "decrypt", "ad_size", "di_size", "key", "nonce", "ad", "di")
+
+    name = "op_item"
+    item_cls = AsconCoreOpItem
+
+    def __init__(self, delay, decrypt, ad_size, di_size, key, nonce, ad=0, di=0):
+        super().__init__()
+        self.delay = delay
+        self.decrypt = decrypt
+        self.ad_size = ad_size
+        self.di_size = di_size
+        self.key = key
+        self.nonce = nonce
+        self.ad = ad
+        self.di = di
+
+    def __str__(self):
+        args = ", ".join(
+            [
+                f"id=0x{self.tx_id:08x}",
+                f"name='{self.name}'",
+                f"delay={self.delay}",
+                f"decrypt={self.decrypt}",
+                f"ad_size={self.ad_size}",
+                f"di_size={self.di_size}",
+                f"key=0x{self.key:032x}",
+                f"nonce=0x{self.nonce:032x}",
+                f"ad=0x{self.ad:0{2 * self.ad_size}x}",
+                f"di=0x{self.di:0{2 * self.di_size}x}",
+            ]
+        )
+        return args
+
+
+class AsconCoreResultRecord(MonitorRecord):
+    """Result observed by AsconCoreResultMonitor."""
+
+    __slots__ = ("do_size", "do", "tag")
+
+    name = "result_item"
+    item_cls = AsconCoreResultItem
+
+    def __init__(self, do_size, do=0, tag=0):
+        super().__init__()
+        self.do_size = do_size
+        self.do = do
+        self.tag = tag
+
+    def __str__(self):
+        args = ", ".join(
+            [
+                f"id=0x{self.tx_id:08x}",
+                f"name='{self.name}'",
+                f"do_size={self.do_size}",
+                f"do=0x{self.do:0{2 * self.do_size}x}",
+                f"tag=0x{self.tag:032x}",
+            ]
+        )
+        return args
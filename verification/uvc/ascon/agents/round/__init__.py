@@ -1,5 +1,7 @@
 from .round_if import (
     AsconCtrlInterface,
     AsconPermutationInterface,
+    AsconRoundSignatureInterface,
     AsconRoundUnitInterface,
 )
+from .round_agent_cfg import ASCON_CTRL_TRANSITIONS, ASCON_ROUND_PHASES, AsconCtrlPhase
@@ -1,7 +1,11 @@
 from pyuvm import ConfigDB, uvm_active_passive_enum, uvm_agent
 
 from .round_agent_cfg import AsconRoundAgentConfig
-from .round_monitor import AsconRoundMonitor
+from .round_monitor import (
+    AsconCtrlPhaseMonitor,
+    AsconRoundMonitor,
+    AsconRoundSignatureMonitor,
+)
 
 
 class AsconRoundAgent(uvm_agent):
@@ -9,6 +13,8 @@ class AsconRoundAgent(uvm_agent):
         super().__init__(name, parent)
         self.cfg: AsconRoundAgentConfig = None
         self.monitor: AsconRoundMonitor = None
+        self.monitor_signature: AsconRoundSignatureMonitor = None
+        self.monitor_phase: AsconCtrlPhaseMonitor = None
 
     def build_phase(self):
         self.cfg = ConfigDB().get(self, "", "cfg")
@@ -16,6 +22,18 @@ class AsconRoundAgent(uvm_agent):
             "Active round agent not supported."
         )
 
-        name = "monitor"
-        ConfigDB().set(self, name, "cfg", self.cfg)
-        self.monitor = AsconRoundMonitor.create(name, self)
+        if self.cfg.observe_rounds and self.cfg.use_signature:
+            name = "monitor_signature"
+            ConfigDB().set(self, name, "cfg", self.cfg)
+            self.monitor_signature = AsconRoundSignatureMonitor.create(name, self)
+        if self.cfg.observe_rounds and (
+            not self.cfg.use_signature or self.cfg.capture_rounds
+        ):
+            name = "monitor"
+            ConfigDB().set(self, name, "cfg", self.cfg)
+            self.monitor = AsconRoundMonitor.create(name, self)
+
+        if self.cfg.observe_phases:
+            name = "monitor_phase"
+            ConfigDB().set(self, name, "cfg", self.cfg)
+            self.monitor_phase = AsconCtrlPhaseMonitor.create(name, self)
@@ -1,15 +1,108 @@
 from dataclasses import dataclass
-from typing import Dict, Set
+from enum import IntEnum
+from typing import Dict, Set, Tuple
 
 from pyuvm import uvm_active_passive_enum, uvm_object
 
 from .round_if import (
     AsconCtrlInterface,
     AsconPermutationInterface,
+    AsconRoundSignatureInterface,
     AsconRoundUnitInterface,
 )
 
 
+class AsconCtrlPhase(IntEnum):
+    """States of the ascon_ctrl FSM, in declaration order."""
+
+    Idle = 0
+    Start = 1
+    Delay = 2
+    InitStart = 3
+    InitMid = 4
+    InitEnd = 5
+    InitEndSep = 6
+    ADWait = 7
+    ADStart = 8
+    ADMid = 9
+    ADEnd = 10
+    ADLastWait = 11
+    ADLastNoWait = 12
+    ADLastStart = 13
+    ADLastMid = 14
+    ADLastEnd = 15
+    DIWait = 16
+    DIStart = 17
+    DIMid = 18
+    DIEnd = 19
+    FinalWait = 20
+    FinalNoWait = 21
+    FinalStart = 22
+    FinalStartEmpty = 23
+    FinalMid = 24
+    FinalEnd = 25
+    Done = 26
+
+
+# Phases computing a permutation round: the state enabled ones, and FinalEnd
+# where the last round of the finalization only feeds the tag
+ASCON_ROUND_PHASES = (
+    "InitStart",
+    "InitMid",
+    "InitEnd",
+    "InitEndSep",
+    "ADStart",
+    "ADMid",
+    "ADEnd",
+    "ADLastStart",
+    "ADLastMid",
+    "ADLastEnd",
+    "DIStart",
+    "DIMid",
+    "DIEnd",
+    "FinalStart",
+    "FinalStartEmpty",
+    "FinalMid",
+    "FinalEnd",
+)
+
+
+# State changes of the ascon_ctrl FSM, the self loops are not listed
+ASCON_CTRL_TRANSITIONS: Tuple[Tuple[AsconCtrlPhase, AsconCtrlPhase], ...] = tuple(
+    (AsconCtrlPhase[a], AsconCtrlPhase[b])
+    for a, targets in (
+        ("Idle", ("Start",)),
+        ("Start", ("Delay",)),
+        ("Delay", ("Idle", "InitStart")),
+        ("InitStart", ("InitMid",)),
+        ("InitMid", ("InitEnd", "InitEndSep")),
+        ("InitEnd", ("ADWait", "ADLastWait")),
+        ("InitEndSep", ("DIWait", "FinalWait", "FinalNoWait")),
+        ("ADWait", ("Idle", "ADStart")),
+        ("ADStart", ("ADMid",)),
+        ("ADMid", ("ADEnd",)),
+        ("ADEnd", ("ADWait", "ADLastWait", "ADLastNoWait")),
+        ("ADLastWait", ("Idle", "ADLastStart")),
+        ("ADLastNoWait", ("ADLastStart",)),
+        ("ADLastStart", ("ADLastMid",)),
+        ("ADLastMid", ("ADLastEnd",)),
+        ("ADLastEnd", ("DIWait", "FinalWait", "FinalNoWait")),
+        ("DIWait", ("Idle", "DIStart")),
+        ("DIStart", ("DIMid",)),
+        ("DIMid", ("DIEnd",)),
+        ("DIEnd", ("DIWait", "FinalWait", "FinalNoWait")),
+        ("FinalWait", ("Idle", "FinalStart")),
+        ("FinalNoWait", ("FinalStartEmpty",)),
+        ("FinalStart", ("FinalMid",)),
+        ("FinalStartEmpty", ("FinalMid",)),
+        ("FinalMid", ("FinalEnd",)),
+        ("FinalEnd", ("Done",)),
+        ("Done", ("Idle",)),
+    )
+    for b in targets
+)
+
+
 @dataclass
 class AsconRoundPhaseInfo:
     value: int
@@ -23,6 +116,15 @@ class AsconRoundAgentConfig(uvm_object):
         self.vif_round_unit: AsconRoundUnitInterface = None
         self.vif_ctrl: AsconCtrlInterface = None
         self.vif_permutation: AsconPermutationInterface = None
+        self.vif_signature: AsconRoundSignatureInterface = None
+        # Read the HDL round signature instead of the full states
+        self.use_signature: bool = False
+        # Also build the full round monitor with the signature one, idle until
+        # a signature mismatch is replayed
+        self.capture_rounds: bool = False
+        # Monitors built by the agent: rounds (or signatures), FSM transitions
+        self.observe_rounds: bool = True
+        self.observe_phases: bool = False
         self.is_active = uvm_active_passive_enum.UVM_PASSIVE
         self._phase_names: Dict[int, str] = {}
         self._active_phases: Set[str] = set()
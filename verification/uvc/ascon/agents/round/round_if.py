@@ -21,10 +21,10 @@ class AsconRoundUnitInterface:
         self.round_i = round_i
 
     def is_enable_set(self):
-        return self.en_i.value.binstr == "1"
+        return self.en_i.value == 1
 
     def is_enable_clear(self):
-        return self.en_i.value.binstr == "0"
+        return self.en_i.value == 0
 
 
 class AsconCtrlInterface:
@@ -65,3 +65,26 @@ class AsconPermutationInterface:
         self.add_state_s = add_state_s
         self.sub_state_s = sub_state_s
         self.diff_state_s = diff_state_s
+
+
+class AsconRoundSignatureInterface:
+    @classmethod
+    def from_dut(cls, dut) -> "AsconRoundSignatureInterface":
+        return AsconRoundSignatureInterface(
+            clk=dut.clk,
+            rst_n=dut.rst_n,
+            sig_o=dut.sig_o,
+            sig_valid_o=dut.sig_valid_o,
+        )
+
+    def __init__(
+        self,
+        clk,
+        rst_n,
+        sig_o,
+        sig_valid_o,
+    ):
+        self.clk = clk
+        self.rst_n = rst_n
+        self.sig_o = sig_o
+        self.sig_valid_o = sig_valid_o
@@ -1,10 +1,14 @@
 from enum import Enum
 
-from cocotb.triggers import RisingEdge
+from cocotb.triggers import Edge, Event, ReadOnly, RisingEdge
 from pyuvm import ConfigDB, uvm_analysis_port, uvm_component
 
 from .round_agent_cfg import AsconRoundAgentConfig
-from .round_seq_item import AsconRoundItem
+from .round_seq_item import (
+    AsconCtrlPhaseRecord,
+    AsconRoundRecord,
+    AsconRoundSignatureRecord,
+)
 
 
 class AsconRoundMonitorState(Enum):
@@ -18,31 +22,46 @@ class AsconRoundMonitor(uvm_component):
         self.cfg: AsconRoundAgentConfig = None
         self.ap: uvm_analysis_port = None
         self.state: AsconRoundMonitorState = AsconRoundMonitorState.IDLE
+        self.enabled = True
+        self.ev_enabled: Event = None
 
     def build_phase(self):
         self.cfg = ConfigDB().get(self, "", "cfg")
         self.ap = uvm_analysis_port("ap", self)
+        self.ev_enabled = Event("ev_enabled")
+
+    def set_enabled(self, enabled: bool):
+        """A disabled monitor sleeps instead of sampling the states every cycle."""
+        self.enabled = enabled
+        if enabled:
+            self.ev_enabled.set()
+        else:
+            self.ev_enabled.clear()
 
     def write_round(self):
         vif = self.cfg.vif_permutation
-        phase = self.cfg.get_phase_info(self.cfg.vif_ctrl.phase_s.value)
+        phase = self.cfg.get_phase_info(self.cfg.vif_ctrl.phase_s.value.integer)
         if phase.is_active:
-            item = AsconRoundItem.create("round_item")
-            assert isinstance(item, AsconRoundItem)
-            item.phase = phase.value
-            item.phase_name = phase.name
-            item.round = self.cfg.vif_round_unit.round_i.value.integer
-            item.add_state = vif.add_state_s.value.integer
-            item.sub_state = vif.sub_state_s.value.integer
-            item.diff_state = vif.diff_state_s.value.integer
-            self.logger.info(f"[**] {item!s}")
-            self.logger.debug(f"[=>] {item!r}")
+            item = AsconRoundRecord(
+                phase=phase.value,
+                phase_name=phase.name,
+                round=self.cfg.vif_round_unit.round_i.value.integer,
+                add_state=vif.add_state_s.value.integer,
+                sub_state=vif.sub_state_s.value.integer,
+                diff_state=vif.diff_state_s.value.integer,
+            )
+            self.logger.info("[**] %s", item)
+            self.logger.debug("[=>] %r", item)
             self.ap.write(item)
 
     async def run_phase(self):
         vif = self.cfg.vif_round_unit
 
         while True:
+            if not self.enabled:
+                self.state = AsconRoundMonitorState.IDLE
+                await self.ev_enabled.wait()
+                await RisingEdge(vif.clk)
             if self.state == AsconRoundMonitorState.IDLE:
                 if vif.is_enable_set():
                     self.state = AsconRoundMonitorState.READING
@@ -52,3 +71,63 @@ class AsconRoundMonitor(uvm_component):
                 if vif.is_enable_clear():
                     self.state = AsconRoundMonitorState.IDLE
             await RisingEdge(vif.clk)
+
+
+class AsconRoundSignatureMonitor(uvm_component):
+    """Read the HDL round signature once per permutation."""
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.cfg: AsconRoundAgentConfig = None
+        self.ap: uvm_analysis_port = None
+        self.count = 0
+
+    def build_phase(self):
+        self.cfg = ConfigDB().get(self, "", "cfg")
+        self.ap = uvm_analysis_port("ap", self)
+
+    async def run_phase(self):
+        vif = self.cfg.vif_signature
+
+        while True:
+            await RisingEdge(vif.sig_valid_o)
+            await ReadOnly()
+            item = AsconRoundSignatureRecord(
+                index=self.count, signature=vif.sig_o.value.integer
+            )
+            self.count += 1
+            self.logger.debug("[**] %s", item)
+            self.ap.write(item)
+
+
+class AsconCtrlPhaseMonitor(uvm_component):
+    """Publish the state changes of the ascon_ctrl FSM.
+
+    phase_q is a register, so the monitor wakes up once per state change rather
+    than once per cycle.
+    """
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.cfg: AsconRoundAgentConfig = None
+        self.ap: uvm_analysis_port = None
+
+    def build_phase(self):
+        self.cfg = ConfigDB().get(self, "", "cfg")
+        self.ap = uvm_analysis_port("ap", self)
+
+    async def run_phase(self):
+        phase_s = self.cfg.vif_ctrl.phase_s
+        prev = None
+
+        while True:
+            await Edge(phase_s)
+            if not phase_s.value.is_resolvable:
+                continue
+            phase = phase_s.value.integer
+            if phase == prev:
+                continue
+            item = AsconCtrlPhaseRecord(prev=prev, phase=phase)
+            prev = phase
+            self.logger.debug("[**] %s", item)
+            self.ap.write(item)
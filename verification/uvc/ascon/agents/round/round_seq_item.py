@@ -1,6 +1,10 @@
+from typing import Optional
+
 import vsc
 from pyuvm import uvm_sequence_item
 
+from uvc.utils import MonitorRecord
+
 
 @vsc.randobj
 class AsconRoundItem(uvm_sequence_item):
@@ -63,3 +67,126 @@ class AsconRoundItem(uvm_sequence_item):
     def __repr__(self):
         cls_name = self.__class__.__name__
         return f"<{cls_name}(name='{self.get_name()}'), id=0x{self.get_transaction_id():08x}>"
+
+
+@vsc.randobj
+class AsconRoundSignatureItem(uvm_sequence_item):
+    def __init__(self, name):
+        super().__init__(name)
+        self.index = 0
+        self.signature = vsc.bit_t(64)
+
+    def do_copy(self, rhs: "AsconRoundSignatureItem"):
+        super().do_copy(rhs)
+        self.index = rhs.index
+        self.signature = rhs.signature
+
+    def __eq__(self, value: "AsconRoundSignatureItem"):
+        return super().__eq__(value) and self.signature == value.signature
+
+    def __str__(self):
+        args = ", ".join(
+            [
+                f"id=0x{self.get_transaction_id():08x}",
+                f"name='{self.get_name()}'",
+                f"index={self.index}",
+                f"signature=0x{self.signature:016x}",
+            ]
+        )
+        return args
+
+    def __repr__(self):
+        cls_name = self.__class__.__name__
+        return f"<{cls_name}(name='{self.get_name()}'), id=0x{self.get_transaction_id():08x}>"
+
+
+class AsconRoundRecord(MonitorRecord):
+    """Round state observed by AsconRoundMonitor."""
+
+    __slots__ = ("phase", "phase_name", "round", "add_state", "sub_state", "diff_state")
+
+    name = "round_item"
+    item_cls = AsconRoundItem
+
+    def __init__(self, phase, phase_name, round, add_state, sub_state, diff_state):
+        super().__init__()
+        self.phase = phase
+        self.phase_name = phase_name
+        self.round = round
+        self.add_state = add_state
+        self.sub_state = sub_state
+        self.diff_state = diff_state
+
+    def __xor__(self, rhs: "AsconRoundRecord"):
+        item = self.clone()
+        item.add_state = item.add_state ^ rhs.add_state
+        item.sub_state = item.sub_state ^ rhs.sub_state
+        item.diff_state = item.diff_state ^ rhs.diff_state
+        return item
+
+    def __str__(self):
+        to_str = AsconRoundItem.to_str
+        args = ", ".join(
+            [
+                f"id=0x{self.tx_id:08x}",
+                f"name='{self.name}'",
+                f"phase=({self.phase_name}: {self.phase})",
+                f"round={self.round}",
+                f"add_state=({to_str(self.add_state)})",
+                f"sub_state=({to_str(self.sub_state)})",
+                f"diff_state=({to_str(self.diff_state)})",
+            ]
+        )
+        return args
+
+
+class AsconRoundSignatureRecord(MonitorRecord):
+    """Permutation signature observed by AsconRoundSignatureMonitor."""
+
+    __slots__ = ("index", "signature")
+
+    name = "signature_item"
+    item_cls = AsconRoundSignatureItem
+
+    def __init__(self, index, signature):
+        super().__init__()
+        self.index = index
+        self.signature = signature
+
+    def __str__(self):
+        args = ", ".join(
+            [
+                f"id=0x{self.tx_id:08x}",
+                f"name='{self.name}'",
+                f"index={self.index}",
+                f"signature=0x{self.signature:016x}",
+            ]
+        )
+        return args
+
+
+class AsconCtrlPhaseRecord(MonitorRecord):
+    """State change of the ascon_ctrl FSM, prev is None for the first state.
+
+    Observation only, there is no sequence item to convert to.
+    """
+
+    __slots__ = ("prev", "phase")
+
+    name = "phase_item"
+
+    def __init__(self, prev: Optional[int], phase: int):
+        super().__init__()
+        self.prev = prev
+        self.phase = phase
+
+    def __str__(self):
+        args = ", ".join(
+            [
+                f"id=0x{self.tx_id:08x}",
+                f"name='{self.name}'",
+                f"prev={self.prev}",
+                f"phase={self.phase}",
+            ]
+        )
+        return args
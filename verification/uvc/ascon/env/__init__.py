@@ -1,2 +1,6 @@
+from .ascon_coverage import AsconCoverage
 from .ascon_env import AsconEnv
-from .ascon_env_cfg import AsconEnvConfig
+from .ascon_env_cfg import AsconEnvConfig, AsconRoundCheck
+from .ascon_perf_monitor import AsconCorePerfMonitor, AsconOpPerf
+from .ascon_trace_ctrl import AsconTraceController
+from .latency_scoreboard import LatencyScoreboard
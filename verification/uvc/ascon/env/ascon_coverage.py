@@ -0,0 +1,198 @@
+"""Ascon functional coverage collector"""
+
+from typing import Dict
+
+import numpy as np
+import vsc
+from pyuvm import ConfigDB, uvm_subscriber
+from uvc.utils import sample_count
+
+from ..agents.core.core_agent_cfg import AsconCoreAgentConfig
+from ..agents.core.core_seq_item import AsconCoreOpRecord
+from ..agents.round.round_agent_cfg import ASCON_CTRL_TRANSITIONS, AsconCtrlPhase
+from ..agents.round.round_seq_item import AsconCtrlPhaseRecord
+from ..utils.ascon_bins import (
+    AsconDelayClass,
+    AsconSizeClass,
+    AsconStream,
+    delay_class,
+    size_class,
+)
+
+
+class AsconCoverage(uvm_subscriber):
+    """Coverage of the ops and of the ascon_ctrl FSM.
+
+    The samples are counted in preallocated arrays, cheap enough to be left on
+    in every regression. extract_phase() flushes the counters into the vsc
+    covergroups, sampling each hit bin once with its count, so the usual vsc
+    reports and the coverage database hold the actual hit counts.
+    """
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.cfg: AsconCoreAgentConfig = None
+        self.transition_idx = {t: i for i, t in enumerate(ASCON_CTRL_TRANSITIONS)}
+        self.op_hits = np.zeros(
+            (len(AsconSizeClass), len(AsconSizeClass), 2, len(AsconDelayClass)),
+            dtype=np.int64,
+        )
+        self.pad_hits: np.ndarray = None
+        self.state_hits = np.zeros(len(AsconCtrlPhase), dtype=np.int64)
+        self.transition_hits = np.zeros(len(ASCON_CTRL_TRANSITIONS), dtype=np.int64)
+        self.illegal_transitions = 0
+
+    def build_phase(self):
+        super().build_phase()
+        self.cfg = ConfigDB().get(self, "", "cfg")
+        self.pad_hits = np.zeros((len(AsconStream), self.cfg.rate), dtype=np.int64)
+
+    def counters(self) -> Dict[str, np.ndarray]:
+        return {
+            "op": self.op_hits,
+            "padding": self.pad_hits,
+            "state": self.state_hits,
+            "transition": self.transition_hits,
+        }
+
+    def n_hit_bins(self) -> int:
+        return sum(np.count_nonzero(a) for a in self.counters().values())
+
+    def closure(self) -> Dict[str, float]:
+        """Share of hit bins of each counter array, in percent."""
+        return {
+            name: 100.0 * np.count_nonzero(a) / a.size
+            for name, a in self.counters().items()
+        }
+
+    def write(self, item):
+        if isinstance(item, AsconCtrlPhaseRecord):
+            self.write_phase(item)
+        else:
+            self.write_op(item)
+
+    def write_op(self, item: AsconCoreOpRecord):
+        self.op_hits[
+            size_class(item.ad_size, self.cfg.rate),
+            size_class(item.di_size, self.cfg.rate),
+            item.decrypt,
+            delay_class(item.delay),
+        ] += 1
+        # Index of the padding byte in the last block, an empty AD is not padded
+        if item.ad_size:
+            self.pad_hits[AsconStream.AD, item.ad_size % self.cfg.rate] += 1
+        self.pad_hits[AsconStream.DI, item.di_size % self.cfg.rate] += 1
+
+    def write_phase(self, item: AsconCtrlPhaseRecord):
+        if item.phase >= len(AsconCtrlPhase):
+            self.illegal_transitions += 1
+            return
+        self.state_hits[item.phase] += 1
+        if item.prev is None:
+            return
+        idx = self.transition_idx.get((item.prev, item.phase))
+        if idx is None:
+            # Reset, or an actual bug
+            self.illegal_transitions += 1
+            self.logger.debug(
+                f"Transition {AsconCtrlPhase(item.prev).name} -> "
+                f"{AsconCtrlPhase(item.phase).name} not covered."
+            )
+        else:
+            self.transition_hits[idx] += 1
+
+    def extract_phase(self):
+        cg_op = covergroup_op(f"{self.get_full_name()}.cg_op")
+        for index in np.argwhere(self.op_hits):
+            count = int(self.op_hits[tuple(index)])
+            sample_count(cg_op, count, *map(int, index))
+
+        cg_padding = covergroup_padding(f"{self.get_full_name()}.cg_padding", self.cfg)
+        for stream, idx in np.argwhere(self.pad_hits):
+            count = int(self.pad_hits[stream, idx])
+            sample_count(cg_padding, count, int(stream), int(idx))
+
+        cg_fsm = covergroup_fsm(f"{self.get_full_name()}.cg_fsm")
+        for phase in np.flatnonzero(self.state_hits):
+            sample_count(cg_fsm, int(self.state_hits[phase]), int(phase), 0, 0)
+        for idx in np.flatnonzero(self.transition_hits):
+            sample_count(cg_fsm, int(self.transition_hits[idx]), 0, int(idx), 1)
+
+    def report_phase(self):
+        if self.illegal_transitions:
+            self.logger.warning(
+                f"{self.illegal_transitions} ascon_ctrl transitions outside of "
+                "the FSM, resets included"
+            )
+
+
+def enum_bins(enum_cls) -> dict:
+    return {e.name: vsc.bin(e.value) for e in enum_cls}
+
+
+@vsc.covergroup
+class covergroup_op(object):
+    def __init__(self, name):
+        self.options.name = name
+        self.options.comment = "AD size, DI size, direction and delay of the ops"
+
+        self.with_sample(
+            ad_size=vsc.bit_t(3),
+            di_size=vsc.bit_t(3),
+            decrypt=vsc.bit_t(1),
+            delay=vsc.bit_t(2),
+        )
+
+        self.op_ad_size = vsc.coverpoint(self.ad_size, bins=enum_bins(AsconSizeClass))
+        self.op_di_size = vsc.coverpoint(self.di_size, bins=enum_bins(AsconSizeClass))
+        self.op_decrypt = vsc.coverpoint(
+            self.decrypt, bins={"ENC": vsc.bin(0), "DEC": vsc.bin(1)}
+        )
+        self.op_delay = vsc.coverpoint(self.delay, bins=enum_bins(AsconDelayClass))
+
+        self.cross_op = vsc.cross(
+            [self.op_ad_size, self.op_di_size, self.op_decrypt, self.op_delay]
+        )
+
+
+@vsc.covergroup
+class covergroup_padding(object):
+    def __init__(self, name, cfg):
+        self.options.name = name
+        self.options.comment = "Index of the padding byte in the last block"
+
+        no_bits = (cfg.rate - 1).bit_length()
+        self.with_sample(stream=vsc.bit_t(1), idx=vsc.bit_t(no_bits))
+
+        self.pad_stream = vsc.coverpoint(self.stream, bins=enum_bins(AsconStream))
+        self.pad_idx = vsc.coverpoint(
+            self.idx, bins={"idx": vsc.bin_array([], [0, cfg.rate - 1])}
+        )
+
+        self.cross_pad = vsc.cross([self.pad_stream, self.pad_idx])
+
+
+@vsc.covergroup
+class covergroup_fsm(object):
+    def __init__(self, name):
+        self.options.name = name
+        self.options.comment = "States and transitions of the ascon_ctrl FSM"
+
+        no_bits = len(ASCON_CTRL_TRANSITIONS).bit_length()
+        self.with_sample(
+            phase=vsc.bit_t(5), transition=vsc.bit_t(no_bits), is_transition=vsc.bit_t(1)
+        )
+
+        self.fsm_state = vsc.coverpoint(
+            self.phase,
+            bins=enum_bins(AsconCtrlPhase),
+            iff=self.is_transition == 0,
+        )
+        self.fsm_transition = vsc.coverpoint(
+            self.transition,
+            bins={
+                f"{a.name}->{b.name}": vsc.bin(i)
+                for i, (a, b) in enumerate(ASCON_CTRL_TRANSITIONS)
+            },
+            iff=self.is_transition == 1,
+        )
@@ -1,10 +1,18 @@
+from typing import Optional
+
 from pyuvm import ConfigDB, uvm_env
 
 from ..agents.core.core_agent import AsconCoreAgent
 from ..agents.round.round_agent import AsconRoundAgent
-from .ascon_env_cfg import AsconEnvConfig
+from .ascon_coverage import AsconCoverage
+from .ascon_env_cfg import AsconEnvConfig, AsconRoundCheck
+from .ascon_perf_monitor import AsconCorePerfMonitor
+from .latency_scoreboard import LatencyScoreboard
+from .ascon_trace_ctrl import AsconTraceController
+from .ascon_tx_recorder import AsconTxRecorder
 from .result_scoreboard import ResultScoreboard
 from .round_scoreboard import RoundScoreboard
+from .signature_scoreboard import SignatureScoreboard
 
 
 class AsconEnv(uvm_env):
@@ -15,6 +23,12 @@ class AsconEnv(uvm_env):
         self.agent_round: AsconRoundAgent = None
         self.scoreboard_result: ResultScoreboard = None
         self.scoreboard_round: RoundScoreboard = None
+        self.scoreboard_signature: SignatureScoreboard = None
+        self.coverage: AsconCoverage = None
+        self.recorder: AsconTxRecorder = None
+        self.perf_monitor: AsconCorePerfMonitor = None
+        self.scoreboard_latency: LatencyScoreboard = None
+        self.trace_ctrl: AsconTraceController = None
 
     def build_phase(self):
         self.cfg = ConfigDB().get(self, "", "cfg")
@@ -23,21 +37,80 @@ class AsconEnv(uvm_env):
         ConfigDB().set(self, name, "cfg", self.cfg.core_cfg)
         self.agent_core = AsconCoreAgent.create(name, self)
 
-        if self.cfg.check_rounds:
+        if self.cfg.check_rounds == AsconRoundCheck.FULL:
             name = "agent_round"
+            self.cfg.round_cfg.use_signature = False
             ConfigDB().set(self, name, "cfg", self.cfg.round_cfg)
             self.agent_round = AsconRoundAgent.create(name, self)
 
             name = "scoreboard_round"
             ConfigDB().set(self, name, "cfg", self.cfg.core_cfg)
             self.scoreboard_round = RoundScoreboard.create(name, self)
+        elif self.cfg.check_rounds == AsconRoundCheck.SIGNATURE:
+            name = "agent_round"
+            self.cfg.round_cfg.use_signature = True
+            # Full round monitor, idle until a failure is replayed
+            self.cfg.round_cfg.capture_rounds = self.cfg.replay_failures
+            ConfigDB().set(self, name, "cfg", self.cfg.round_cfg)
+            self.agent_round = AsconRoundAgent.create(name, self)
+
+            name = "scoreboard_signature"
+            ConfigDB().set(self, name, "cfg", self.cfg.core_cfg)
+            self.scoreboard_signature = SignatureScoreboard.create(name, self)
+            self.scoreboard_signature.record_failures = self.cfg.replay_failures
         else:
             name = "scoreboard_result"
             ConfigDB().set(self, name, "cfg", self.cfg.core_cfg)
             self.scoreboard_result = ResultScoreboard.create(name, self)
+            self.scoreboard_result.record_failures = self.cfg.replay_failures
+
+            if self.cfg.replay_failures:
+                # Round monitor, idle until a failure is replayed
+                name = "agent_round"
+                self.cfg.round_cfg.use_signature = False
+                ConfigDB().set(self, name, "cfg", self.cfg.round_cfg)
+                self.agent_round = AsconRoundAgent.create(name, self)
+
+        if self.cfg.replay_failures and self.cfg.check_rounds != AsconRoundCheck.FULL:
+            name = "scoreboard_round"
+            ConfigDB().set(self, name, "cfg", self.cfg.core_cfg)
+            self.scoreboard_round = RoundScoreboard.create(name, self)
+
+        if self.cfg.enable_coverage:
+            self.cfg.round_cfg.observe_phases = True
+            if self.agent_round is None:
+                # Round agent only observing the FSM state changes
+                name = "agent_round"
+                self.cfg.round_cfg.observe_rounds = False
+                ConfigDB().set(self, name, "cfg", self.cfg.round_cfg)
+                self.agent_round = AsconRoundAgent.create(name, self)
+
+            name = "coverage"
+            ConfigDB().set(self, name, "cfg", self.cfg.core_cfg)
+            self.coverage = AsconCoverage.create(name, self)
+
+        if self.cfg.txdb_path:
+            name = "recorder"
+            ConfigDB().set(self, name, "cfg", self.cfg)
+            self.recorder = AsconTxRecorder.create(name, self)
+
+        if self.cfg.perf_path or self.cfg.check_latency or self.cfg.record_perf:
+            name = "perf_monitor"
+            ConfigDB().set(self, name, "cfg", self.cfg)
+            self.perf_monitor = AsconCorePerfMonitor.create(name, self)
+
+        if self.cfg.check_latency:
+            name = "scoreboard_latency"
+            ConfigDB().set(self, name, "cfg", self.cfg)
+            self.scoreboard_latency = LatencyScoreboard.create(name, self)
+
+        if self.cfg.trace_ctrl is not None:
+            name = "trace_ctrl"
+            ConfigDB().set(self, name, "cfg", self.cfg)
+            self.trace_ctrl = AsconTraceController.create(name, self)
 
     def connect_phase(self):
-        if self.cfg.check_rounds:
+        if self.cfg.check_rounds == AsconRoundCheck.FULL:
             self.agent_core.monitor_op.ap.connect(
                 self.scoreboard_round.op_queue.analysis_export
             )
@@ -47,6 +120,16 @@ class AsconEnv(uvm_env):
             self.agent_round.monitor.ap.connect(
                 self.scoreboard_round.round_queue.analysis_export
             )
+        elif self.cfg.check_rounds == AsconRoundCheck.SIGNATURE:
+            self.agent_core.monitor_op.ap.connect(
+                self.scoreboard_signature.op_queue.analysis_export
+            )
+            self.agent_core.monitor_result.ap.connect(
+                self.scoreboard_signature.analysis_export
+            )
+            self.agent_round.monitor_signature.ap.connect(
+                self.scoreboard_signature.signature_queue.analysis_export
+            )
         else:
             self.agent_core.monitor_op.ap.connect(
                 self.scoreboard_result.op_queue.analysis_export
@@ -54,3 +137,47 @@ class AsconEnv(uvm_env):
             self.agent_core.monitor_result.ap.connect(
                 self.scoreboard_result.analysis_export
             )
+
+        if self.cfg.replay_failures and self.cfg.check_rounds != AsconRoundCheck.FULL:
+            self.agent_core.monitor_op.ap.connect(
+                self.scoreboard_round.op_queue.analysis_export
+            )
+            self.agent_core.monitor_result.ap.connect(
+                self.scoreboard_round.analysis_export
+            )
+            self.agent_round.monitor.ap.connect(
+                self.scoreboard_round.round_queue.analysis_export
+            )
+
+        if self.cfg.enable_coverage:
+            self.agent_core.monitor_op.ap.connect(self.coverage.analysis_export)
+            self.agent_round.monitor_phase.ap.connect(self.coverage.analysis_export)
+
+        if self.cfg.txdb_path:
+            self.agent_core.monitor_op.ap.connect(self.recorder.analysis_export)
+            self.agent_core.monitor_result.ap.connect(self.recorder.analysis_export)
+            if self.agent_round is not None and self.agent_round.monitor is not None:
+                self.agent_round.monitor.ap.connect(self.recorder.analysis_export)
+
+        if self.cfg.check_latency:
+            self.perf_monitor.ap.connect(self.scoreboard_latency.analysis_export)
+
+        if self.cfg.trace_ctrl is not None:
+            self.agent_core.monitor_result.ap.connect(self.trace_ctrl.analysis_export)
+
+    def end_of_elaboration_phase(self):
+        if self.cfg.replay_failures and self.cfg.check_rounds != AsconRoundCheck.FULL:
+            self.agent_round.monitor.set_enabled(False)
+            self.scoreboard_round.enabled = False
+
+    def get_failure_scoreboard(self) -> Optional[ResultScoreboard]:
+        """Scoreboard recording the failing ops to replay, None in full mode."""
+        if self.scoreboard_signature is not None:
+            return self.scoreboard_signature
+        return self.scoreboard_result
+
+    def enable_replay(self):
+        """Switch from result checking to round checking to replay a failure."""
+        self.get_failure_scoreboard().enabled = False
+        self.scoreboard_round.enabled = True
+        self.agent_round.monitor.set_enabled(True)
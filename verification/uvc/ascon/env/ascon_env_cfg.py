@@ -1,9 +1,20 @@
+from enum import IntEnum
+from typing import Any, Optional, Set
+
 from pyuvm import uvm_object
 
 from ..agents.core.core_agent_cfg import AsconCoreAgentConfig
 from ..agents.round.round_agent_cfg import AsconRoundAgentConfig
 
 
+class AsconRoundCheck(IntEnum):
+    """Round checking mode, compatible with the former boolean flag."""
+
+    NONE = 0
+    FULL = 1
+    SIGNATURE = 2
+
+
 class AsconEnvConfig(uvm_object):
     def __init__(self, name):
         super().__init__(name)
@@ -13,4 +24,22 @@ class AsconEnvConfig(uvm_object):
         self.round_cfg: AsconRoundAgentConfig = AsconRoundAgentConfig.create(
             "cfg_agent_round"
         )
-        self.check_rounds: bool = False
+        self.check_rounds: AsconRoundCheck = AsconRoundCheck.NONE
+        # Record failing ops and replay them with full round checking
+        self.replay_failures: bool = False
+        # Op and ascon_ctrl FSM coverage
+        self.enable_coverage: bool = True
+        # Transaction database, see AsconTxRecorder
+        self.txdb_path: Optional[str] = None
+        # Stem of the CSV/JSON exports of AsconCorePerfMonitor
+        self.perf_path: Optional[str] = None
+        # Compare the op cycles to AsconCtrlCycleModel
+        self.check_latency: bool = False
+        # Measure the op cycles for the performance history, see tools/perfdb.py
+        self.record_perf: bool = False
+        # HDL instance of ascon_trace_ctrl, None to not dump the waveforms
+        self.trace_ctrl: Any = None
+        # Indexes of the ops to dump, see AsconTraceController
+        self.trace_ops: Set[int] = set()
+        # Cycles dumped after the result of a traced op
+        self.trace_window: int = 100
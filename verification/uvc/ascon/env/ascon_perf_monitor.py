@@ -0,0 +1,264 @@
+import csv
+import dataclasses
+import json
+import math
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import cocotb
+from cocotb.triggers import ReadOnly, RisingEdge
+from cocotb.utils import get_sim_time
+from pyuvm import ConfigDB, uvm_analysis_port, uvm_subscriber
+from uvc.apb.agents.cl_apb_seq_item import cl_apb_record
+
+from .ascon_env_cfg import AsconEnvConfig
+
+PerfKey = Tuple[int, int, int]
+
+
+@dataclass
+class AsconOpPerf:
+    """Timing of an op, in clock cycles.
+
+    The blocks are the AD then DI blocks sent to the core. For each block, the
+    core waits `ready - previous accept` cycles (from the start for the first
+    block) before raising data_ready_o, then stalls `accept - ready` cycles
+    until the data_valid_i of the testbench. DO is the delay from the accept of
+    a DI block to its data_valid_o, and the finalization the delay from the
+    last accept to tag_valid_o. The APB transfers are counted from the start
+    to the tag, and the gap from the tag of the previous op to the start.
+    """
+
+    op_index: int
+    ad_size: int
+    di_size: int
+    delay: int
+    decrypt: int
+    start_cycle: int
+    latency: int = 0
+    init_cycles: int = 0
+    block_cycles: int = 0
+    in_stall_cycles: int = 0
+    do_cycles: int = 0
+    final_cycles: int = 0
+    gap_cycles: Optional[int] = None
+    apb_transfers: int = 0
+    apb_wait_cycles: int = 0
+
+    @property
+    def key(self) -> PerfKey:
+        return self.ad_size, self.di_size, self.delay
+
+    @property
+    def cycles_per_byte(self) -> float:
+        return self.latency / max(1, self.ad_size + self.di_size)
+
+    def to_dict(self) -> dict:
+        d = dataclasses.asdict(self)
+        d["cycles_per_byte"] = round(self.cycles_per_byte, 3)
+        return d
+
+
+@dataclass
+class AsconPerfStats:
+    """Latency histogram of the ops of a (AD size, DI size, delay) class."""
+
+    hist: Counter = field(default_factory=Counter)
+    in_stall_cycles: int = 0
+    apb_transfers: int = 0
+
+    def add(self, op: AsconOpPerf):
+        self.hist[op.latency] += 1
+        self.in_stall_cycles += op.in_stall_cycles
+        self.apb_transfers += op.apb_transfers
+
+    @property
+    def count(self) -> int:
+        return sum(self.hist.values())
+
+    @property
+    def mean(self) -> float:
+        return sum(k * n for k, n in self.hist.items()) / self.count
+
+
+class AsconCorePerfMonitor(uvm_subscriber):
+    """Passive latency and throughput monitor of the Ascon core.
+
+    The cycles are derived from the simulation time of the handshake edges, no
+    coroutine runs every cycle. The APB transfers are received from the APB
+    monitor on the analysis export. Each op is published on `ap` once its tag
+    is valid. At the end of the run, the ops are written
+    to `<perf_path>.csv` and the ops with the per-class histograms to
+    `<perf_path>.json`.
+    """
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.cfg: AsconEnvConfig = None
+        self.ap: uvm_analysis_port = None
+        self.ops: List[AsconOpPerf] = []
+        self.stats: Dict[PerfKey, AsconPerfStats] = defaultdict(AsconPerfStats)
+        self.current: Optional[AsconOpPerf] = None
+        self.last_tag_cycle: Optional[int] = None
+        self.clk_first_edge = 0
+        self.clk_period = 1
+
+    def build_phase(self):
+        super().build_phase()
+        self.cfg = ConfigDB().get(self, "", "cfg")
+        self.ap = uvm_analysis_port("ap", self)
+
+    def cycle(self) -> int:
+        return (get_sim_time("step") - self.clk_first_edge) // self.clk_period
+
+    def write(self, item):
+        if isinstance(item, cl_apb_record) and self.current is not None:
+            self.current.apb_transfers += 1
+            self.current.apb_wait_cycles += item.wait_len
+
+    async def measure_clock(self):
+        vif = self.cfg.core_cfg.vif
+        await RisingEdge(vif.clk)
+        self.clk_first_edge = get_sim_time("step")
+        await RisingEdge(vif.clk)
+        self.clk_period = get_sim_time("step") - self.clk_first_edge
+
+    async def wait_block(self) -> Tuple[int, int]:
+        """Cycles of the data_ready_o and of the accept of the next block."""
+        vif = self.cfg.core_cfg.vif
+        ready = None
+        await ReadOnly()
+        while not vif.is_di_accepted():
+            if not vif.is_di_ready():
+                await RisingEdge(vif.ready_o)
+            else:
+                ready = self.cycle() if ready is None else ready
+                await RisingEdge(vif.valid_i)
+            await ReadOnly()
+        accept = self.cycle()
+        return accept if ready is None else ready, accept
+
+    async def watch_do(self, n_blocks: int, do_cycles: List[int]):
+        vif = self.cfg.core_cfg.vif
+        for _ in range(n_blocks):
+            await vif.wait_do_valid()
+            do_cycles.append(self.cycle())
+            await RisingEdge(vif.clk)
+
+    async def run_phase(self):
+        vif = self.cfg.core_cfg.vif
+        await self.measure_clock()
+
+        while True:
+            await RisingEdge(vif.start_i)
+            op = AsconOpPerf(
+                op_index=len(self.ops),
+                ad_size=vif.ad_size_i.value.integer,
+                di_size=vif.di_size_i.value.integer,
+                delay=vif.delay_i.value.integer,
+                decrypt=vif.decrypt_i.value.integer,
+                start_cycle=self.cycle(),
+            )
+            if self.last_tag_cycle is not None:
+                op.gap_cycles = op.start_cycle - self.last_tag_cycle
+            self.current = op
+            n_ad = math.ceil(op.ad_size / self.cfg.core_cfg.rate)
+            n_di = math.ceil(op.di_size / self.cfg.core_cfg.rate)
+            do_cycles: List[int] = []
+            do_task = cocotb.start_soon(self.watch_do(n_di, do_cycles))
+
+            accept = op.start_cycle
+            for i in range(n_ad + n_di):
+                prev_accept = accept
+                ready, accept = await self.wait_block()
+                if i == 0:
+                    op.init_cycles = ready - prev_accept
+                else:
+                    op.block_cycles += ready - prev_accept
+                op.in_stall_cycles += accept - ready
+                if i >= n_ad:
+                    op.do_cycles -= accept
+                await RisingEdge(vif.clk)
+
+            await do_task
+            op.do_cycles += sum(do_cycles)
+            await vif.wait_tag_valid()
+            tag = self.cycle()
+            if n_ad + n_di == 0:
+                op.init_cycles = tag - op.start_cycle
+            else:
+                op.final_cycles = tag - accept
+            op.latency = tag - op.start_cycle
+            self.last_tag_cycle = tag
+            self.current = None
+            self.ops.append(op)
+            self.stats[op.key].add(op)
+            self.logger.debug(
+                "[**] op #%d: %d cycles, %.2f cycles/byte",
+                op.op_index,
+                op.latency,
+                op.cycles_per_byte,
+            )
+            self.ap.write(op)
+            await RisingEdge(vif.clk)
+
+    def summary(self) -> dict:
+        latency = sum(op.latency for op in self.ops)
+        n_bytes = sum(op.ad_size + op.di_size for op in self.ops)
+        return {
+            "ops": len(self.ops),
+            "cycles": latency,
+            "bytes": n_bytes,
+            "cycles_per_byte": round(latency / max(1, n_bytes), 3),
+            "in_stall_cycles": sum(op.in_stall_cycles for op in self.ops),
+            "gap_cycles": sum(op.gap_cycles or 0 for op in self.ops),
+            "apb_transfers": sum(op.apb_transfers for op in self.ops),
+            "apb_wait_cycles": sum(op.apb_wait_cycles for op in self.ops),
+        }
+
+    def export(self):
+        fields = [f.name for f in dataclasses.fields(AsconOpPerf)]
+        with open(f"{self.cfg.perf_path}.csv", "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields + ["cycles_per_byte"])
+            writer.writeheader()
+            for op in self.ops:
+                writer.writerow(op.to_dict())
+
+        classes = [
+            {
+                "ad_size": ad_size,
+                "di_size": di_size,
+                "delay": delay,
+                "count": stats.count,
+                "latency_min": min(stats.hist),
+                "latency_mean": round(stats.mean, 3),
+                "latency_max": max(stats.hist),
+                "latency_hist": {str(k): n for k, n in sorted(stats.hist.items())},
+                "in_stall_cycles": stats.in_stall_cycles,
+                "apb_transfers": stats.apb_transfers,
+            }
+            for (ad_size, di_size, delay), stats in sorted(self.stats.items())
+        ]
+        with open(f"{self.cfg.perf_path}.json", "w") as f:
+            json.dump(
+                {
+                    "summary": self.summary(),
+                    "classes": classes,
+                    "ops": [op.to_dict() for op in self.ops],
+                },
+                f,
+                indent=1,
+            )
+
+    def report_phase(self):
+        summary = self.summary()
+        self.logger.info(
+            f"[**] Perf: {summary['ops']} ops, {summary['cycles']} cycles, "
+            f"{summary['cycles_per_byte']} cycles/byte, "
+            f"{summary['in_stall_cycles']} input stall cycles, "
+            f"{summary['apb_transfers']} APB transfers"
+        )
+        if self.cfg.perf_path:
+            self.export()
+            self.logger.info(f"[OK] Perf written to {self.cfg.perf_path}.csv/.json")
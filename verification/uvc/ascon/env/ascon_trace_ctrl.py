@@ -0,0 +1,73 @@
+from typing import Set
+
+import cocotb
+from cocotb.triggers import ClockCycles
+from pyuvm import ConfigDB, uvm_subscriber
+
+from ..agents.core.core_seq_item import AsconCoreResultRecord
+from .ascon_env_cfg import AsconEnvConfig
+
+
+class AsconTraceController(uvm_subscriber):
+    """Dump the waveforms in windows around the selected ops.
+
+    The dump is written by the ascon_trace_ctrl HDL module, off until its
+    trace_on variable is set. The window of the op of index n, in the order of
+    the results, opens at the result of the op n - 1 (at the start of the run
+    for the first op), so it holds the APB transfers programming the op, and
+    closes `trace_window` cycles after its result. The consecutive windows are
+    merged. The replay of a failing op is traced the same way.
+    """
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.cfg: AsconEnvConfig = None
+        self.ops: Set[int] = set()
+        self.n_results = 0
+        self.n_windows = 0
+        self.is_on = False
+        # Incremented to cancel the pending close of a window
+        self.generation = 0
+
+    def build_phase(self):
+        super().build_phase()
+        self.cfg = ConfigDB().get(self, "", "cfg")
+        self.ops = set(self.cfg.trace_ops)
+
+    def start_of_simulation_phase(self):
+        if 0 in self.ops:
+            self.open("op #0")
+
+    def set_trace(self, on: bool):
+        self.cfg.trace_ctrl.trace_on.value = int(on)
+        self.is_on = on
+
+    def open(self, reason: str):
+        self.generation += 1
+        if not self.is_on:
+            self.set_trace(True)
+            self.n_windows += 1
+            self.logger.info(f"[..] Trace {reason}.")
+
+    async def close(self):
+        """Close the window after `trace_window` cycles, unless reopened."""
+        generation = self.generation
+        await ClockCycles(self.cfg.core_cfg.vif.clk, self.cfg.trace_window)
+        if generation == self.generation and self.is_on:
+            self.set_trace(False)
+            self.logger.info("[OK] Trace window closed.")
+
+    def write(self, tt):
+        assert isinstance(tt, AsconCoreResultRecord)
+        index = self.n_results
+        self.n_results += 1
+        if index + 1 in self.ops:
+            self.open(f"op #{index + 1}")
+        elif index in self.ops:
+            cocotb.start_soon(self.close())
+
+    def report_phase(self):
+        self.logger.info(
+            f"[**] Trace: {self.n_windows} window(s) dumped, "
+            f"{len(self.ops)} op(s) selected"
+        )
@@ -0,0 +1,88 @@
+from cocotb.utils import get_sim_time
+from pyuvm import ConfigDB, uvm_subscriber
+
+from ..agents.core.core_seq_item import AsconCoreOpRecord, AsconCoreResultRecord
+from ..agents.round.round_seq_item import AsconRoundRecord
+from ..utils.ascon_txdb import (
+    STATE_LEN,
+    AsconTxDB,
+    AsconTxOp,
+    AsconTxResult,
+    AsconTxRound,
+)
+from .ascon_env_cfg import AsconEnvConfig
+
+
+class AsconTxRecorder(uvm_subscriber):
+    """Record the op, result and round items in an AsconTxDB.
+
+    The results and rounds are attached to their op by order: the n-th result
+    closes the n-th op, and the rounds seen before it belong to the same op.
+    The database is committed at each result.
+    """
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.cfg: AsconEnvConfig = None
+        self.db: AsconTxDB = None
+        self.n_ops = 0
+        self.n_results = 0
+
+    def build_phase(self):
+        super().build_phase()
+        self.cfg = ConfigDB().get(self, "", "cfg")
+
+    def start_of_simulation_phase(self):
+        self.db = AsconTxDB(self.cfg.txdb_path)
+        self.db.clear()
+
+    def to_bytes(self, value: int, length: int) -> bytes:
+        return int.to_bytes(value, length=length, byteorder=self.cfg.core_cfg.byteorder)
+
+    def write(self, item):
+        time_ns = get_sim_time("ns")
+        if isinstance(item, AsconCoreOpRecord):
+            op = AsconTxOp(
+                self.n_ops,
+                item.get_transaction_id(),
+                item.get_name(),
+                time_ns,
+                item.delay,
+                item.decrypt,
+                self.to_bytes(item.key, 16),
+                self.to_bytes(item.nonce, 16),
+                self.to_bytes(item.ad, item.ad_size),
+                self.to_bytes(item.di, item.di_size),
+            )
+            self.db.add_op(op)
+            self.n_ops += 1
+        elif isinstance(item, AsconCoreResultRecord):
+            result = AsconTxResult(
+                self.n_results,
+                item.get_transaction_id(),
+                item.get_name(),
+                time_ns,
+                self.to_bytes(item.do, item.do_size),
+                self.to_bytes(item.tag, 16),
+            )
+            self.db.add_result(result)
+            self.n_results += 1
+            self.db.commit()
+        elif isinstance(item, AsconRoundRecord):
+            rnd = AsconTxRound(
+                self.n_results,
+                item.get_transaction_id(),
+                time_ns,
+                item.phase_name,
+                item.round,
+                self.to_bytes(item.add_state, STATE_LEN),
+                self.to_bytes(item.sub_state, STATE_LEN),
+                self.to_bytes(item.diff_state, STATE_LEN),
+            )
+            self.db.add_round(rnd)
+
+    def final_phase(self):
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+            self.logger.info(f"[OK] {self.n_ops} ops recorded in {self.cfg.txdb_path}")
@@ -0,0 +1,73 @@
+from typing import List
+
+from pyuvm import ConfigDB, uvm_subscriber
+
+from ..utils.ascon_cycle_model import AsconCtrlCycleModel
+from .ascon_env_cfg import AsconEnvConfig
+from .ascon_perf_monitor import AsconOpPerf
+
+CYCLE_FIELDS = ("init_cycles", "block_cycles", "do_cycles", "final_cycles")
+
+
+class LatencyScoreboard(uvm_subscriber):
+    """Compare the cycles measured by AsconCorePerfMonitor to the cycle model.
+
+    The stalls of the testbench are excluded from the comparison. An op slower
+    than predicted is a failure, reported in check_phase. An op faster than
+    predicted is a warning: the model no longer matches ascon_ctrl.
+    """
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.cfg: AsconEnvConfig = None
+        self.model: AsconCtrlCycleModel = None
+        self.failures: List[AsconOpPerf] = []
+        self.n_faster = 0
+
+    def build_phase(self):
+        super().build_phase()
+        self.cfg = ConfigDB().get(self, "", "cfg")
+        self.model = AsconCtrlCycleModel(rate=self.cfg.core_cfg.rate)
+
+    def write(self, op: AsconOpPerf):
+        assert isinstance(op, AsconOpPerf)
+        pred = self.model.predict(op.ad_size, op.di_size, op.delay)
+        measured = (op.init_cycles, op.block_cycles, op.do_cycles, op.final_cycles)
+        predicted = (
+            pred.init_cycles,
+            sum(pred.block_cycles),
+            pred.do_cycles,
+            pred.final_cycles,
+        )
+        if measured == predicted:
+            self.logger.debug("[OK] Latency of op #%d.", op.op_index)
+            return
+
+        diffs = [
+            f"+ {name:>12}: {m} (predicted {p})"
+            for name, m, p in zip(CYCLE_FIELDS, measured, predicted)
+            if m != p
+        ]
+        msg = (
+            f"op #{op.op_index} (ad_size={op.ad_size}, di_size={op.di_size}, "
+            f"delay={op.delay}), {op.latency - op.in_stall_cycles} cycles "
+            f"without stalls, predicted {pred.latency}.\n" + "\n".join(diffs)
+        )
+        if any(m > p for m, p in zip(measured, predicted)):
+            self.logger.error(f"FAILED: {msg}")
+            self.failures.append(op)
+        else:
+            self.logger.warning(f"Faster than the cycle model: {msg}")
+            self.n_faster += 1
+
+    def report_phase(self):
+        self.logger.info(
+            f"[**] Latency: {len(self.failures)} ops slower, "
+            f"{self.n_faster} ops faster than the cycle model"
+        )
+
+    def check_phase(self):
+        assert not self.failures, (
+            f"FAILED: {len(self.failures)} op(s) slower than the cycle model, "
+            f"first: op #{self.failures[0].op_index}"
+        )
@@ -1,8 +1,8 @@
 from pyuvm import ConfigDB, uvm_subscriber, uvm_tlm_analysis_fifo
 
 from ..agents.core.core_agent_cfg import AsconCoreAgentConfig
-from ..agents.core.core_seq_item import AsconCoreOpItem, AsconCoreResultItem
-from ..agents.round.round_seq_item import AsconRoundItem
+from ..agents.core.core_seq_item import AsconCoreOpRecord, AsconCoreResultRecord
+from ..agents.round.round_seq_item import AsconRoundRecord
 from ..utils.ascon_model import AsconModel
 
 
@@ -12,21 +12,34 @@ class RoundScoreboard(uvm_subscriber):
         self.cfg: AsconCoreAgentConfig = None
         self.op_queue: uvm_tlm_analysis_fifo = None
         self.round_queue: uvm_tlm_analysis_fifo = None
+        self.enabled = True
 
     def build_phase(self):
         self.cfg = ConfigDB().get(self, "", "cfg")
         self.op_queue = uvm_tlm_analysis_fifo("op_queue", self)
         self.round_queue = uvm_tlm_analysis_fifo("state_queue", self)
 
+    @staticmethod
+    def first_divergent_layer(
+        s_tt: AsconRoundRecord, s_tt_exp: AsconRoundRecord
+    ) -> str:
+        for layer in ("add_state", "sub_state", "diff_state"):
+            if getattr(s_tt, layer) != getattr(s_tt_exp, layer):
+                return layer
+        return "round"
+
     def write(self, tt):
-        assert isinstance(tt, AsconCoreResultItem)
-        self.logger.info(f"[..] Check {tt!r}.")
-        self.logger.debug(f"[<=] {tt!r}.")
+        assert isinstance(tt, AsconCoreResultRecord)
+        if not self.enabled:
+            self.op_queue.try_get()
+            return
+        self.logger.info("[..] Check %r.", tt)
+        self.logger.debug("[<=] %r.", tt)
 
         available_op, op = self.op_queue.try_get()
         assert available_op, f"FAILED: {tt!r}, missing op."
-        assert isinstance(op, AsconCoreOpItem)
-        self.logger.debug(f"[<=] {op!r}.")
+        assert isinstance(op, AsconCoreOpRecord)
+        self.logger.debug("[<=] %r.", op)
 
         # Compute expected result
         key = int.to_bytes(op.key, length=16, byteorder=self.cfg.byteorder)
@@ -50,31 +63,31 @@ class RoundScoreboard(uvm_subscriber):
                 f"+ index={r.index}\n",
                 f"+ round={r.round}",
             )
-            self.logger.info(f"[..] Check {s_tt!r}.")
-            self.logger.debug(f"[<=] {s_tt!r}")
-            assert isinstance(s_tt, AsconRoundItem)
+            self.logger.info("[..] Check %r.", s_tt)
+            self.logger.debug("[<=] %r", s_tt)
+            assert isinstance(s_tt, AsconRoundRecord)
             s_tt_exp = s_tt.clone()
             s_tt_exp.round = r.round
             s_tt_exp.add_state = r.add_state
             s_tt_exp.sub_state = r.sub_state
             s_tt_exp.diff_state = r.diff_state
-            if s_tt_prev is not None:
-                assert s_tt == s_tt_exp, (
-                    f"FAILED: {s_tt!r}, state != exp_state.\n",
-                    "+ where:\n",
-                    f"+     state: {s_tt!s}\n",
-                    f"+ exp_state: {s_tt_exp!s}\n",
-                    f"+      diff: {s_tt ^ s_tt_exp!s}\n",
-                    f"+ prev_diff: {s_tt_prev ^ s_tt!s}",
-                )
-            else:
-                assert s_tt == s_tt_exp, (
+            if s_tt != s_tt_exp:
+                layer = self.first_divergent_layer(s_tt, s_tt_exp)
+                msg = [
                     f"FAILED: {s_tt!r}, state != exp_state.\n",
+                    "+ first divergence:\n",
+                    f"+     op: {op!s}\n",
+                    f"+  index: {r.index}\n",
+                    f"+  round: {r.round}\n",
+                    f"+  layer: {layer}\n",
                     "+ where:\n",
                     f"+     state: {s_tt!s}\n",
                     f"+ exp_state: {s_tt_exp!s}\n",
-                    f"+      diff: {s_tt ^ s_tt_exp!s}\n",
-                )
-            self.logger.info(f"[OK] Check {s_tt!r}.")
+                    f"+      diff: {s_tt ^ s_tt_exp!s}",
+                ]
+                if s_tt_prev is not None:
+                    msg.append(f"\n+ prev_diff: {s_tt_prev ^ s_tt!s}")
+                assert False, "".join(msg)
+            self.logger.info("[OK] Check %r.", s_tt)
             s_tt_prev = s_tt
-        self.logger.info(f"[OK] Check {tt!r}.")
+        self.logger.info("[OK] Check %r.", tt)
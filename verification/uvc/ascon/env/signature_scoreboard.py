@@ -0,0 +1,41 @@
+from typing import Optional
+
+from pyuvm import uvm_tlm_analysis_fifo
+
+from ..agents.core.core_seq_item import AsconCoreOpRecord
+from ..agents.round.round_seq_item import AsconRoundSignatureRecord
+from ..utils.ascon_model import AsconModel
+from .result_scoreboard import ResultScoreboard
+
+
+class SignatureScoreboard(ResultScoreboard):
+    """Result scoreboard also checking the round signature of each permutation.
+
+    A signature mismatch is a failure of the op like a result mismatch: with
+    record_failures, the op is recorded for the full round replay.
+    """
+
+    def build_phase(self):
+        super().build_phase()
+        self.signature_queue = uvm_tlm_analysis_fifo("signature_queue", self)
+
+    def check_model(self, op: AsconCoreOpRecord, model: AsconModel) -> Optional[str]:
+        error = None
+        # All the signatures of the op are read, to stay in step with the next op
+        for index, sig_exp in enumerate(model.get_signatures()):
+            available, s_tt = self.signature_queue.try_get()
+            assert available, (
+                f"FAILED: {op!r}, missing signature.\n"
+                f"+ permutation={index}"
+            )
+            assert isinstance(s_tt, AsconRoundSignatureRecord)
+            self.logger.debug("[<=] %r", s_tt)
+            if error is None and s_tt.signature != sig_exp:
+                error = (
+                    f"FAILED: {op!r}, signature != exp_signature.\n"
+                    f"+ where:\n"
+                    f"+   permutation: {index}\n"
+                    f"+     signature: 0x{s_tt.signature:016x}\n"
+                    f"+ exp_signature: 0x{sig_exp:016x}"
+                )
+        return error
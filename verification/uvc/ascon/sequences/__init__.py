@@ -1,6 +1,10 @@
 from .ascon_base_seq import (
+    AsconCoverageClosureSeq,
     AsconKATFullEncSeq,
     AsconRandEncSeq,
+    AsconRandOpSeq,
     AsconRefEncSeq,
+    AsconReplaySeq,
     AsconSingleEncSeq,
+    AsconStimulusSeq,
 )
@@ -1,7 +1,20 @@
+import random
+from typing import Callable, Optional
+
+import numpy as np
 import vsc
 from pyuvm import uvm_sequence
+from uvc.utils import PreRandomizer, fast_randomize
 
-from ..agents.core.core_seq_item import AsconCoreOpItem
+from ..agents.core.core_seq_item import AsconCoreOpItem, AsconCoreOpRecord
+from ..utils.ascon_bins import (
+    AsconDelayClass,
+    AsconSizeClass,
+    AsconStream,
+    delay_class,
+    size_class,
+)
+from ..utils.ascon_stimulus import AsconStimulusFile
 
 
 @vsc.randobj
@@ -12,6 +25,8 @@ class AsconSingleEncSeq(uvm_sequence):
         self.di = b""
         self.key = b""
         self.nonce = b""
+        self.delay: Optional[int] = None
+        self.decrypt = 0
         self.byteorder = "little"
 
     async def body(self):
@@ -19,11 +34,14 @@ class AsconSingleEncSeq(uvm_sequence):
         item = item_cls.create(f"{self.get_name()}.op_item")
         assert isinstance(item, item_cls)
         await self.start_item(item)
-        with item.randomize_with() as it:
-            assert isinstance(it, item_cls)
-            it.key == int.from_bytes(self.key, byteorder=self.byteorder)
-            it.nonce == int.from_bytes(self.nonce, byteorder=self.byteorder)
-        item.decrypt = 0
+        fast_randomize(
+            item,
+            key=int.from_bytes(self.key, byteorder=self.byteorder),
+            nonce=int.from_bytes(self.nonce, byteorder=self.byteorder),
+        )
+        if self.delay is not None:
+            item.delay = self.delay
+        item.decrypt = self.decrypt
         item.ad_size = len(self.ad)
         item.di_size = len(self.di)
         item.ad = int.from_bytes(self.ad, byteorder=self.byteorder)
@@ -38,13 +56,18 @@ class AsconRandEncSeq(uvm_sequence):
         self.di = vsc.rand_bit_t(128)
         self.di_size = 16
         self.byteorder = "little"
+        # Pre-solved values of the op item fields, fast_randomize() otherwise
+        self.prerand: Optional[PreRandomizer] = None
 
     async def body(self):
         item_cls = AsconCoreOpItem
         item = item_cls.create(f"{self.get_name()}.op_item")
         assert isinstance(item, item_cls)
         await self.start_item(item)
-        item.randomize()
+        if self.prerand is not None:
+            self.prerand.apply(item)
+        else:
+            fast_randomize(item)
         item.decrypt = 0
         item.ad_size = 0
         item.di_size = self.di_size
@@ -53,6 +76,124 @@ class AsconRandEncSeq(uvm_sequence):
         await self.finish_item(item)
 
 
+@vsc.randobj
+class AsconRandOpSeq(uvm_sequence):
+    """Op of random direction, delay, and AD and DI sizes."""
+
+    max_size = 48
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.decrypt = vsc.rand_bit_t(1)
+        self.delay = vsc.rand_bit_t(4)
+        self.ad_size = vsc.rand_bit_t(8)
+        self.di_size = vsc.rand_bit_t(8)
+        self.byteorder = "little"
+        # Pre-solved values of the op item fields, fast_randomize() otherwise
+        self.prerand: Optional[PreRandomizer] = None
+
+    @vsc.constraint
+    def c_size(self):
+        self.ad_size <= self.max_size
+        self.di_size <= self.max_size
+
+    async def body(self):
+        item_cls = AsconCoreOpItem
+        item = item_cls.create(f"{self.get_name()}.op_item")
+        assert isinstance(item, item_cls)
+        await self.start_item(item)
+        delay = self.delay
+        if self.prerand is not None:
+            self.prerand.apply(item)
+            item.delay = delay
+        else:
+            fast_randomize(item, delay=delay)
+        item.decrypt = self.decrypt
+        item.ad_size = self.ad_size
+        item.di_size = self.di_size
+        item.ad = random.getrandbits(8 * self.ad_size)
+        item.di = random.getrandbits(8 * self.di_size)
+        await self.finish_item(item)
+
+
+class AsconCoverageClosureSeq(uvm_sequence):
+    """Random ops steered toward the unhit bins of a coverage collector.
+
+    Each op targets an unhit (AD size, DI size, direction, delay) class, with
+    sizes picked among the ones hitting new padding indexes. The sequence stops
+    when the goal metrics reach `goal` percent, or after `stall_limit` ops
+    adding no new bin.
+
+    The test sets `coverage` to the AsconCoverage of the env; the sequence only
+    reads its hit arrays, closure() and n_hit_bins().
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.coverage = None
+        self.goal = 100.0
+        self.goal_metrics = ("op", "padding")
+        self.stall_limit = 50
+        self.max_ops = 10_000
+        self.n_ops = 0
+        self.goal_met = False
+        self.prerand: Optional[PreRandomizer] = None
+
+    def pick_size(self, target: AsconSizeClass, stream: AsconStream) -> int:
+        cov = self.coverage
+        sizes = [
+            s
+            for s in range(AsconRandOpSeq.max_size + 1)
+            if size_class(s, cov.cfg.rate) == target
+        ]
+        new_pad = [
+            s
+            for s in sizes
+            if (s or stream == AsconStream.DI)
+            and not cov.pad_hits[stream, s % cov.cfg.rate]
+        ]
+        return random.choice(new_pad or sizes)
+
+    def pick_delay(self, target: AsconDelayClass) -> int:
+        delays = [d for d in range(16) if delay_class(d) == target]
+        return random.choice(delays)
+
+    def is_goal_met(self) -> bool:
+        closure = self.coverage.closure()
+        return all(closure[m] >= self.goal for m in self.goal_metrics)
+
+    async def body(self):
+        cov = self.coverage
+        stall = 0
+        while self.n_ops < self.max_ops and stall < self.stall_limit:
+            self.goal_met = self.is_goal_met()
+            if self.goal_met:
+                break
+
+            unhit = np.argwhere(cov.op_hits == 0)
+            if len(unhit):
+                target = unhit[random.randrange(len(unhit))]
+            else:
+                target = [random.randrange(n) for n in cov.op_hits.shape]
+            ad_class, di_class, decrypt, delay_idx = (int(t) for t in target)
+
+            seq_cls = AsconRandOpSeq
+            seq = seq_cls.create(f"{self.get_name()}.rand_op_seq({self.n_ops})")
+            assert isinstance(seq, seq_cls)
+            ad_size = self.pick_size(AsconSizeClass(ad_class), AsconStream.AD)
+            di_size = self.pick_size(AsconSizeClass(di_class), AsconStream.DI)
+            delay = self.pick_delay(AsconDelayClass(delay_idx))
+            fast_randomize(
+                seq, ad_size=ad_size, di_size=di_size, decrypt=decrypt, delay=delay
+            )
+            seq.prerand = self.prerand
+
+            n_hit_bins = cov.n_hit_bins()
+            await seq.start(self.sequencer)
+            self.n_ops += 1
+            stall = 0 if cov.n_hit_bins() > n_hit_bins else stall + 1
+
+
 @vsc.randobj
 class AsconRefEncSeq(uvm_sequence):
     ref = bytes(range(32))
@@ -70,11 +211,12 @@ class AsconRefEncSeq(uvm_sequence):
         item = item_cls.create(f"{self.get_name()}.op_item")
         assert isinstance(item, item_cls)
         await self.start_item(item)
-        with item.randomize_with() as it:
-            assert isinstance(it, item_cls)
-            it.delay == 0
-            it.key == int.from_bytes(self.key, byteorder=self.byteorder)
-            it.nonce == int.from_bytes(self.nonce, byteorder=self.byteorder)
+        fast_randomize(
+            item,
+            delay=0,
+            key=int.from_bytes(self.key, byteorder=self.byteorder),
+            nonce=int.from_bytes(self.nonce, byteorder=self.byteorder),
+        )
         item.decrypt = 0
         item.ad_size = self.ad_size
         item.di_size = self.di_size
@@ -99,3 +241,55 @@ class AsconKATFullEncSeq(uvm_sequence):
                 seq.di_size = di_size
                 seq.byteorder = self.byteorder
                 await seq.start(self.sequencer)
+
+
+class AsconReplaySeq(uvm_sequence):
+    """Replay a previously recorded op."""
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.op: AsconCoreOpRecord = None
+
+    async def body(self):
+        item = self.op.to_item(f"{self.get_name()}.op_item")
+        assert isinstance(item, AsconCoreOpItem)
+        await self.start_item(item)
+        await self.finish_item(item)
+
+
+class AsconStimulusSeq(uvm_sequence):
+    """Run the ops of a stimulus file, read one at a time.
+
+    The ops whose index is rejected by `select` are skipped. The expected
+    results of the file, if any, are checked by the bridge sequence in place
+    of a reference model run.
+    """
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.stimulus: AsconStimulusFile = None
+        self.select: Optional[Callable[[int], bool]] = None
+        self.byteorder = "little"
+        self.n_ops = 0
+
+    async def body(self):
+        item_cls = AsconCoreOpItem
+        for index in range(len(self.stimulus)):
+            if self.select is not None and not self.select(index):
+                continue
+            op = self.stimulus[index]
+            item = item_cls.create(f"{self.get_name()}.op_item({index})")
+            assert isinstance(item, item_cls)
+            await self.start_item(item)
+            item.delay = op.delay
+            item.decrypt = op.decrypt
+            item.key = int.from_bytes(op.key, byteorder=self.byteorder)
+            item.nonce = int.from_bytes(op.nonce, byteorder=self.byteorder)
+            item.ad_size = len(op.ad)
+            item.di_size = len(op.di)
+            item.ad = int.from_bytes(op.ad, byteorder=self.byteorder)
+            item.di = int.from_bytes(op.di, byteorder=self.byteorder)
+            item.exp_do = op.exp_do
+            item.exp_tag = op.exp_tag
+            await self.finish_item(item)
+            self.n_ops += 1
@@ -0,0 +1,38 @@
+"""Bin classes of the ops, shared by the coverage and the closure sequence"""
+
+from enum import IntEnum
+
+
+class AsconSizeClass(IntEnum):
+    EMPTY = 0
+    PARTIAL = 1
+    FULL = 2
+    MULTI_PARTIAL = 3
+    MULTI_FULL = 4
+
+
+class AsconDelayClass(IntEnum):
+    ZERO = 0
+    ONE = 1
+    SHORT = 2
+    LONG = 3
+
+
+class AsconStream(IntEnum):
+    AD = 0
+    DI = 1
+
+
+def size_class(size: int, rate: int) -> AsconSizeClass:
+    if size == 0:
+        return AsconSizeClass.EMPTY
+    partial = size % rate != 0
+    if size <= rate:
+        return AsconSizeClass.PARTIAL if partial else AsconSizeClass.FULL
+    return AsconSizeClass.MULTI_PARTIAL if partial else AsconSizeClass.MULTI_FULL
+
+
+def delay_class(delay: int) -> AsconDelayClass:
+    if delay < 2:
+        return AsconDelayClass(delay)
+    return AsconDelayClass.SHORT if delay < 8 else AsconDelayClass.LONG
@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class AsconCyclePrediction:
+    """Cycles of the DUT for an op, excluding the stalls of the testbench.
+
+    The fields match the measures of AsconOpPerf: the start to the first
+    data_ready_o (to tag_valid_o with no block), the accept of each block to
+    the data_ready_o of the next one, the accept of each DI block to its
+    data_valid_o, and the last accept to tag_valid_o.
+    """
+
+    init_cycles: int
+    block_cycles: List[int] = field(default_factory=list)
+    do_cycles: int = 0
+    final_cycles: int = 0
+
+    @property
+    def latency(self) -> int:
+        """Start to tag_valid_o with a testbench never stalling the core."""
+        return self.init_cycles + sum(self.block_cycles) + self.final_cycles
+
+
+class AsconCtrlCycleModel:
+    """Analytical cycle model of the ascon_ctrl FSM.
+
+    A permutation of R rounds takes R cycles (Start, R - 2 Mid, End), and the
+    FSM moves to the next wait state on the following edge:
+    - Start, then Delay for `delay + 1` cycles, then the initialization:
+      data_ready_o rises `3 + delay + ROUND_A` cycles after start_i.
+    - An AD or DI block accepted in a wait state: the next wait state is
+      reached `1 + ROUND_B` cycles later. An AD whose size is a multiple of
+      the rate ends with a padding-only block processed without input (the
+      ADLastNoWait state), which adds `1 + ROUND_B` cycles.
+    - The finalization: Done, i.e. tag_valid_o, comes `1 + ROUND_A` cycles
+      after the accept of the last partial DI block (FinalWait), or after the
+      FinalNoWait state when the DI size is a multiple of the rate.
+    - data_valid_o is registered: each DO comes 2 cycles after its accept.
+    """
+
+    DO_CYCLES = 2
+
+    def __init__(self, rate: int = 16, round_a: int = 12, round_b: int = 8):
+        self.rate = rate
+        self.round_a = round_a
+        self.round_b = round_b
+
+    def predict(self, ad_size: int, di_size: int, delay: int) -> AsconCyclePrediction:
+        n_ad_full, ad_pad = divmod(ad_size, self.rate)
+        n_di_full, di_pad = divmod(di_size, self.rate)
+        n_ad = n_ad_full + (ad_pad > 0)
+        n_di = n_di_full + (di_pad > 0)
+        block = 1 + self.round_b
+        final = 1 + self.round_a
+        # Padding-only AD block, after the last full AD block
+        ad_pad_block = block if n_ad_full and not ad_pad else 0
+
+        init = 3 + delay + self.round_a
+        if n_ad + n_di == 0:
+            # InitEndSep, then FinalNoWait
+            return AsconCyclePrediction(init_cycles=init + final)
+
+        pred = AsconCyclePrediction(init_cycles=init, do_cycles=self.DO_CYCLES * n_di)
+        for i in range(1, n_ad + n_di):
+            pred.block_cycles.append(block + (ad_pad_block if i == n_ad else 0))
+        if di_pad:
+            pred.final_cycles = final
+        else:
+            # Last block of DI or AD, then FinalNoWait
+            pred.final_cycles = block + (ad_pad_block if n_di == 0 else 0) + final
+        return pred
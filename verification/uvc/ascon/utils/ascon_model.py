@@ -3,6 +3,22 @@ from typing import List
 
 from . import ascon
 
+MASK64 = 0xFFFFFFFFFFFFFFFF
+LAST_ROUND = 15
+
+
+def _rotl64(value: int, n: int) -> int:
+    n %= 64
+    return ((value << n) | (value >> (64 - n))) & MASK64
+
+
+def _fold_state(state: int) -> int:
+    """Fold a 320-bit state into 64 bits, as in ascon_round_signature.sv."""
+    folded = 0
+    for i in range(5):
+        folded ^= _rotl64((state >> (64 * i)) & MASK64, 13 * i)
+    return folded
+
 
 @dataclass
 class AsconRoundRecord:
@@ -12,6 +28,15 @@ class AsconRoundRecord:
     sub_state: int
     diff_state: int
 
+    def fold_into(self, signature: int) -> int:
+        return (
+            _rotl64(signature, 1)
+            ^ _fold_state(self.add_state)
+            ^ _rotl64(_fold_state(self.sub_state), 21)
+            ^ _rotl64(_fold_state(self.diff_state), 42)
+            ^ self.round
+        )
+
 
 class AsconModel:
     def __init__(self):
@@ -115,6 +140,16 @@ class AsconModel:
     def get_rounds(self) -> List[AsconRoundRecord]:
         return self._rounds.copy()
 
+    def get_signatures(self) -> List[int]:
+        """Running round signature at the end of each permutation."""
+        signatures = []
+        signature = 0
+        for r in self._rounds:
+            signature = r.fold_into(signature)
+            if r.round == LAST_ROUND:
+                signatures.append(signature)
+        return signatures
+
     def __enter__(self):
         if self._backup is None:
             self._backup = ascon.ascon_permutation
@@ -0,0 +1,178 @@
+import mmap
+import shutil
+import struct
+import tempfile
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+MAGIC = b"ASTM"
+VERSION = 1
+
+# The expected DO and tag follow the AD and DI in the payload of each op
+FLAG_EXPECTED = 0x1
+
+# magic, version, flags, number of ops
+_HEADER = struct.Struct("<4sHHQ")
+
+# Fixed-size fields of the ops, one column each
+_COLUMNS = {
+    "delay": struct.Struct("<B"),
+    "decrypt": struct.Struct("<B"),
+    "ad_size": struct.Struct("<B"),
+    "di_size": struct.Struct("<B"),
+    "key": struct.Struct("<16s"),
+    "nonce": struct.Struct("<16s"),
+    # Offset of the payload of the op in the arena
+    "offset": struct.Struct("<Q"),
+}
+
+TAG_LEN = 16
+
+
+@dataclass
+class AsconStimulusOp:
+    delay: int
+    decrypt: int
+    key: bytes
+    nonce: bytes
+    ad: bytes
+    di: bytes
+    exp_do: Optional[bytes] = None
+    exp_tag: Optional[bytes] = None
+
+
+class AsconStimulusWriter:
+    """Write ops to a stimulus file, see AsconStimulusFile.
+
+    The columns are kept in memory, about 40 bytes per op, and the payloads are
+    spooled to a temporary file until close().
+    """
+
+    def __init__(self, filename, expected: bool = False):
+        self.filename = filename
+        self.flags = FLAG_EXPECTED if expected else 0
+        self.columns = {name: bytearray() for name in _COLUMNS}
+        self.arena = tempfile.TemporaryFile()
+        self.arena_size = 0
+        self.n_ops = 0
+
+    def __enter__(self) -> "AsconStimulusWriter":
+        return self
+
+    def __exit__(self, exc_type, *args):
+        if exc_type is None:
+            self.close()
+        else:
+            self.arena.close()
+
+    def add(self, op: AsconStimulusOp):
+        assert len(op.ad) <= 255 and len(op.di) <= 255, "FAILED: AD/DI too long."
+        assert len(op.key) == 16 and len(op.nonce) == 16, "FAILED: key/nonce size."
+        payload = op.ad + op.di
+        if self.flags & FLAG_EXPECTED:
+            assert op.exp_do is not None and op.exp_tag is not None, (
+                f"FAILED: op #{self.n_ops} has no expected result."
+            )
+            assert len(op.exp_do) == len(op.di) and len(op.exp_tag) == TAG_LEN
+            payload += op.exp_do + op.exp_tag
+        values = {
+            "delay": op.delay,
+            "decrypt": op.decrypt,
+            "ad_size": len(op.ad),
+            "di_size": len(op.di),
+            "key": op.key,
+            "nonce": op.nonce,
+            "offset": self.arena_size,
+        }
+        for name, fmt in _COLUMNS.items():
+            self.columns[name] += fmt.pack(values[name])
+        self.arena.write(payload)
+        self.arena_size += len(payload)
+        self.n_ops += 1
+
+    def close(self):
+        with open(self.filename, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, self.flags, self.n_ops))
+            for column in self.columns.values():
+                f.write(column)
+            self.arena.seek(0)
+            shutil.copyfileobj(self.arena, f)
+        self.arena.close()
+
+
+class AsconStimulusFile:
+    """Memory-mapped stimulus file of Ascon ops.
+
+    A fixed-size header is followed by one column per fixed-size op field
+    (delay, direction, sizes, key, nonce, payload offset), then by the payload
+    arena holding the AD, DI and, with FLAG_EXPECTED, the expected DO and tag
+    of each op. The ops are decoded on access, so reading a file of any size
+    takes constant memory. The byte strings are in the byte order of the
+    testbench, as for AsconSingleEncTest.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.flags, self.n_ops = _HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{filename}: not a stimulus file")
+        if version != VERSION:
+            raise ValueError(f"{filename}: unsupported version {version}")
+        self.column_offsets = {}
+        offset = _HEADER.size
+        for name, fmt in _COLUMNS.items():
+            self.column_offsets[name] = offset
+            offset += fmt.size * self.n_ops
+        self.arena_offset = offset
+
+    def __enter__(self) -> "AsconStimulusFile":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.mm.close()
+
+    @property
+    def has_expected(self) -> bool:
+        return bool(self.flags & FLAG_EXPECTED)
+
+    def __len__(self) -> int:
+        return self.n_ops
+
+    def field(self, name: str, index: int):
+        fmt = _COLUMNS[name]
+        return fmt.unpack_from(self.mm, self.column_offsets[name] + fmt.size * index)[0]
+
+    def __getitem__(self, index: int) -> AsconStimulusOp:
+        if not 0 <= index < self.n_ops:
+            raise IndexError(f"op #{index} not in {self.filename}")
+        ad_size = self.field("ad_size", index)
+        di_size = self.field("di_size", index)
+        pos = self.arena_offset + self.field("offset", index)
+        ad = self.mm[pos : pos + ad_size]
+        pos += ad_size
+        di = self.mm[pos : pos + di_size]
+        pos += di_size
+        exp_do = exp_tag = None
+        if self.has_expected:
+            exp_do = self.mm[pos : pos + di_size]
+            pos += di_size
+            exp_tag = self.mm[pos : pos + TAG_LEN]
+        return AsconStimulusOp(
+            self.field("delay", index),
+            self.field("decrypt", index),
+            self.field("key", index),
+            self.field("nonce", index),
+            ad,
+            di,
+            exp_do,
+            exp_tag,
+        )
+
+    def __iter__(self) -> Iterator[AsconStimulusOp]:
+        for index in range(self.n_ops):
+            yield self[index]
@@ -0,0 +1,215 @@
+import sqlite3
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+# Bumped on a schema change: the tables of an older database are recreated
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ops (
+    op_index INTEGER PRIMARY KEY,
+    tx_id INTEGER NOT NULL,
+    name TEXT,
+    time_ns REAL,
+    delay INTEGER,
+    decrypt INTEGER,
+    key BLOB,
+    nonce BLOB,
+    ad BLOB,
+    di BLOB
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ops_tx_id ON ops (tx_id);
+CREATE TABLE IF NOT EXISTS results (
+    op_index INTEGER PRIMARY KEY,
+    tx_id INTEGER NOT NULL,
+    name TEXT,
+    time_ns REAL,
+    do BLOB,
+    tag BLOB
+);
+CREATE UNIQUE INDEX IF NOT EXISTS results_tx_id ON results (tx_id);
+CREATE TABLE IF NOT EXISTS rounds (
+    op_index INTEGER NOT NULL,
+    tx_id INTEGER NOT NULL,
+    time_ns REAL,
+    phase TEXT,
+    round INTEGER,
+    add_state BLOB,
+    sub_state BLOB,
+    diff_state BLOB
+);
+CREATE UNIQUE INDEX IF NOT EXISTS rounds_tx_id ON rounds (tx_id);
+CREATE INDEX IF NOT EXISTS rounds_op_index ON rounds (op_index);
+"""
+
+STATE_LEN = 40
+
+
+@dataclass
+class AsconTxOp:
+    op_index: int
+    tx_id: int
+    name: str
+    time_ns: float
+    delay: int
+    decrypt: int
+    key: bytes
+    nonce: bytes
+    ad: bytes
+    di: bytes
+
+
+@dataclass
+class AsconTxResult:
+    op_index: int
+    tx_id: int
+    name: str
+    time_ns: float
+    do: bytes
+    tag: bytes
+
+
+@dataclass
+class AsconTxRound:
+    op_index: int
+    tx_id: int
+    time_ns: float
+    phase: str
+    round: int
+    add_state: bytes
+    sub_state: bytes
+    diff_state: bytes
+
+
+class AsconTxDB:
+    """Append-only SQLite store of the op, result and round items.
+
+    The items are keyed by the index of their op in the run, and by their
+    transaction id, the `id=0x...` field of the log lines, unique in a run
+    (see MonitorRecord), so an item is fetched by id through an index. The byte
+    strings are stored in the byte order of the testbench, so they can be fed
+    back to AsconSingleEncTest as is.
+    """
+
+    def __init__(self, filename, readonly: bool = False):
+        self.filename = filename
+        if readonly:
+            self.conn = sqlite3.connect(f"file:{filename}?mode=ro", uri=True)
+        else:
+            self.conn = sqlite3.connect(filename)
+            # Debug data: losing the last items on a crash of the host is fine
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=OFF")
+            version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                self.conn.executescript(
+                    "DROP TABLE IF EXISTS ops; DROP TABLE IF EXISTS results;"
+                    "DROP TABLE IF EXISTS rounds;"
+                )
+                self.conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "AsconTxDB":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
+
+    def commit(self):
+        self.conn.commit()
+
+    def clear(self):
+        for table in ("ops", "results", "rounds"):
+            self.conn.execute(f"DELETE FROM {table}")
+
+    def add_op(self, op: AsconTxOp):
+        self.conn.execute(
+            "INSERT INTO ops VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                op.op_index,
+                op.tx_id,
+                op.name,
+                op.time_ns,
+                op.delay,
+                op.decrypt,
+                op.key,
+                op.nonce,
+                op.ad,
+                op.di,
+            ),
+        )
+
+    def add_result(self, result: AsconTxResult):
+        self.conn.execute(
+            "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                result.op_index,
+                result.tx_id,
+                result.name,
+                result.time_ns,
+                result.do,
+                result.tag,
+            ),
+        )
+
+    def add_round(self, rnd: AsconTxRound):
+        self.conn.execute(
+            "INSERT INTO rounds VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                rnd.op_index,
+                rnd.tx_id,
+                rnd.time_ns,
+                rnd.phase,
+                rnd.round,
+                rnd.add_state,
+                rnd.sub_state,
+                rnd.diff_state,
+            ),
+        )
+
+    def find_op_index(self, tx_id: int) -> Optional[int]:
+        """Index of the op whose op, result or round item has this id.
+
+        Raises ValueError if the id matches items of several ops, e.g. in a
+        database written by an older testbench.
+        """
+        rows = self.conn.execute(
+            """
+            SELECT DISTINCT op_index FROM (
+                SELECT op_index FROM ops WHERE tx_id = :id
+                UNION ALL SELECT op_index FROM results WHERE tx_id = :id
+                UNION ALL SELECT op_index FROM rounds WHERE tx_id = :id
+            )
+            """,
+            {"id": tx_id},
+        ).fetchall()
+        if len(rows) > 1:
+            ops = ", ".join(f"#{row[0]}" for row in sorted(rows))
+            raise ValueError(f"id=0x{tx_id:08x} matches the ops {ops}")
+        return rows[0][0] if rows else None
+
+    def get_op(self, op_index: int) -> Optional[AsconTxOp]:
+        row = self.conn.execute(
+            "SELECT * FROM ops WHERE op_index = ?", (op_index,)
+        ).fetchone()
+        return AsconTxOp(*row) if row else None
+
+    def get_result(self, op_index: int) -> Optional[AsconTxResult]:
+        row = self.conn.execute(
+            "SELECT * FROM results WHERE op_index = ?", (op_index,)
+        ).fetchone()
+        return AsconTxResult(*row) if row else None
+
+    def get_rounds(self, op_index: int) -> List[AsconTxRound]:
+        rows = self.conn.execute(
+            "SELECT * FROM rounds WHERE op_index = ? ORDER BY rowid", (op_index,)
+        )
+        return [AsconTxRound(*row) for row in rows]
+
+    def iter_ops(self) -> Iterator[AsconTxOp]:
+        for row in self.conn.execute("SELECT * FROM ops ORDER BY op_index"):
+            yield AsconTxOp(*row)
@@ -0,0 +1,5 @@
+from .coverage import sample_count
+from .fast_rand import fast_randomize
+from .pool import ObjectPool, ResponseMode
+from .prerandomize import PreRandomizer
+from .record import MonitorRecord
@@ -0,0 +1,27 @@
+import vsc
+
+
+def sample_count(cg: vsc.covergroup, count: int, *args):
+    """Sample cg with args, counting the sample `count` times.
+
+    The collectors count their samples in arrays and flush them into the vsc
+    covergroups at the end of the run, one sample per hit combination. The
+    bins of the instance and type models hit by that sample are then credited
+    the remaining `count - 1` hits, so the vsc reports and the coverage
+    database hold the actual hit counts.
+    """
+    model = cg.get_model()
+    items = [
+        item
+        for group in (model, model.type_cg)
+        if group is not None
+        for item in group.coverpoint_l + group.cross_l
+    ]
+    before = [list(item.hit_l) for item in items]
+    cg.sample(*args)
+    if count == 1:
+        return
+    for item, hits in zip(items, before):
+        for i, n in enumerate(hits):
+            if item.hit_l[i] != n:
+                item.hit_l[i] += (count - 1) * (item.hit_l[i] - n)
@@ -0,0 +1,337 @@
+"""Solver-free randomization of the items with simple constraints.
+
+analyze() walks the vsc constraint model of a randobj class once and turns
+the constraints comparing a field with literals (`<`, `<=`, `>`, `>=`, `==`,
+`!=`, `in rangelist`) into per-field domains. An if/else chain or an implies
+whose conditions test a single field, and whose branches are such constraints
+on other fields, becomes a conditional rule: the condition field is drawn
+first, then the fields of the matching branch. Any other constraint couples
+its fields, and fast_randomize() then falls back to the vsc solver for the
+whole object.
+
+The values are drawn with the `random` module, seeded by cocotb from
+RANDOM_SEED. FAST_RAND=0 forces the solver.
+"""
+
+import os
+import random
+from typing import Dict, List, Optional, Tuple
+
+from vsc.model.bin_expr_type import BinExprType
+from vsc.model.constraint_block_model import ConstraintBlockModel
+from vsc.model.constraint_expr_model import ConstraintExprModel
+from vsc.model.constraint_if_else_model import ConstraintIfElseModel
+from vsc.model.constraint_implies_model import ConstraintImpliesModel
+from vsc.model.constraint_scope_model import ConstraintScopeModel
+from vsc.model.enum_field_model import EnumFieldModel
+from vsc.model.expr_bin_model import ExprBinModel
+from vsc.model.expr_fieldref_model import ExprFieldRefModel
+from vsc.model.expr_in_model import ExprInModel
+from vsc.model.expr_literal_model import ExprLiteralModel
+from vsc.model.expr_range_model import ExprRangeModel
+from vsc.model.field_composite_model import FieldCompositeModel
+from vsc.model.field_scalar_model import FieldScalarModel
+
+ENABLED = os.getenv("FAST_RAND", "1") == "1"
+
+MIRROR_OP = {
+    BinExprType.Eq: BinExprType.Eq,
+    BinExprType.Ne: BinExprType.Ne,
+    BinExprType.Lt: BinExprType.Gt,
+    BinExprType.Le: BinExprType.Ge,
+    BinExprType.Gt: BinExprType.Lt,
+    BinExprType.Ge: BinExprType.Le,
+}
+
+
+class Domain:
+    """Sorted union of disjoint inclusive intervals."""
+
+    __slots__ = ("intervals", "size")
+
+    def __init__(self, intervals: List[Tuple[int, int]]):
+        merged = []
+        for lo, hi in sorted(i for i in intervals if i[0] <= i[1]):
+            if merged and lo <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(hi, merged[-1][1]))
+            else:
+                merged.append((lo, hi))
+        self.intervals = merged
+        self.size = sum(hi - lo + 1 for lo, hi in merged)
+
+    @classmethod
+    def of_field(cls, fm: FieldScalarModel) -> "Domain":
+        if isinstance(fm, EnumFieldModel):
+            return cls([(v, v) for v in fm.enums])
+        if fm.is_signed:
+            return cls([(-(1 << (fm.width - 1)), (1 << (fm.width - 1)) - 1)])
+        return cls([(0, (1 << fm.width) - 1)])
+
+    @classmethod
+    def of_op(cls, op: BinExprType, value: int) -> Optional["Domain"]:
+        inf = 1 << 4096
+        bounds = {
+            BinExprType.Eq: [(value, value)],
+            BinExprType.Ne: [(-inf, value - 1), (value + 1, inf)],
+            BinExprType.Lt: [(-inf, value - 1)],
+            BinExprType.Le: [(-inf, value)],
+            BinExprType.Gt: [(value + 1, inf)],
+            BinExprType.Ge: [(value, inf)],
+        }.get(op)
+        return None if bounds is None else cls(bounds)
+
+    def __and__(self, other: "Domain") -> "Domain":
+        intervals = []
+        for lo, hi in self.intervals:
+            for olo, ohi in other.intervals:
+                intervals.append((max(lo, olo), min(hi, ohi)))
+        return Domain(intervals)
+
+    def __contains__(self, value: int) -> bool:
+        return any(lo <= value <= hi for lo, hi in self.intervals)
+
+    def sample(self) -> int:
+        if len(self.intervals) == 1:
+            return random.randint(*self.intervals[0])
+        r = random.randrange(self.size)
+        for lo, hi in self.intervals:
+            if r <= hi - lo:
+                return lo + r
+            r -= hi - lo + 1
+        raise AssertionError("unreachable")
+
+    def __str__(self):
+        return " | ".join(
+            f"{lo}" if lo == hi else f"[{lo}:{hi}]" for lo, hi in self.intervals
+        )
+
+
+class Rule:
+    """Conditional branches: the domains of the first branch matching `field`."""
+
+    __slots__ = ("field", "branches")
+
+    def __init__(self, field: str):
+        self.field = field
+        # (condition domain, None for else; field domains)
+        self.branches: List[Tuple[Optional[Domain], Dict[str, Domain]]] = []
+
+    def select(self, value: int) -> Dict[str, Domain]:
+        for cond, domains in self.branches:
+            if cond is None or value in cond:
+                return domains
+        return {}
+
+
+class RandPlan:
+    """Result of the analysis of a randobj class."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.domains: Dict[str, Domain] = {}
+        self.rules: List[Rule] = []
+        self.dependents: Dict[str, Rule] = {}
+        self.sub_plans: Dict[str, "RandPlan"] = {}
+        self.coupled: List[str] = []
+
+    @property
+    def is_fast(self) -> bool:
+        return not self.coupled and all(p.is_fast for p in self.sub_plans.values())
+
+    def report(self, indent: str = "") -> List[str]:
+        mode = "fast" if self.is_fast else "solver"
+        lines = [f"{indent}{self.name}: {mode}"]
+        for name, domain in self.domains.items():
+            rule = self.dependents.get(name)
+            cond = f" (if {rule.field})" if rule else ""
+            lines.append(f"{indent}  {name} in {domain}{cond}")
+        for reason in self.coupled:
+            lines.append(f"{indent}  coupled: {reason}")
+        for plan in self.sub_plans.values():
+            lines.extend(plan.report(indent + "  "))
+        return lines
+
+
+def literal(e) -> Optional[int]:
+    if isinstance(e, ExprLiteralModel):
+        return int(e.val().toInt())
+    return None
+
+
+def field_ref(e, fields: Dict[str, FieldScalarModel]) -> Optional[str]:
+    if isinstance(e, ExprFieldRefModel) and fields.get(e.fm.name) is e.fm:
+        return e.fm.name
+    return None
+
+
+def simple_expr(e, fields) -> Optional[Tuple[str, Domain]]:
+    """(field, domain) of a comparison of a rand field with literals."""
+    if isinstance(e, ExprBinModel) and e.op in MIRROR_OP:
+        name, value, op = field_ref(e.lhs, fields), literal(e.rhs), e.op
+        if name is None:
+            name, value, op = field_ref(e.rhs, fields), literal(e.lhs), MIRROR_OP[op]
+        if name is not None and value is not None:
+            return name, Domain.of_op(op, value)
+    elif isinstance(e, ExprInModel):
+        name = field_ref(e.lhs, fields)
+        intervals = []
+        for r in e.rhs.rl:
+            if isinstance(r, ExprRangeModel):
+                intervals.append((literal(r.lhs), literal(r.rhs)))
+            else:
+                intervals.append((literal(r), literal(r)))
+        if name is not None and all(None not in i for i in intervals):
+            return name, Domain(intervals)
+    return None
+
+
+def simple_scope(c, fields) -> Optional[Dict[str, Domain]]:
+    """Field domains of a scope of simple constraints."""
+    domains: Dict[str, Domain] = {}
+    constraints = c.constraint_l if isinstance(c, ConstraintScopeModel) else [c]
+    for cc in constraints:
+        if not isinstance(cc, ConstraintExprModel):
+            return None
+        simple = simple_expr(cc.e, fields)
+        if simple is None:
+            return None
+        name, domain = simple
+        domains[name] = domains[name] & domain if name in domains else domain
+    return domains
+
+
+def conditional_rule(c, fields) -> Optional[Rule]:
+    """Rule of an if/else-if/else chain or an implies on a single field."""
+    rule = None
+    while c is not None:
+        if isinstance(c, ConstraintIfElseModel):
+            cond, body, c = simple_expr(c.cond, fields), c.true_c, c.false_c
+        elif isinstance(c, ConstraintImpliesModel):
+            cond, body, c = simple_expr(c.cond, fields), c, None
+        elif rule is not None:
+            cond, body, c = (rule.field, None), c, None
+        else:
+            return None
+        domains = simple_scope(body, fields)
+        if cond is None or domains is None:
+            return None
+        rule = rule or Rule(cond[0])
+        if cond[0] != rule.field or rule.field in domains:
+            return None
+        rule.branches.append((cond[1], domains))
+    return rule
+
+
+def analyze_model(model: FieldCompositeModel, name: str) -> RandPlan:
+    plan = RandPlan(name)
+    fields: Dict[str, FieldScalarModel] = {}
+    for fm in model.field_l:
+        if isinstance(fm, FieldCompositeModel):
+            if fm.is_declared_rand:
+                plan.sub_plans[fm.name] = analyze_model(fm, fm.name)
+        elif isinstance(fm, FieldScalarModel):
+            if fm.is_declared_rand:
+                fields[fm.name] = fm
+                plan.domains[fm.name] = Domain.of_field(fm)
+        elif getattr(fm, "is_declared_rand", False):
+            plan.coupled.append(f"{fm.name}: {type(fm).__name__} field")
+
+    for block in model.constraint_model_l:
+        assert isinstance(block, ConstraintBlockModel)
+        for c in block.constraint_l:
+            where = f"{block.name}, line {c.srcinfo.lineno if c.srcinfo else '?'}"
+            simple = None
+            if isinstance(c, ConstraintExprModel):
+                simple = simple_expr(c.e, fields)
+            if simple is not None:
+                field, domain = simple
+                plan.domains[field] &= domain
+                if not plan.domains[field].size:
+                    plan.coupled.append(f"{field}: empty domain ({where})")
+                continue
+            rule = None
+            if isinstance(c, (ConstraintIfElseModel, ConstraintImpliesModel)):
+                rule = conditional_rule(c, fields)
+            if rule is None:
+                plan.coupled.append(f"{type(c).__name__} ({where})")
+            else:
+                plan.rules.append(rule)
+
+    for rule in plan.rules:
+        rule.branches = [
+            (cond if cond is None else plan.domains[rule.field] & cond, domains)
+            for cond, domains in rule.branches
+        ]
+        for _, domains in rule.branches:
+            for field, domain in domains.items():
+                other = plan.dependents.setdefault(field, rule)
+                domains[field] = plan.domains[field] & domain
+                if other is not rule or field in (r.field for r in plan.rules):
+                    plan.coupled.append(f"{field}: in several conditional rules")
+                elif not domains[field].size:
+                    plan.coupled.append(f"{field}: empty branch if {rule.field}")
+    return plan
+
+
+_plans: Dict[type, RandPlan] = {}
+
+
+def analyze(obj) -> RandPlan:
+    """Plan of the class of obj, computed on its first object."""
+    cls = type(obj)
+    plan = _plans.get(cls)
+    if plan is None:
+        plan = analyze_model(obj.get_model(), cls.__name__)
+        _plans[cls] = plan
+    return plan
+
+
+def solver_randomize(obj, pins: Dict[str, int]):
+    if not pins:
+        obj.randomize()
+        return
+    with obj.randomize_with() as it:
+        for name, value in pins.items():
+            getattr(it, name) == value
+
+
+def draw(obj, plan: RandPlan, pins: Dict[str, int]) -> bool:
+    """Set the rand fields of obj, False when the solver is needed."""
+    values = {}
+
+    def pick(name: str, domain: Domain) -> bool:
+        if name not in pins:
+            values[name] = domain.sample()
+        elif pins[name] in domain:
+            values[name] = pins[name]
+        else:
+            return False
+        return True
+
+    if not pins.keys() <= plan.domains.keys():
+        return False
+    if not all(isinstance(value, int) for value in pins.values()):
+        return False
+    for name, domain in plan.domains.items():
+        if name not in plan.dependents and not pick(name, domain):
+            return False
+    for rule in plan.rules:
+        for name, domain in rule.select(values[rule.field]).items():
+            if not pick(name, domain):
+                return False
+    for name in plan.dependents:
+        # Not constrained by the matching branch
+        if name not in values and not pick(name, plan.domains[name]):
+            return False
+    for name, value in values.items():
+        setattr(obj, name, value)
+    for name, sub_plan in plan.sub_plans.items():
+        draw(getattr(obj, name), sub_plan, {})
+    return True
+
+
+def fast_randomize(obj, **pins):
+    """randomize_with() pinning `pins`, without the solver when possible."""
+    plan = analyze(obj)
+    if not (ENABLED and plan.is_fast and draw(obj, plan, pins)):
+        solver_randomize(obj, pins)
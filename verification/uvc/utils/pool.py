@@ -0,0 +1,55 @@
+from enum import Enum
+from typing import Generic, List, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class ResponseMode(Enum):
+    """How a driver answers a request.
+
+    CLONE: item_done(req.clone()), a deep copy of the request.
+    REQUEST: item_done(req), the request updated in place is the response.
+    NONE: item_done(), for sequences which never call get_response().
+    """
+
+    CLONE = 0
+    REQUEST = 1
+    NONE = 2
+
+
+class ObjectPool(Generic[T]):
+    """Free list of factory-created objects.
+
+    acquire() returns a released object, renamed and reset with its
+    do_reset() method, or creates one through the factory when the list is
+    empty. An object must only be released once nothing refers to it anymore:
+    not the sequencer, not a pending response and not a log record.
+    """
+
+    def __init__(self, cls: Type[T], max_size: int = 64):
+        self.cls = cls
+        self.max_size = max_size
+        self.free: List[T] = []
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, name: str) -> T:
+        if self.free:
+            obj = self.free.pop()
+            obj.set_name(name)
+            obj.do_reset()
+            self.reused += 1
+        else:
+            obj = self.cls.create(name)
+            self.created += 1
+        return obj
+
+    def release(self, obj: T):
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+
+    def __str__(self):
+        return (
+            f"{self.cls.__name__} pool: {self.created} created, "
+            f"{self.reused} reused"
+        )
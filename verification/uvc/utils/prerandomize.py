@@ -0,0 +1,132 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, List, Sequence, Tuple, Union
+
+import vsc
+
+ItemSpec = Union[type, Callable[[], type]]
+
+
+def solve_batch(
+    item_spec: ItemSpec,
+    fields: Sequence[str],
+    seed: int,
+    stream: str,
+    index: int,
+    size: int,
+) -> List[Tuple[Any, ...]]:
+    """Randomize an object of the item class `size` times, in a worker."""
+    cls = item_spec if isinstance(item_spec, type) else item_spec()
+    obj = cls(f"{stream}.prerandomizer")
+    obj.set_randstate(vsc.RandState.mkFromSeed(seed, f"{stream}:{index}"))
+    batch = []
+    for _ in range(size):
+        obj.randomize()
+        batch.append(tuple(getattr(obj, field) for field in fields))
+    return batch
+
+
+class PreRandomizer:
+    """Solve the constraints of an item class in worker processes.
+
+    The workers run randomize() on their own object of the item class, so the
+    class constraints apply, and return batches of the values of `fields`.
+    apply() copies the next values to an object in the simulator, in place of
+    its randomize(). The constraints added inline by randomize_with() are not
+    seen by the workers: the callers set the constrained fields afterwards,
+    which only works for fields that no other field depends on.
+
+    Batch `i` is solved from `vsc.RandState.mkFromSeed(seed, "<name>:<i>")`
+    and the batches are consumed in order, so the values only depend on the
+    seed and the name, not on the number of workers or their timing. At most
+    `depth` batches are solved ahead. A stall is counted when the next batch is
+    not ready yet.
+
+    `item_spec` is the item class, or a picklable callable returning it, e.g.
+    `functools.partial(apb_change_width, 32, 32)` for a class created at run
+    time. The workers are spawned rather than forked from the simulator.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        item_spec: ItemSpec,
+        fields: Sequence[str],
+        seed: int,
+        workers: int = 1,
+        batch_size: int = 256,
+        depth: int = 4,
+    ):
+        self.name = name
+        self.item_spec = item_spec
+        self.fields = tuple(fields)
+        self.seed = seed
+        self.batch_size = batch_size
+        self.depth = depth
+        self.workers = workers
+        self.executor: ProcessPoolExecutor = None
+        self.pending: Deque[Future] = deque()
+        self.batch: List[Tuple[Any, ...]] = []
+        self.pos = 0
+        self.n_batches = 0
+        self.n_items = 0
+        self.stalls = 0
+
+    def start(self):
+        ctx = multiprocessing.get_context("spawn")
+        # sys.executable may be the simulator when Python is embedded
+        python_bin = os.getenv("PYGPI_PYTHON_BIN")
+        if python_bin:
+            ctx.set_executable(python_bin)
+        self.executor = ProcessPoolExecutor(self.workers, mp_context=ctx)
+        while len(self.pending) < self.depth:
+            self.submit()
+
+    def submit(self):
+        self.pending.append(
+            self.executor.submit(
+                solve_batch,
+                self.item_spec,
+                self.fields,
+                self.seed,
+                self.name,
+                self.n_batches,
+                self.batch_size,
+            )
+        )
+        self.n_batches += 1
+
+    def next_values(self) -> Tuple[Any, ...]:
+        if self.pos == len(self.batch):
+            if self.executor is None:
+                self.start()
+            future = self.pending.popleft()
+            if not future.done():
+                self.stalls += 1
+            self.batch = future.result()
+            self.pos = 0
+            self.submit()
+        values = self.batch[self.pos]
+        self.pos += 1
+        self.n_items += 1
+        return values
+
+    def apply(self, obj):
+        """Set the fields of obj to the next solved values."""
+        for field, value in zip(self.fields, self.next_values()):
+            setattr(obj, field, value)
+
+    def close(self):
+        if self.executor is not None:
+            for future in self.pending:
+                future.cancel()
+            self.executor.shutdown(wait=True)
+            self.executor = None
+
+    def __str__(self):
+        return (
+            f"{self.name} pre-randomizer: {self.n_items} items, "
+            f"{self.n_batches} batches, {self.stalls} stalls"
+        )
@@ -0,0 +1,64 @@
+import copy
+import itertools
+from typing import Optional, Type
+
+from pyuvm import uvm_sequence_item
+
+
+class MonitorRecord:
+    """Plain `__slots__` record of an observed transaction.
+
+    The monitors publish records rather than sequence items: a record is a few
+    attributes, while a sequence item carries the vsc field models, constraints
+    and the cocotb events of the sequencer handshake, none of which a passive
+    observation needs. The subclasses declare their fields in `__slots__` and
+    the sequence item class they convert to with to_item(), and call
+    `super().__init__()`.
+
+    Each record is numbered from a counter shared by all the record classes,
+    the `id=0x...` of the log lines: unlike the address of a short-lived
+    object, the id identifies the transaction for the whole run. A clone keeps
+    the id of its original.
+    """
+
+    __slots__ = ("tx_id",)
+
+    name = "record"
+    item_cls: Type[uvm_sequence_item] = None
+
+    _ids = itertools.count(1)
+
+    def __init__(self):
+        self.tx_id = next(MonitorRecord._ids)
+
+    def get_name(self) -> str:
+        return self.name
+
+    def get_transaction_id(self) -> int:
+        return self.tx_id
+
+    def fields(self):
+        return ((field, getattr(self, field)) for field in self.__slots__)
+
+    def clone(self):
+        other = copy.copy(self)
+        other.tx_id = self.tx_id
+        return other
+
+    def to_item(self, name: Optional[str] = None) -> uvm_sequence_item:
+        """Convert to a sequence item, e.g. to drive the observation again."""
+        item = self.item_cls.create(self.name if name is None else name)
+        for field, value in self.fields():
+            setattr(item, field, value)
+        return item
+
+    def __eq__(self, value) -> bool:
+        return type(value) is type(self) and all(
+            getattr(value, field) == v for field, v in self.fields()
+        )
+
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        cls_name = self.__class__.__name__
+        return f"<{cls_name}(name='{self.name}'), id=0x{self.tx_id:08x}>"